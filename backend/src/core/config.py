@@ -3,12 +3,63 @@ Configuration management for Research Automation
 Handles environment variables, validation, and settings hierarchy
 """
 
+import hashlib
+import json
+import logging
 import os
-from typing import Optional, List, Dict, Any
+import tempfile
+from dataclasses import asdict, dataclass
+from functools import cached_property
+from typing import Optional, List, Dict, Set
 from pathlib import Path
 
 from pydantic import BaseModel, Field, field_validator
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+# Standard library logger - structlog setup in core.logging depends on this module
+logger = logging.getLogger(__name__)
+
+# Resolved-settings cache, written next to the .env file when CONFIG_CACHE=1
+SETTINGS_CACHE_FILE = ".env.cache.json"
+SETTINGS_CACHE_VERSION = 1
+
+# Directories already created by the settings validators in this process
+_ensured_dirs: Set[Path] = set()
+
+
+def _ensure_data_dir(path: Path) -> Path:
+    """Create the data directory and its subdirectories (once per process)"""
+    if path in _ensured_dirs:
+        return path
+
+    path.mkdir(parents=True, exist_ok=True)
+
+    # Create subdirectories
+    (path / "database").mkdir(exist_ok=True)
+    (path / "cache").mkdir(exist_ok=True)
+    (path / "exports").mkdir(exist_ok=True)
+    (path / "logs").mkdir(exist_ok=True)
+
+    _ensured_dirs.add(path)
+    return path
+
+
+def _ensure_vault_path(path: Path) -> Path:
+    """Create the Obsidian vault path if possible (once per process)"""
+    if path in _ensured_dirs:
+        return path
+
+    try:
+        # Only succeeds if we have permission; a no-op if it already exists
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
+    except (PermissionError, OSError) as e:
+        # If we can't access the path, log a warning but don't crash
+        logger.warning(f"Cannot access Obsidian vault path {path}: {e}")
+        logger.warning("Obsidian export will work if path is mounted or accessible")
+
+    # Return the path anyway - it might be mounted
+    return path
 
 
 class EmailSettings(BaseModel):
@@ -52,85 +103,95 @@ class Settings(BaseSettings):
     backend_port: int = Field(default=8000, description="Backend port")
     enable_cors: bool = Field(default=True, description="Enable CORS")
 
+    # Environment variable names are the field names (matched case-insensitively),
+    # e.g. claude_api_key <- CLAUDE_API_KEY
+    #
     # API Keys (loaded from environment)
-    claude_api_key: str = Field(..., env="CLAUDE_API_KEY")
-    linkpreview_api_key: Optional[str] = Field(None, env="LINKPREVIEW_API_KEY")
+    claude_api_key: str = Field(...)
+    linkpreview_api_key: Optional[str] = Field(None)
 
     # Email settings
-    email_server: str = Field(default="imap.gmail.com", env="EMAIL_SERVER")
-    email_username: str = Field(..., env="EMAIL_USERNAME")
-    email_password: str = Field(..., env="EMAIL_PASSWORD")
-    email_folder: str = Field(default="INBOX", env="EMAIL_FOLDER")
-    smtp_server: str = Field(default="smtp.gmail.com", env="SMTP_SERVER")
-    smtp_port: int = Field(default=587, env="SMTP_PORT")
-    notification_email: str = Field(..., env="NOTIFICATION_EMAIL")
+    email_server: str = Field(default="imap.gmail.com")
+    email_username: str = Field(...)
+    email_password: str = Field(...)
+    email_folder: str = Field(default="INBOX")
+    smtp_server: str = Field(default="smtp.gmail.com")
+    smtp_port: int = Field(default=587)
+    notification_email: str = Field(...)
 
     # Claude settings
-    claude_model: str = Field(default="claude-sonnet-4-5", env="CLAUDE_MODEL")
-    max_tokens: int = Field(default=2000, env="MAX_TOKENS")
+    claude_model: str = Field(default="claude-sonnet-4-5")
+    max_tokens: int = Field(default=2000)
+    ai_concurrency: int = Field(default=4, description="Maximum concurrent Claude API requests")
+    ai_rpm: int = Field(default=50, description="Maximum Claude API requests per minute")
+    ai_tpm: int = Field(default=0, description="Maximum Claude API tokens (input + output) per minute; 0 disables")
+    ai_batch_min_items: int = Field(
+        default=50,
+        description="Summarize runs with at least this many items through the Message Batches API"
+    )
+    ai_batch_max_wait: int = Field(
+        default=14400,
+        description="Seconds to wait for a message batch before cancelling it and summarizing directly"
+    )
+    ai_max_input_tokens: int = Field(
+        default=3750,
+        description="Approximate token budget for the article/transcript text in a summary prompt"
+    )
+    ai_insights_batch_size: int = Field(
+        default=6,
+        description="Summaries per insight-extraction prompt when many summaries are ready at once"
+    )
 
     # Processing settings
-    max_articles_per_run: int = Field(default=20, env="MAX_ARTICLES_PER_RUN")
-    enable_link_enrichment: bool = Field(default=True, env="ENABLE_LINK_ENRICHMENT")
-    max_links_to_enrich: int = Field(default=10, env="MAX_LINKS_TO_ENRICH")
+    max_articles_per_run: int = Field(default=20)
+    enable_link_enrichment: bool = Field(default=True)
+    max_links_to_enrich: int = Field(default=10)
+    ws_flush_ms: int = Field(default=100, description="Minimum interval between progress callback flushes")
 
     # Weekly summary settings (ADD THESE)
     auto_generate_weekly_summary: bool = Field(
         default=True,
-        env="AUTO_GENERATE_WEEKLY_SUMMARY",
         description="Automatically generate weekly summaries during processing"
     )
     weekly_summary_min_days: int = Field(
         default=3,
-        env="WEEKLY_SUMMARY_MIN_DAYS",
         description="Minimum days between auto-generated weekly summaries"
     )
 
     # Export settings
-    default_output_format: str = Field(default="obsidian", env="DEFAULT_OUTPUT_FORMAT")
-    obsidian_vault_path: Path = Field(default=Path("/app/data/obsidian"), env="OBSIDIAN_VAULT_PATH")
-    obsidian_summaries_folder: str = Field(default="Newsletter Summaries", env="OBSIDIAN_SUMMARIES_FOLDER")
-
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
+    default_output_format: str = Field(default="obsidian")
+    obsidian_vault_path: Path = Field(default=Path("/app/data/obsidian"))
+    obsidian_summaries_folder: str = Field(default="Newsletter Summaries")
+
+    # Settings are immutable once loaded - reload through ConfigManager instead
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        frozen=True,
+        extra="ignore",
+        validate_assignment=False,
+    )
 
     @field_validator("data_dir", mode="before")
     def ensure_data_dir_exists(cls, v):
         """Ensure data directory exists"""
-        path = Path(v)
-        path.mkdir(parents=True, exist_ok=True)
-
-        # Create subdirectories
-        (path / "database").mkdir(exist_ok=True)
-        (path / "cache").mkdir(exist_ok=True)
-        (path / "exports").mkdir(exist_ok=True)
-        (path / "logs").mkdir(exist_ok=True)
-
-        return path
+        return _ensure_data_dir(Path(v))
 
     @field_validator("obsidian_vault_path", mode="before")
     def ensure_vault_path_exists(cls, v):
         """Ensure Obsidian vault path exists (if possible)"""
-        try:
-            path = Path(v)
-            # Only try to create if we have permission and it doesn't exist
-            if not path.exists():
-                path.mkdir(parents=True, exist_ok=True)
-            return path
-        except (PermissionError, OSError) as e:
-            # If we can't access the path, log a warning but don't crash
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(f"Cannot access Obsidian vault path {v}: {e}")
-            logger.warning("Obsidian export will work if path is mounted or accessible")
-            # Return the path anyway - it might be mounted
-            return Path(v)
-
-    def get_email_settings(self) -> EmailSettings:
-        """Get email settings as separate object"""
-        return EmailSettings(
+        return _ensure_vault_path(Path(v))
+
+    @cached_property
+    def email(self) -> EmailSettings:
+        """
+        Email settings as separate object (built on first access).
+
+        The flat fields above are the single source of truth; they are already
+        validated, so the view is built without validating them again.
+        """
+        return EmailSettings.model_construct(
             server=self.email_server,
             username=self.email_username,
             password=self.email_password,
@@ -140,152 +201,259 @@ class Settings(BaseSettings):
             notification_email=self.notification_email
         )
 
-    def get_claude_settings(self) -> ClaudeSettings:
-        """Get Claude settings as separate object"""
-        return ClaudeSettings(
+    @cached_property
+    def claude(self) -> ClaudeSettings:
+        """Claude settings as separate object (built on first access, not re-validated)"""
+        return ClaudeSettings.model_construct(
             api_key=self.claude_api_key,
             model=self.claude_model,
             max_tokens=self.max_tokens
         )
 
-    def get_processing_settings(self) -> ProcessingSettings:
-        """Get processing settings as separate object"""
-        return ProcessingSettings(
+    @cached_property
+    def processing(self) -> ProcessingSettings:
+        """Processing settings as separate object (built on first access, not re-validated)"""
+        return ProcessingSettings.model_construct(
             max_articles_per_run=self.max_articles_per_run,
             enable_link_enrichment=self.enable_link_enrichment,
             max_links_to_enrich=self.max_links_to_enrich,
             linkpreview_api_key=self.linkpreview_api_key
         )
 
-    @property
+    @cached_property
     def database_path(self) -> Path:
         """Get database file path"""
         return self.data_dir / "database" / "insights.db"
 
-    @property
+    @cached_property
     def cache_dir(self) -> Path:
         """Get cache directory path"""
         return self.data_dir / "cache"
 
-    @property
+    @cached_property
     def exports_dir(self) -> Path:
         """Get exports directory path"""
         return self.data_dir / "exports"
 
-    @property
+    @cached_property
     def logs_dir(self) -> Path:
         """Get logs directory path"""
         return self.data_dir / "logs"
 
 
-class ConfigManager:
-    """Configuration manager with validation and loading"""
-
-    def __init__(self):
-        self._settings: Optional[Settings] = None
+def _longer_than(value: Optional[str], min_length: int) -> bool:
+    """Check that a value is longer than min_length, ignoring surrounding whitespace"""
+    if not value:
+        return False
+    # Only pay for strip() when there is whitespace to remove
+    if value[0].isspace() or value[-1].isspace():
+        value = value.strip()
+    return len(value) > min_length
 
-    def load_settings(self, env_file: Optional[str] = None) -> Settings:
-        """Load and validate settings"""
-        # Always force reload from .env file
-        env_file_path = env_file if env_file and os.path.exists(env_file) else ".env"
 
-        # Force reload environment variables from .env file
-        self._force_reload_env_vars(env_file_path)
+@dataclass(frozen=True, slots=True)
+class ValidationResults:
+    """Result of validating the configured API keys and credentials"""
+    claude: bool
+    linkpreview: bool
+    email: bool
 
-        # Clear any cached settings to force reload
-        self._settings = None
+    def to_dict(self) -> Dict[str, bool]:
+        """Convert to dictionary for API responses"""
+        return asdict(self)
 
-        # Load with explicit env file to pick up changes
-        self._settings = Settings(_env_file=env_file_path)
 
-        return self._settings
+class ConfigManager:
+    """Configuration manager with validation and loading"""
 
-    def _force_reload_env_vars(self, env_file_path: str) -> None:
-        """Force reload environment variables from .env file into os.environ"""
-        import os
-        from pathlib import Path
+    def __init__(self):
+        self._settings: Optional[Settings] = None
+        self._env_file_path: Optional[str] = None
+        self._env_mtime: Optional[int] = None
+        # Variables this manager exported from the .env file (not set by the real environment)
+        self._env_file_keys: Set[str] = set()
+
+    def load_settings(self, env_file: Optional[str] = None, override: bool = False) -> Settings:
+        """
+        Load and validate settings.
+
+        The loaded settings are memoized and only rebuilt when the .env file
+        changes on disk (or a different env file is requested). Variables set by
+        the real environment win over .env unless override is set; values that
+        came from an earlier version of the .env file are always refreshed.
+
+        Args:
+            env_file: Optional path to the .env file
+            override: Whether .env values replace variables already set in os.environ
+        """
+        env_file_path = env_file if env_file and os.path.exists(env_file) else ".env"
+        env_mtime = self._get_env_mtime(env_file_path)
 
-        try:
-            env_path = Path(env_file_path)
-            if not env_path.exists():
-                return
+        if (self._settings is not None and
+                env_file_path == self._env_file_path and
+                env_mtime == self._env_mtime):
+            return self._settings
 
-            with open(env_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
+        # Parse the .env file once and export it to os.environ, so the
+        # settings model (and ${VAR} lookups elsewhere) read the same values
+        env_values: Dict[str, str] = {}
+        if env_mtime is not None:
+            # Only pay for importing python-dotenv when there is a file to parse
+            from dotenv import dotenv_values
 
-                    # Skip empty lines and comments
-                    if not line or line.startswith('#'):
-                        continue
+            env_values = {
+                key: value for key, value in dotenv_values(env_file_path).items()
+                if value is not None and (override or key in self._env_file_keys or key not in os.environ)
+            }
 
-                    # Parse key=value lines
-                    if '=' not in line:
-                        continue
+        # Variables dropped from the .env file since the last load no longer apply
+        for key in self._env_file_keys - env_values.keys():
+            os.environ.pop(key, None)
 
-                    try:
-                        key, value = line.split('=', 1)
-                        key = key.strip()
-                        value = value.strip().strip('"\'')  # Remove surrounding quotes
+        os.environ.update(env_values)
+        self._env_file_keys = set(env_values)
 
-                        # Update os.environ (this forces reload)
-                        os.environ[key] = value
+        self._settings = self._build_settings(env_file_path)
+        self._env_file_path = env_file_path
+        self._env_mtime = env_mtime
 
-                    except ValueError:
-                        continue
+        return self._settings
 
-        except Exception:
-            # Don't let environment loading errors break the application
-            pass
+    def reload(self, env_file: Optional[str] = None) -> Settings:
+        """Discard the memoized settings and load them again from the .env file"""
+        self._settings = None
+        self._env_mtime = None
+        return self.load_settings(env_file, override=True)
+
+    def _build_settings(self, env_file_path: str) -> Settings:
+        """
+        Build the Settings model from the current environment.
+
+        With CONFIG_CACHE=1 the resolved settings are dumped next to the .env
+        file and reused on the next start while the environment is unchanged,
+        skipping pydantic validation entirely.
+        """
+        if os.environ.get("CONFIG_CACHE") != "1":
+            # The .env file is already applied to os.environ - don't parse it again
+            return Settings(_env_file=None)
+
+        cache_path = Path(env_file_path).with_name(SETTINGS_CACHE_FILE)
+        cache_key = self._get_settings_cache_key()
+
+        settings = self._load_settings_cache(cache_path, cache_key)
+        if settings is None:
+            settings = Settings(_env_file=None)
+            self._save_settings_cache(cache_path, cache_key, settings)
+
+        return settings
+
+    @staticmethod
+    def _get_settings_cache_key() -> str:
+        """Hash the environment variables the Settings model reads"""
+        # Settings are case-insensitive, so match the field names the same way
+        environ = {key.lower(): value for key, value in os.environ.items()}
+        inputs = {name: environ.get(name) for name in Settings.model_fields}
+        payload = json.dumps([SETTINGS_CACHE_VERSION, inputs], sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _load_settings_cache(cache_path: Path, cache_key: str) -> Optional[Settings]:
+        """Construct Settings from the cache file without validation (None on miss)"""
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if cached.get("version") != SETTINGS_CACHE_VERSION or cached.get("key") != cache_key:
+            return None
+
+        values = cached.get("settings")
+        if not isinstance(values, dict) or values.keys() != Settings.model_fields.keys():
+            return None
+
+        for name, field in Settings.model_fields.items():
+            if field.annotation is Path:
+                values[name] = Path(values[name])
+
+        # Validators are skipped by model_construct, so create the directories here
+        _ensure_data_dir(values["data_dir"])
+        _ensure_vault_path(values["obsidian_vault_path"])
+
+        return Settings.model_construct(**values)
+
+    @staticmethod
+    def _save_settings_cache(cache_path: Path, cache_key: str, settings: Settings) -> None:
+        """Dump the resolved settings to the cache file (owner-readable only)"""
+        # The file holds API keys and passwords: write a fresh 0600 temp file (mkstemp's mode)
+        # and swap it in, so an existing file's looser permissions are never kept
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=f"{cache_path.name}.", suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({
+                    "version": SETTINGS_CACHE_VERSION,
+                    "key": cache_key,
+                    "settings": settings.model_dump(mode="json")
+                }, f)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write settings cache {cache_path}: {e}")
+        finally:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    @staticmethod
+    def _get_env_mtime(env_file_path: str) -> Optional[int]:
+        """Get the .env file modification time in nanoseconds (None if missing)"""
+        try:
+            return os.stat(env_file_path).st_mtime_ns
+        except OSError:
+            return None
 
     @property
     def settings(self) -> Settings:
-        """Get current settings (load if not already loaded)"""
-        if self._settings is None:
-            self._settings = self.load_settings()
-        return self._settings
+        """Get current settings (loaded on first use, rebuilt when the .env file changes)"""
+        # Costs one stat() of the .env file when nothing changed
+        return self.load_settings(self._env_file_path)
 
-    def validate_api_keys(self) -> Dict[str, bool]:
+    def validate_api_keys(self) -> ValidationResults:
         """Validate that required API keys are present"""
-        validation_results = {}
+        settings = self.settings
 
-        # Check Claude API key
-        validation_results["claude"] = bool(self.settings.claude_api_key and
-                                            len(self.settings.claude_api_key.strip()) > 10)
+        return ValidationResults(
+            # Check Claude API key
+            claude=_longer_than(settings.claude_api_key, 10),
 
-        # Check LinkPreview API key (optional)
-        validation_results["linkpreview"] = (
-                not self.settings.enable_link_enrichment or
-                bool(self.settings.linkpreview_api_key and len(self.settings.linkpreview_api_key.strip()) > 5)
-        )
+            # Check LinkPreview API key (optional)
+            linkpreview=(not settings.enable_link_enrichment or
+                         _longer_than(settings.linkpreview_api_key, 5)),
 
-        # Check email credentials
-        validation_results["email"] = bool(
-            self.settings.email_username and
-            self.settings.email_password and
-            len(self.settings.email_password.strip()) > 5
+            # Check email credentials
+            email=bool(settings.email_username) and _longer_than(settings.email_password, 5)
         )
 
-        return validation_results
-
     def get_missing_requirements(self) -> List[str]:
         """Get list of missing configuration requirements"""
         validation = self.validate_api_keys()
         missing = []
 
-        if not validation["claude"]:
+        if not validation.claude:
             missing.append("CLAUDE_API_KEY")
 
-        if not validation["email"]:
+        if not validation.email:
             missing.extend(["EMAIL_USERNAME", "EMAIL_PASSWORD"])
 
-        if self.settings.enable_link_enrichment and not validation["linkpreview"]:
+        # linkpreview is only invalid when link enrichment is enabled
+        if not validation.linkpreview:
             missing.append("LINKPREVIEW_API_KEY")
 
         return missing
 
     def is_fully_configured(self) -> bool:
         """Check if application is fully configured"""
-        return len(self.get_missing_requirements()) == 0
+        validation = self.validate_api_keys()
+        return validation.claude and validation.email and validation.linkpreview
 
 
 # Global configuration manager instance
@@ -5,15 +5,23 @@ Orchestrates the complete workflow: fetch -> process -> summarize -> export
 
 import asyncio
 import datetime
-from typing import Dict, List, Optional, Any, Callable
+import hashlib
+import json
+import logging
+import time
+from collections import deque
+from typing import AsyncIterator, Deque, Dict, List, Optional, Any, Callable, Tuple, Union
 from pathlib import Path
 
+import httpx
+import orjson
+
 from ..core.config import get_settings
 from ..core.logging import get_logger, ProcessingLogger
 from ..sources.email_client import EmailClient
 from ..sources.rss_client import RSSClient
 from ..sources.source_manager import SourceManager
-from ..processing.ai_summarizer import AISummarizer
+from ..processing.ai_summarizer import AISummarizer, SUMMARY_FORMAT_VERSION
 from ..processing.link_extractor import LinkExtractor
 from ..processing.link_enricher import LinkEnricher
 from ..processing.insights_extractor import EnhancedInsightsExtractor
@@ -23,6 +31,19 @@ from ..storage.export_manager import ExportManager
 
 logger = get_logger(__name__)
 
+# Number of recent log entries kept on ProcessingState
+MAX_STATE_LOGS = 50
+
+# Persisted log batching: flush after this many entries or this many seconds
+LOG_BATCH_SIZE = 128
+LOG_FLUSH_SECONDS = 0.2
+
+
+def _level_number(level: str) -> int:
+    """Numeric logging level for a level name (unknown names count as INFO)"""
+    number = logging.getLevelName(level.upper())
+    return number if isinstance(number, int) else logging.INFO
+
 
 class ProcessingState:
     """Tracks the current state of processing"""
@@ -34,33 +55,71 @@ class ProcessingState:
         self.total_steps: int = 0
         self.start_time: Optional[datetime.datetime] = None
         self.end_time: Optional[datetime.datetime] = None
+        self.start_monotonic_ns: Optional[int] = None  # For elapsed time, immune to wall-clock jumps
         self.error_message: Optional[str] = None
         self.results: Dict[str, Any] = {}
-        self.logs: List[Dict[str, Any]] = []
+        self.logs: Deque[Dict[str, Any]] = deque(maxlen=MAX_STATE_LOGS)
 
-    def add_log(self, level: str, message: str, **kwargs):
-        """Add a log entry"""
-        self.logs.append({
-            "timestamp": datetime.datetime.now().isoformat(),
+    def add_log(self, level: str, message: str, **kwargs) -> Dict[str, Any]:
+        """Add a log entry and return it"""
+        # Keep the datetime itself; it is only formatted when the state is serialized
+        entry = {
+            "timestamp": datetime.datetime.now(),
             "level": level,
             "message": message,
             **kwargs
-        })
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for API responses"""
+        }
+        self.logs.append(entry)
+        return entry
+
+    def mark_started(self):
+        """Record the wall-clock start time and the monotonic reference for elapsed time"""
+        self.start_time = datetime.datetime.now()
+        self.start_monotonic_ns = time.monotonic_ns()
+
+    def elapsed_seconds(self) -> float:
+        """Seconds since mark_started(), measured on the monotonic clock"""
+        if self.start_monotonic_ns is None:
+            return 0.0
+        return (time.monotonic_ns() - self.start_monotonic_ns) / 1_000_000_000
+
+    def _raw_state(self) -> Dict[str, Any]:
+        """State as a dictionary with datetime values left unconverted"""
         return {
             "status": self.status,
             "current_step": self.current_step,
             "progress": self.progress,
             "total_steps": self.total_steps,
-            "start_time": self.start_time.isoformat() if self.start_time else None,
-            "end_time": self.end_time.isoformat() if self.end_time else None,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
             "error_message": self.error_message,
             "results": self.results,
-            "logs": self.logs[-50:]  # Last 50 log entries
+            "logs": list(self.logs)  # Last MAX_STATE_LOGS log entries
         }
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for API responses"""
+        state = self._raw_state()
+        state["start_time"] = self.start_time.isoformat() if self.start_time else None
+        state["end_time"] = self.end_time.isoformat() if self.end_time else None
+        state["logs"] = [{**entry, "timestamp": entry["timestamp"].isoformat()} for entry in self.logs]
+        return state
+
+    def to_json(self, message_type: Optional[str] = None) -> bytes:
+        """
+        Serialize state to JSON bytes with orjson.
+
+        Args:
+            message_type: If given, wrap the state as {"type": message_type, "data": state}
+
+        Returns:
+            UTF-8 encoded JSON
+        """
+        state = self._raw_state()
+        if message_type:
+            state = {"type": message_type, "data": state}
+        return orjson.dumps(state, default=str)
+
 
 class ProcessingEngine:
     """Main processing engine that orchestrates the entire workflow"""
@@ -70,6 +129,9 @@ class ProcessingEngine:
         self.state = ProcessingState()
         self.source_manager = SourceManager()
 
+        # Numeric threshold of the configured log level, so suppressed entries skip structlog
+        self._log_level_no = _level_number(self.settings.log_level)
+
         # Initialize components
         self.db_manager = DatabaseManager()
         self.email_client = EmailClient()
@@ -80,8 +142,92 @@ class ProcessingEngine:
         self.export_manager = ExportManager()
         self.insights_extractor = None
 
-        # Progress tracking
+        # Log entries queued for batched persistence during a run
+        self._log_queue: Optional[asyncio.Queue] = None
+        self._log_drainer_task: Optional[asyncio.Task] = None
+
+        # Weekly summary skip window as (min_days, skip_until), mirrored from the decision cache file
+        self._weekly_skip_window: Optional[Tuple[int, datetime.datetime]] = None
+
+        # Pooled HTTP client shared by the components for one run (created lazily inside the loop)
+        self._http: Optional[httpx.AsyncClient] = None
+
+        # Progress tracking; callback notifications are coalesced per flush interval
         self._progress_callbacks: List[Callable[[ProcessingState], None]] = []
+        self._callbacks_dirty = False
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def _log_drainer(self):
+        """Persist queued log entries in batches until the None sentinel arrives"""
+        queue = self._log_queue
+        loop = asyncio.get_running_loop()
+
+        while True:
+            entry = await queue.get()
+            if entry is None:
+                return
+
+            # Collect up to LOG_BATCH_SIZE entries or LOG_FLUSH_SECONDS worth, whichever comes first
+            batch = [entry]
+            finished = False
+            deadline = loop.time() + LOG_FLUSH_SECONDS
+            while len(batch) < LOG_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    entry = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if entry is None:
+                    finished = True
+                    break
+                batch.append(entry)
+
+            await self.db_manager.store_logs_batch(batch)
+            if finished:
+                return
+
+    async def _initialize_database(self):
+        """Initialize the database, then start persisting queued log entries"""
+        await self.db_manager.initialize()
+        self._log_drainer_task = asyncio.create_task(self._log_drainer())
+
+    async def _stop_log_drainer(self):
+        """Flush remaining queued log entries and stop the drainer"""
+        if self._log_drainer_task is not None:
+            self._log_queue.put_nowait(None)
+            await self._log_drainer_task
+            self._log_drainer_task = None
+        self._log_queue = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Create the shared HTTP client on first use and hand it to the HTTP-bound components"""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=128, max_keepalive_connections=100, keepalive_expiry=60.0),
+                timeout=httpx.Timeout(30.0)
+            )
+            self.link_enricher.http_client = self._http
+            self.rss_client.http_client = self._http
+            self.source_manager.http_client = self._http
+        return self._http
+
+    async def _close_http_client(self):
+        """Close the shared HTTP client and detach it from the components"""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+            self.link_enricher.http_client = None
+            self.rss_client.http_client = None
+            self.source_manager.http_client = None
+
+    async def aclose(self):
+        """Close the engine's HTTP connections, Claude client and link cache (on application shutdown)"""
+        await self._close_http_client()
+        await self.ai_summarizer.aclose()
+        await self.link_enricher.aclose()
 
     def add_progress_callback(self, callback: Callable[[ProcessingState], None]):
         """Add callback for progress updates (for WebSocket updates)"""
@@ -96,23 +242,52 @@ class ProcessingEngine:
                     step=step, progress=progress, total_steps=self.state.total_steps)
 
         # Notify callbacks (WebSocket updates)
-        for callback in self._progress_callbacks:
-            try:
-                callback(self.state)
-            except Exception as e:
-                logger.warning(f"Progress callback failed: {e}")
+        self._schedule_callbacks()
 
     def _add_log(self, level: str, message: str, **kwargs):
         """Add log entry and notify callbacks"""
-        self.state.add_log(level, message, **kwargs)
-        getattr(logger, level.lower())(message, **kwargs)
+        entry = self.state.add_log(level, message, **kwargs)
+        if _level_number(level) >= self._log_level_no:
+            getattr(logger, level.lower())(message, **kwargs)
+
+        # Queue for persistence; the drainer writes entries in batches
+        if self._log_queue is not None:
+            self._log_queue.put_nowait(entry)
 
         # Notify callbacks for real-time log updates
+        self._schedule_callbacks()
+
+    def _schedule_callbacks(self):
+        """Mark state as changed and schedule a single coalesced callback flush"""
+        if not self._progress_callbacks:
+            return
+
+        self._callbacks_dirty = True
+        if self._flush_task is not None and not self._flush_task.done():
+            return  # A flush is already pending and will pick up the latest state
+
+        try:
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_callbacks())
+        except RuntimeError:
+            # No running event loop - notify synchronously
+            self._notify_callbacks()
+
+    async def _flush_callbacks(self):
+        """Wait one flush interval, then notify callbacks once with the latest state"""
+        await asyncio.sleep(self.settings.ws_flush_ms / 1000)
+        self._notify_callbacks()
+
+    def _notify_callbacks(self):
+        """Call every progress callback with the current state"""
+        if not self._callbacks_dirty:
+            return
+        self._callbacks_dirty = False
+
         for callback in self._progress_callbacks:
             try:
                 callback(self.state)
             except Exception as e:
-                logger.warning(f"Log callback failed: {e}")
+                logger.warning(f"Progress callback failed: {e}")
 
     async def run_full_processing(self) -> Dict[str, Any]:
         """
@@ -123,7 +298,7 @@ class ProcessingEngine:
         """
         self.state = ProcessingState()  # Reset state
         self.state.status = "running"
-        self.state.start_time = datetime.datetime.now()
+        self.state.mark_started()
         self.state.total_steps = 8  # Adjust based on workflow steps
         run_id = None  # Track database run ID
 
@@ -175,7 +350,7 @@ class ProcessingEngine:
             self.state.status = "completed"
             self.state.end_time = datetime.datetime.now()
 
-            duration = (self.state.end_time - self.state.start_time).total_seconds()
+            duration = self.state.elapsed_seconds()
             self._add_log("info", f"Processing completed successfully in {duration:.1f} seconds",
                           duration=duration, **self.state.results)
 
@@ -201,6 +376,15 @@ class ProcessingEngine:
                     logger.error(f"Failed to record error in database: {db_error}")
             raise
 
+    def _log_first_item(self, first_item: Dict[str, Any]):
+        """Log the structure of a fetched content item (debug level only)"""
+        try:
+            self._add_log("debug", f"DEBUG: First item keys: {list(first_item.keys())}")
+            self._add_log("debug", f"DEBUG: First item source: {first_item.get('source', 'N/A')}")
+            self._add_log("debug", f"DEBUG: First item title: {first_item.get('title', 'N/A')[:100]}...")
+        except Exception as e:
+            self._add_log("error", f"DEBUG: Error examining content items: {e}")
+
     async def _fetch_all_content(self) -> List[Dict[str, Any]]:
         """
         Fetch content from all configured sources using unified SourceManager.
@@ -214,27 +398,19 @@ class ProcessingEngine:
                 self._add_log("error", "DEBUG: source_manager is None!")
                 return []
 
-            self._add_log("info", f"DEBUG: source_manager type: {type(self.source_manager)}")
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            if debug_enabled:
+                self._add_log("debug", f"DEBUG: source_manager type: {type(self.source_manager)}")
 
             # Check configured sources - WRAP IN TRY-CATCH
             try:
-                configured_sources = self.source_manager.get_configured_sources()
+                configured_sources = self.source_manager.configured_sources_view
                 self._add_log("info", f"DEBUG: Found {len(configured_sources)} configured sources")
             except Exception as e:
                 self._add_log("error", f"DEBUG: Error getting configured sources: {e}")
                 return []
 
-            enabled_count = 0
-            for source_id, config in configured_sources.items():
-                try:
-                    enabled = config.get('enabled', True)
-                    source_type = config.get('type', 'unknown')
-                    if enabled:
-                        enabled_count += 1
-                    self._add_log("info", f"DEBUG: Source {source_id} - type:{source_type}, enabled:{enabled}")
-                except Exception as e:
-                    self._add_log("error", f"DEBUG: Error processing source {source_id}: {e}")
-
+            enabled_count = sum(1 for config in configured_sources.values() if config.get('enabled', True))
             self._add_log("info", f"DEBUG: {enabled_count} sources are enabled")
 
             if enabled_count == 0:
@@ -243,25 +419,20 @@ class ProcessingEngine:
 
             # Now try to fetch content - WRAP IN TRY-CATCH
             try:
-                self._add_log("info", "DEBUG: Calling source_manager.fetch_from_all_sources()")
+                if debug_enabled:
+                    self._add_log("debug", "DEBUG: Calling source_manager.fetch_from_all_sources()")
                 content_items = await self.source_manager.fetch_from_all_sources()
                 self._add_log("info", f"DEBUG: Received {len(content_items)} content items")
             except Exception as e:
                 self._add_log("error", f"DEBUG: Error in fetch_from_all_sources(): {e}")
-                # Print full exception details
-                import traceback
-                self._add_log("error", f"DEBUG: Full traceback: {traceback.format_exc()}")
+                # Full exception details go to the application log only
+                logger.exception("fetch_from_all_sources failed")
                 return []
 
             if content_items:
                 # Log first item structure for debugging
-                try:
-                    first_item = content_items[0]
-                    self._add_log("info", f"DEBUG: First item keys: {list(first_item.keys())}")
-                    self._add_log("info", f"DEBUG: First item source: {first_item.get('source', 'N/A')}")
-                    self._add_log("info", f"DEBUG: First item title: {first_item.get('title', 'N/A')[:100]}...")
-                except Exception as e:
-                    self._add_log("error", f"DEBUG: Error examining content items: {e}")
+                if debug_enabled:
+                    self._log_first_item(content_items[0])
             else:
                 self._add_log("warning", "DEBUG: Content fetch returned empty list - no new content found")
 
@@ -269,8 +440,7 @@ class ProcessingEngine:
 
         except Exception as e:
             self._add_log("error", f"DEBUG: FATAL ERROR in _fetch_all_content: {e}")
-            import traceback
-            self._add_log("error", f"DEBUG: Full traceback: {traceback.format_exc()}")
+            logger.exception("_fetch_all_content failed")
 
             # Try fallback method
             try:
@@ -310,57 +480,220 @@ class ProcessingEngine:
             raise
 
     async def _process_links(self, content_items: List[Dict[str, Any]]):
-        """Extract and enrich links from content"""
-        total_links = 0
-
+        """Extract links from content, then enrich them across all items in one batch"""
         for item in content_items:
             try:
                 # Extract links from content
-                links = self.link_extractor.extract_links(item.get("content", ""))
-
-                # Enrich links if enabled
-                if self.settings.enable_link_enrichment and links:
-                    enriched_links = await self.link_enricher.enrich_links(
-                        links[:self.settings.max_links_to_enrich]
-                    )
-                    item["links"] = enriched_links
-                else:
-                    item["links"] = links
-
-                total_links += len(item["links"])
-
+                item["links"] = self.link_extractor.extract_links(item.get("content", ""))
             except Exception as e:
                 self._add_log("warning", f"Error processing links for {item.get('title', 'unknown')}: {e}")
                 item["links"] = []
 
-        self.state.results["links_processed"] = total_links
+        # Enrich links if enabled
+        if self.settings.enable_link_enrichment:
+            max_links = self.settings.max_links_to_enrich
+            batches = [item["links"][:max_links] for item in content_items]
+            all_links = [link for batch in batches for link in batch]
+
+            if all_links:
+                try:
+                    enriched_links = await self.link_enricher.enrich_links(all_links, max_links=len(all_links))
+                except Exception as e:
+                    self._add_log("warning", f"Error enriching links: {e}")
+                    enriched_links = all_links
+
+                # enrich_links preserves order, so scatter the results back by position
+                position = 0
+                for item, batch in zip(content_items, batches):
+                    item["links"] = enriched_links[position:position + len(batch)]
+                    position += len(batch)
+
+        self.state.results["links_processed"] = sum(len(item["links"]) for item in content_items)
+
+    async def _summarize_and_extract(self, content_items: List[Dict[str, Any]]
+                                     ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Generate summaries and extract insights from them (steps 4-5).
+
+        Summaries are streamed in completion order, so insight extraction for an
+        item starts as soon as its summary is ready instead of after the slowest one.
+        Batched runs get every summary at once and extract insights in groups.
+        """
+        self._init_insights_extractor()
+
+        if len(content_items) >= self.settings.ai_batch_min_items:
+            # Bulk runs go through the Message Batches API, so every summary arrives at once
+            # and insight extraction can group several summaries per Claude call
+            summaries = await self._generate_summaries_batched(content_items)
+            self._update_progress("Extracting insights", 5)
+            insights = await self._extract_insights_grouped(summaries)
+            self._add_log("info", f"Successfully extracted {len(insights)} strategic insights total")
+            return summaries, insights
+
+        summaries: List[Optional[Dict[str, Any]]] = [None] * len(content_items)
+        insight_tasks: Dict[int, asyncio.Task] = {}
+
+        try:
+            async for index, summary in self._generate_summaries_stream(content_items):
+                summaries[index] = summary
+                insight_tasks[index] = asyncio.create_task(self._extract_summary_insights(summary))
+        except BaseException:
+            # Summarizing failed or was cancelled - don't leave insight extraction running
+            for task in insight_tasks.values():
+                task.cancel()
+            raise
+
+        self._update_progress("Extracting insights", 5)
+        await asyncio.gather(*insight_tasks.values())
+
+        # Keep insights in content order
+        insights = [insight for index in sorted(insight_tasks) for insight in insight_tasks[index].result()]
+        self._add_log("info", f"Successfully extracted {len(insights)} strategic insights total")
+
+        return summaries, insights
 
     async def _generate_summaries(self, content_items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Generate AI summaries for content items"""
-        summaries = []
+        """Generate AI summaries for content items (concurrently, preserving order)"""
+        summaries: List[Optional[Dict[str, Any]]] = [None] * len(content_items)
 
-        for item in content_items:
-            try:
-                self._add_log("info", f"Summarizing: {item.get('title', 'Unknown')}")
+        async for index, summary in self._generate_summaries_stream(content_items):
+            summaries[index] = summary
 
-                summary = await self.ai_summarizer.summarize_content(item)
-                summaries.append(summary)
+        return summaries
 
-                # Brief pause to respect API rate limits
-                await asyncio.sleep(1)
+    async def _generate_summaries_stream(self, content_items: List[Dict[str, Any]]
+                                         ) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """Summarize content items concurrently, yielding (index, summary) as each one finishes"""
 
-            except Exception as e:
-                self._add_log("error", f"Error summarizing {item.get('title', 'unknown')}: {e}")
-                # Add empty summary to maintain data consistency
-                summaries.append({
-                    "title": item.get("title", "Unknown"),
-                    "source": item.get("source", "Unknown"),
-                    "summary": "Summary generation failed",
-                    "error": str(e)
-                })
+        async def summarize_indexed(index: int, item: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+            return index, await self._summarize_item(item)
+
+        tasks = [asyncio.create_task(summarize_indexed(index, item)) for index, item in enumerate(content_items)]
 
+        try:
+            for completed, next_done in enumerate(asyncio.as_completed(tasks), start=1):
+                index, summary = await next_done
+                self._update_progress(f"Generated {completed}/{len(content_items)} AI summaries", 4)
+                yield index, summary
+        finally:
+            # Consumer stopped early or failed - don't leave summaries running
+            for task in tasks:
+                task.cancel()
+
+    async def _generate_summaries_batched(self, content_items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Summarize content items via message batches, skipping items with a cached summary"""
+        # Cleaning every item is CPU work; one worker-thread hop keeps it off the event loop
+        prepared = await asyncio.to_thread(self._prepare_all_for_summary, content_items)
+        cleaned_contents = [None if isinstance(result, Exception) else result[0] for result in prepared]
+        cache_keys = [None if isinstance(result, Exception) else result[1] for result in prepared]
+        summaries = list(await asyncio.gather(*(
+            self._get_cached_item_summary(item, cache_key) for item, cache_key in zip(content_items, cache_keys)
+        )))
+        # An item that failed to clean gets an error summary instead of failing the batch
+        for index, result in enumerate(prepared):
+            if isinstance(result, Exception):
+                summaries[index] = self._failed_summary(content_items[index], result)
+
+        pending = [index for index, summary in enumerate(summaries) if summary is None]
+        if pending:
+            self._update_progress(f"Summarizing {len(pending)} items via the Message Batches API", 4)
+            self._add_log("info", f"Submitting {len(pending)} items for batch summarization")
+            fresh = await self.ai_summarizer.summarize_batch([content_items[index] for index in pending],
+                                                             [cleaned_contents[index] for index in pending])
+
+            for index, summary in zip(pending, fresh):
+                summaries[index] = summary
+                if cache_keys[index] and not summary.get("error"):
+                    await self.db_manager.store_cached_summary(cache_keys[index], summary)
+
+        self._update_progress(f"Generated {len(summaries)}/{len(content_items)} AI summaries", 4)
         return summaries
 
+    async def _get_cached_item_summary(self, item: Dict[str, Any],
+                                       cache_key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Cached summary for a content item, relabelled with the item's metadata (None on a miss)"""
+        if not cache_key:
+            return None
+
+        cached = await self.db_manager.get_cached_summary(cache_key)
+        if cached is not None:
+            self._add_log("info", f"Using cached summary: {item.get('title', 'Unknown')}")
+            # Same content may be re-shared under a different title/source/date
+            cached.update({
+                "title": item.get("title", "Unknown"),
+                "source": item.get("source", "Unknown"),
+                "date": item.get("date", ""),
+                "source_type": item.get("source_type", "newsletter")
+            })
+        return cached
+
+    async def _summarize_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Summarize one content item, using the summary cache when possible"""
+        title = item.get("title", "Unknown")
+
+        try:
+            cleaned_content, cache_key = await asyncio.to_thread(self._prepare_for_summary, item)
+            cached = await self._get_cached_item_summary(item, cache_key)
+            if cached is not None:
+                return cached
+
+            # Claude requests are bounded and rate limited inside AISummarizer.create_message
+            self._add_log("info", f"Summarizing: {title}")
+            summary = await self.ai_summarizer.summarize_content(item, cleaned_content)
+
+            if cache_key and not summary.get("error"):
+                await self.db_manager.store_cached_summary(cache_key, summary)
+            return summary
+
+        except Exception as e:
+            return self._failed_summary(item, e)
+
+    def _failed_summary(self, item: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+        """Log a failed summary and return an error stub in its place"""
+        title = item.get("title", "Unknown")
+        self._add_log("error", f"Error summarizing {title}: {error}")
+        # Add empty summary to maintain data consistency
+        return {
+            "title": title,
+            "source": item.get("source", "Unknown"),
+            "summary": "Summary generation failed",
+            "error": str(error)
+        }
+
+    def _prepare_all_for_summary(self, content_items: List[Dict[str, Any]]
+                                 ) -> List[Union[Tuple[Optional[str], Optional[str]], Exception]]:
+        """_prepare_for_summary for every item (blocking); an item that fails gets its exception instead"""
+        prepared: List[Union[Tuple[Optional[str], Optional[str]], Exception]] = []
+        for item in content_items:
+            try:
+                prepared.append(self._prepare_for_summary(item))
+            except Exception as e:
+                prepared.append(e)
+        return prepared
+
+    def _prepare_for_summary(self, item: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Clean an item's content once for both the summary cache key and the summarizer
+        (blocking; run via asyncio.to_thread).
+
+        Returns:
+            (cleaned content, cache key), both None for items without content
+        """
+        content = item.get("content", "")
+        if not content:
+            return None, None
+        # Hash the text the model actually sees, so copies that differ only in markup,
+        # tracking links, addresses or whitespace share one cache entry; the format version
+        # retires summaries cached under older prompts
+        cleaned = self.ai_summarizer.content_cleaner.clean_for_ai_processing(content)
+        payload = f"{SUMMARY_FORMAT_VERSION}\0{self.settings.claude_model}\0{cleaned}".encode("utf-8")
+        return cleaned, hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def _init_insights_extractor(self):
+        """Initialize enhanced insights extractor if needed"""
+        if self.insights_extractor is None:
+            self.insights_extractor = EnhancedInsightsExtractor(self.ai_summarizer)
+
     async def _extract_insights(self, summaries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Extract strategic insights from summaries using enhanced AI extraction.
@@ -371,48 +704,65 @@ class ProcessingEngine:
         Returns:
             List of insight dictionaries for database storage
         """
-        insights = []  # Simplified: just "insights" instead of "all_insights"
-
         try:
-            # Initialize enhanced insights extractor if needed
-            if self.insights_extractor is None:
-                self.insights_extractor = EnhancedInsightsExtractor(self.ai_summarizer)
+            self._init_insights_extractor()
 
             self._add_log("info", f"Extracting strategic insights from {len(summaries)} summaries")
 
-            for summary in summaries:
-                try:
-                    # Extract strategic insights (not bullet points)
-                    strategic_insights = await self.insights_extractor.extract_strategic_insights(summary)
-
-                    # Convert to database format
-                    for insight_text in strategic_insights:
-                        insight_data = {
-                            'summary_id': summary.get('id'),
-                            'source': summary.get('source', 'Unknown'),
-                            'topic': ', '.join(summary.get('tags', [])[:3]),
-                            'insight': insight_text,
-                            'tags': summary.get('tags', []),
-                            'date': summary.get('date', ''),
-                            'created_at': datetime.datetime.now().isoformat()
-                        }
-                        insights.append(insight_data)  # Simplified variable name
-
-                    self._add_log("debug",
-                                  f"Extracted {len(strategic_insights)} insights from {summary.get('source', 'unknown')}")
-
-                except Exception as e:
-                    self._add_log("warning", f"Failed to extract insights from {summary.get('source', 'unknown')}: {e}")
-                    continue
+            insights = await self._extract_insights_grouped(summaries)
 
             self._add_log("info", f"Successfully extracted {len(insights)} strategic insights total")
-            return insights  # Simplified return
+            return insights
 
         except Exception as e:
             self._add_log("error", f"Strategic insights extraction failed: {e}")
             # Fallback to simple extraction if needed
             return await self._fallback_extract_insights(summaries)
 
+    async def _extract_summary_insights(self, summary: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Extract strategic insights from one summary, in database format"""
+        source = summary.get('source', 'Unknown')
+
+        try:
+            # Extract strategic insights (not bullet points)
+            strategic_insights = await self.insights_extractor.extract_strategic_insights(summary)
+        except Exception as e:
+            self._add_log("warning", f"Failed to extract insights from {source}: {e}")
+            return []
+
+        return self._insight_rows(summary, strategic_insights)
+
+    async def _extract_insights_grouped(self, summaries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Extract strategic insights from summaries that are all ready, several per Claude call"""
+        results = await self.insights_extractor.extract_strategic_insights_batch(summaries)
+        return [insight for summary, strategic_insights in zip(summaries, results)
+                for insight in self._insight_rows(summary, strategic_insights)]
+
+    def _insight_rows(self, summary: Dict[str, Any], strategic_insights: List[str]) -> List[Dict[str, Any]]:
+        """Insights from one summary, in database format"""
+        source = summary.get('source', 'Unknown')
+
+        # Fields shared by every insight from this summary
+        summary_id = summary.get('id')
+        tags = summary.get('tags') or []
+        topic = ', '.join(tags[:3])
+        date = summary.get('date', '')
+        created_at = datetime.datetime.now().isoformat()
+
+        # Convert to database format
+        summary_insights = [{
+            'summary_id': summary_id,
+            'source': source,
+            'topic': topic,
+            'insight': insight_text,
+            'tags': tags,
+            'date': date,
+            'created_at': created_at
+        } for insight_text in strategic_insights]
+
+        self._add_log("debug", f"Extracted {len(strategic_insights)} insights from {source}")
+        return summary_insights
+
     async def _fallback_extract_insights(self, summaries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Fallback to basic bullet point extraction if AI extraction fails."""
         insights = []  # Simplified variable name here too
@@ -430,22 +780,17 @@ class ProcessingEngine:
                              insights: List[Dict[str, Any]]):
         """Store all results in database"""
         try:
-            # Store summaries
-            await self.db_manager.store_summaries(summaries)
-
-            # Store insights
-            await self.db_manager.store_insights(insights)
-
-            # Store links
-            all_links = []
-            for item in content_items:
-                if item.get("links"):
-                    for link in item["links"]:
-                        link["source"] = item.get("source", "Unknown")
-                        link["date"] = item.get("date", datetime.datetime.now().strftime("%Y-%m-%d"))
-                    all_links.extend(item["links"])
-
-            await self.db_manager.store_links(all_links)
+            # Shape links into DB rows without mutating the link dicts
+            today = datetime.datetime.now().strftime("%Y-%m-%d")
+            link_rows = [
+                DatabaseManager.link_row(link, item_source, item_date)
+                for item in content_items
+                for item_source, item_date in [(item.get("source", "Unknown"), item.get("date", today))]
+                for link in item.get("links") or []
+            ]
+
+            # Store summaries, insights and links in one transaction
+            await self.db_manager.store_batch(summaries, insights, link_rows)
 
             self._add_log("info", "Data stored successfully in database")
 
@@ -458,15 +803,18 @@ class ProcessingEngine:
         exports = []
 
         try:
-            # Generate Obsidian markdown
-            obsidian_file = await self.export_manager.generate_obsidian_summary(summaries)
-            if obsidian_file:
-                exports.append(obsidian_file)
-
-            # Generate JSON export
-            json_file = await self.export_manager.generate_json_export(summaries)
-            if json_file:
-                exports.append(json_file)
+            # Generate Obsidian markdown and JSON export concurrently
+            results = await asyncio.gather(
+                self.export_manager.generate_obsidian_summary(summaries),
+                self.export_manager.generate_json_export(summaries),
+                return_exceptions=True
+            )
+
+            for result in results:
+                if isinstance(result, Exception):
+                    self._add_log("error", f"Error generating export: {result}")
+                elif result:
+                    exports.append(result)
 
             self._add_log("info", f"Generated {len(exports)} export files")
             return exports
@@ -505,7 +853,7 @@ class ProcessingEngine:
             # Test SourceManager
             self._add_log("info", "Testing SourceManager configuration")
 
-            configured_sources = self.source_manager.get_configured_sources()
+            configured_sources = self.source_manager.configured_sources_view
             source_test_results = {}
 
             for source_id in configured_sources.keys():
@@ -574,11 +922,12 @@ class ProcessingEngine:
         New method for Sprint 2 diagnostics.
         """
         try:
+            configured_sources = self.source_manager.configured_sources_view
             return {
                 'available_plugin_types': self.source_manager.get_available_plugin_types(),
-                'configured_sources': list(self.source_manager.get_configured_sources().keys()),
+                'configured_sources': list(configured_sources.keys()),
                 'enabled_sources': [
-                    source_id for source_id, config in self.source_manager.get_configured_sources().items()
+                    source_id for source_id, config in configured_sources.items()
                     if config.get('enabled', True)
                 ],
                 'plugin_count': len(self.source_manager.registered_plugins),
@@ -605,43 +954,88 @@ class ProcessingEngine:
                 self._add_log("info", "Auto-generation of weekly summaries is disabled")
                 return False
 
-            # Get the most recent weekly summary
-            latest_weekly = await self.db_manager.get_latest_weekly_summary()
+            min_days = self.settings.weekly_summary_min_days
+
+            # A recent weekly summary blocks generation until a known time - no DB needed before then
+            skip_until = self._load_weekly_skip_until(min_days)
+            if skip_until and datetime.datetime.now() < skip_until:
+                self._add_log("info",
+                              f"Weekly summary not due until {skip_until:%Y-%m-%d %H:%M}, skipping auto-generation")
+                return False
+
+            # Latest weekly summary date and summary counts in one round-trip
+            state = await self.db_manager.get_weekly_generation_state(
+                datetime.datetime.now() - datetime.timedelta(days=7)
+            )
 
-            if not latest_weekly:
+            if not state['latest_weekly_date']:
                 # No weekly summary exists - generate one if we have any summaries
-                recent_summaries = await self.db_manager.get_summaries_since(
-                    datetime.datetime.now() - datetime.timedelta(days=7)
-                )
-                return len(recent_summaries) > 0
+                return state['count_last_7d'] > 0
 
             # Check if it's been >X days since last weekly summary (configurable)
-            last_weekly_date = datetime.datetime.fromisoformat(latest_weekly['date'])
+            last_weekly_date = datetime.datetime.fromisoformat(state['latest_weekly_date'])
             days_since_weekly = (datetime.datetime.now() - last_weekly_date).days
-            min_days = self.settings.weekly_summary_min_days
 
             if days_since_weekly < min_days:
+                self._save_weekly_skip_until(min_days, last_weekly_date + datetime.timedelta(days=min_days))
                 self._add_log("info",
                               f"Last weekly summary was {days_since_weekly} days ago, minimum is {min_days} days, skipping auto-generation")
                 return False
 
-            # Check if there are new summaries since last weekly summary
-            summaries_since_weekly = await self.db_manager.get_summaries_since(last_weekly_date)
-            # Exclude weekly summaries from the count
-            new_summaries = [s for s in summaries_since_weekly if s.get('source_type') != 'weekly_summary']
+            # New (non-weekly) summaries since last weekly summary
+            new_summaries = state['non_weekly_summary_count_since']
 
-            if len(new_summaries) == 0:
+            if new_summaries == 0:
                 self._add_log("info", "No new summaries since last weekly summary, skipping auto-generation")
                 return False
 
             self._add_log("info",
-                          f"Found {len(new_summaries)} new summaries since last weekly summary ({days_since_weekly} days ago)")
+                          f"Found {new_summaries} new summaries since last weekly summary ({days_since_weekly} days ago)")
             return True
 
         except Exception as e:
             self._add_log("warning", f"Error checking weekly summary conditions: {e}")
             return False
 
+    def _weekly_decision_cache_path(self) -> Path:
+        """File persisting the weekly summary skip window across runs"""
+        return self.settings.cache_dir / "weekly_decision.json"
+
+    def _load_weekly_skip_until(self, min_days: int) -> Optional[datetime.datetime]:
+        """Return the cached time before which no weekly summary is due (None if unknown or stale)"""
+        # Later runs of the same engine answer from memory without touching the cache file
+        if self._weekly_skip_window is not None and self._weekly_skip_window[0] == min_days:
+            return self._weekly_skip_window[1]
+
+        try:
+            cache_path = self._weekly_decision_cache_path()
+            if not cache_path.exists():
+                return None
+
+            with open(cache_path, 'r') as f:
+                cached = json.load(f)
+
+            # A changed minimum interval invalidates the cached window
+            if cached.get("min_days") != min_days:
+                return None
+
+            skip_until = datetime.datetime.fromisoformat(cached["skip_until"])
+            self._weekly_skip_window = (min_days, skip_until)
+            return skip_until
+
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable weekly decision cache: {e}")
+            return None
+
+    def _save_weekly_skip_until(self, min_days: int, skip_until: datetime.datetime):
+        """Persist the time before which no weekly summary is due"""
+        self._weekly_skip_window = (min_days, skip_until)
+        try:
+            with open(self._weekly_decision_cache_path(), 'w') as f:
+                json.dump({"min_days": min_days, "skip_until": skip_until.isoformat()}, f)
+        except Exception as e:
+            logger.warning(f"Could not save weekly decision cache: {e}")
+
     async def _generate_weekly_summary_v1(self) -> Optional[Dict[str, Any]]:
         """
         Generate and store a V1-format weekly summary from recent individual summaries.
@@ -708,19 +1102,26 @@ class ProcessingEngine:
         """
         self.state = ProcessingState()  # Reset state
         self.state.status = "running"
-        self.state.start_time = datetime.datetime.now()
+        self.state.mark_started()
         self.state.total_steps = 9  # UPDATED: was 8, now 9 to include weekly summary step
+        self._log_queue = asyncio.Queue()
 
         try:
             self._add_log("info", "Starting newsletter processing workflow")
+            self._get_http_client()
 
-            # Step 1: Initialize database
+            # Step 1: Initialize database - fetching never touches the database,
+            # so schema setup runs in the background while step 2 is in flight
             self._update_progress("Initializing database", 1)
-            await self.db_manager.initialize()
+            db_ready = asyncio.create_task(self._initialize_database())
 
             # Step 2: Fetch content from all sources
             self._update_progress("Fetching content from sources", 2)
-            content_items = await self._fetch_all_content()
+            try:
+                content_items = await self._fetch_all_content()
+            finally:
+                # Everything from step 3 on reads or writes the database
+                await db_ready
             self.state.results["content_fetched"] = len(content_items)
 
             if not content_items:
@@ -728,20 +1129,22 @@ class ProcessingEngine:
                 self.state.status = "completed"
                 return self.state.results
 
-            # Step 3: Extract and enrich links
-            self._update_progress("Processing links", 3)
-            await self._process_links(content_items)
+            # Steps 3-5: link processing is independent of summarization, so it
+            # runs alongside summary generation and insight extraction
+            self._update_progress("Processing links and generating AI summaries", 3)
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self._process_links(content_items))
+                analysis_task = tg.create_task(self._summarize_and_extract(content_items))
 
-            # Step 4: Generate summaries with AI
-            self._update_progress("Generating AI summaries", 4)
-            summaries = await self._generate_summaries(content_items)
+            summaries, insights = analysis_task.result()
             self.state.results["summaries_generated"] = len(summaries)
-
-            # Step 5: Extract insights and questions
-            self._update_progress("Extracting insights", 5)
-            insights = await self._extract_insights(summaries)
             self.state.results["insights_extracted"] = len(insights)
 
+            # Raw content (full newsletters and transcripts) has no readers past this
+            # point; release it so only summaries, links and metadata stay resident
+            for item in content_items:
+                item.pop("content", None)
+
             # Step 6: Store everything in database
             self._update_progress("Storing data", 6)
             await self._store_results(content_items, summaries, insights)
@@ -774,9 +1177,10 @@ class ProcessingEngine:
 
             self.state.status = "completed"
             self.state.end_time = datetime.datetime.now()
+            duration = self.state.elapsed_seconds()
 
             # Update completion message to include weekly summary info
-            completion_message = (f"Processing completed successfully. " +
+            completion_message = (f"Processing completed successfully in {duration:.1f} seconds. " +
                                   f"Created {self.state.results.get('summaries_created', 0)} summaries, " +
                                   f"extracted {self.state.results.get('insights_extracted', 0)} insights, " +
                                   f"generated {self.state.results.get('exports_generated', 0)} exports")
@@ -784,7 +1188,7 @@ class ProcessingEngine:
             if self.state.results.get("weekly_summary_generated"):
                 completion_message += ", and auto-generated weekly summary"
 
-            self._add_log("info", completion_message)
+            self._add_log("info", completion_message, duration=duration)
 
             return self.state.results
 
@@ -793,4 +1197,8 @@ class ProcessingEngine:
             self.state.error_message = str(e)
             self.state.end_time = datetime.datetime.now()
             self._add_log("error", f"Processing failed: {e}")
-            raise
\ No newline at end of file
+            raise
+
+        finally:
+            await self._close_http_client()
+            await self._stop_log_drainer()
\ No newline at end of file
@@ -3,16 +3,32 @@ Logging configuration for Research Automation
 Provides structured logging with different levels and outputs
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional
+import orjson
 import structlog
 import datetime
 from structlog.stdlib import LoggerFactory
 
 from .config import get_settings
 
+def _orjson_dumps(obj, **kwargs) -> str:
+    """JSONRenderer serializer backed by orjson (keeps structlog's fallback for unknown types)"""
+    return orjson.dumps(obj, default=kwargs.get("default")).decode()
+
+
+# Background listener that owns the real (blocking) log handlers
+_queue_listener: Optional[QueueListener] = None
+
+# Set once logging has been configured (explicitly or when the first log call is made)
+_configured = False
+
+
 def setup_logging(log_level: str = "INFO", log_file: Optional[Path] = None) -> None:
     """
     Setup structured logging configuration
@@ -21,6 +37,9 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[Path] = None) -> N
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
         log_file: Optional path to log file
     """
+    global _configured
+    _configured = True
+
     # Configure structlog
     structlog.configure(
         processors=[
@@ -28,11 +47,11 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[Path] = None) -> N
             structlog.stdlib.add_logger_name,
             structlog.stdlib.add_log_level,
             structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.TimeStamper(fmt="iso", utc=True, key="ts"),
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer()
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps)
         ],
         context_class=dict,
         logger_factory=LoggerFactory(),
@@ -40,36 +59,105 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[Path] = None) -> N
         cache_logger_on_first_use=True,
     )
 
-    # Configure standard library logging
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, log_level.upper()),
-    )
+    # Configure standard library logging. Handlers that write to stdout/disk run on a
+    # QueueListener thread; callers (including the event loop) only enqueue records.
+    global _queue_listener
+    level = getattr(logging, log_level.upper())
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    handlers = [stream_handler]
 
     # Add file handler if specified
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
         file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(getattr(logging, log_level.upper()))
+        file_handler.setLevel(level)
         file_handler.setFormatter(logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         ))
+        handlers.append(file_handler)
+
+    # Replace a listener from a previous setup_logging call
+    shutdown_logging()
+
+    log_queue = queue.SimpleQueue()
+    root_logger = logging.getLogger()
+    root_logger.handlers = [h for h in root_logger.handlers if not isinstance(h, QueueHandler)]
+    root_logger.addHandler(QueueHandler(log_queue))
+    root_logger.setLevel(level)
+
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+
+
+def shutdown_logging() -> None:
+    """Stop the background log listener, flushing queued records"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
 
-        # Add to root logger
-        root_logger = logging.getLogger()
-        root_logger.addHandler(file_handler)
+atexit.register(shutdown_logging)
+
+
+def _ensure_configured() -> None:
+    """Configure logging from settings the first time a logger is used"""
+    global _configured
+    if _configured:
+        return
+    _configured = True
+
+    try:
+        settings = get_settings()
+        log_file = settings.logs_dir / "newsletter_summarizer.log"
+        setup_logging(settings.log_level, log_file)
+
+        # Create application logger
+        app_logger = get_logger("app")
+        app_logger.info("Logging system initialized",
+                        log_level=settings.log_level,
+                        log_file=str(log_file))
+
+    except Exception as e:
+        # Fallback to basic logging if config fails
+        logging.basicConfig(level=logging.INFO)
+        logger = logging.getLogger("app")
+        logger.warning(f"Failed to initialize advanced logging: {e}")
+        logger.info("Using basic logging configuration")
+
+
+def _configuring_logger_factory(*args):
+    """
+    structlog logger factory in place until logging is configured.
+
+    structlog calls it when a lazy logger is first used (its first log call or bind()),
+    so settings, the log directory and the handlers are set up then rather than when
+    modules create their loggers at import time.
+    """
+    _ensure_configured()
+    return LoggerFactory()(*args)
+
+
+# Only swaps in the factory above: no settings are read and no files are touched on import
+structlog.configure(logger_factory=_configuring_logger_factory)
 
 
 def get_logger(name: str) -> structlog.stdlib.BoundLogger:
     """
     Get a logger instance
 
+    The logger is a lazy proxy; logging is configured from settings when the first
+    logger is used, not when it is created.
+
     Args:
         name: Logger name (usually __name__)
 
     Returns:
-        Configured logger instance
+        Logger instance
     """
     return structlog.get_logger(name)
 
@@ -81,49 +169,31 @@ class ProcessingLogger:
     """
 
     def __init__(self, source_type: str, source_name: str):
-        self.logger = get_logger(f"processing.{source_type}")
         self.context = {
             "source_type": source_type,
             "source_name": source_name
         }
+        # Context is bound once here, not merged into every call
+        self.logger = get_logger(f"processing.{source_type}").bind(**self.context)
 
     def bind(self, **kwargs):
         """Add context to logger"""
         self.context.update(kwargs)
+        self.logger = self.logger.bind(**kwargs)
         return self
 
     def info(self, message: str, **kwargs):
         """Log info message with context"""
-        self.logger.info(message, **{**self.context, **kwargs})
+        self.logger.info(message, **kwargs)
 
     def warning(self, message: str, **kwargs):
         """Log warning message with context"""
-        self.logger.warning(message, **{**self.context, **kwargs})
+        self.logger.warning(message, **kwargs)
 
     def error(self, message: str, **kwargs):
         """Log error message with context"""
-        self.logger.error(message, **{**self.context, **kwargs})
+        self.logger.error(message, **kwargs)
 
     def debug(self, message: str, **kwargs):
         """Log debug message with context"""
-        self.logger.debug(message, **{**self.context, **kwargs})
-
-
-# Initialize logging on module import
-try:
-    settings = get_settings()
-    log_file = settings.logs_dir / "newsletter_summarizer.log"
-    setup_logging(settings.log_level, log_file)
-
-    # Create application logger
-    app_logger = get_logger("app")
-    app_logger.info("Logging system initialized",
-                    log_level=settings.log_level,
-                    log_file=str(log_file))
-
-except Exception as e:
-    # Fallback to basic logging if config fails
-    logging.basicConfig(level=logging.INFO)
-    logger = logging.getLogger("app")
-    logger.warning(f"Failed to initialize advanced logging: {e}")
-    logger.info("Using basic logging configuration")
\ No newline at end of file
+        self.logger.debug(message, **kwargs)
@@ -2,13 +2,15 @@
 FastAPI main application for Research Automation
 """
 
+import logging
+
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
 
 from .core.config import get_settings
-from .core.logging import get_logger
+from .core.logging import get_logger, shutdown_logging
 from .web.routes.api import router as api_router
 from .web.routes.setup import router as setup_router
 from .web.routes.settings import router as settings_router
@@ -49,12 +51,20 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down Research Automation")
 
+    from .web.routes.api import processing_engine
+    for engine in (processing_engine, getattr(app.state, "processing_engine", None)):
+        if engine is not None:
+            await engine.aclose()
+
+    shutdown_logging()
+
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application"""
 
     settings = get_settings()
 
+    processing_engine = None
     try:
         processing_engine = ProcessingEngine()
         sources.set_source_manager(processing_engine.source_manager)
@@ -70,6 +80,9 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
+    # Closed by the lifespan on shutdown
+    app.state.processing_engine = processing_engine
+
     # Configure CORS
     if settings.enable_cors:
         app.add_middleware(
@@ -82,17 +95,13 @@ def create_app() -> FastAPI:
 
     # Include routers
     app.include_router(api_router, prefix="/api/v1", tags=["api"])
-    logger.info(f"Registered routes: {[route.path for route in app.routes]}")
-    logger.info(f"Sources router routes: {[route.path for route in sources.router.routes]}")
     app.include_router(setup_router, prefix="/api/v1", tags=["setup"])
-    logger.info(f"Registered routes: {[route.path for route in app.routes]}")
-    logger.info(f"Sources router routes: {[route.path for route in sources.router.routes]}")
     app.include_router(settings_router, prefix="/api/v1", tags=["settings"])
-    logger.info(f"Registered routes: {[route.path for route in app.routes]}")
-    logger.info(f"Sources router routes: {[route.path for route in sources.router.routes]}")
     app.include_router(sources.router, prefix="/api/v1/sources", tags=["sources"])
-    logger.info(f"Registered routes: {[route.path for route in app.routes]}")
-    logger.info(f"Sources router routes: {[route.path for route in sources.router.routes]}")
+
+    logger.info("Routes registered", count=len(app.routes))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Registered routes", paths=[route.path for route in app.routes])
 
     # Health check endpoint
     @app.get("/health")
@@ -7,16 +7,87 @@ Enhanced with async support, better prompt templates, and improved parsing
 """
 
 import asyncio
+import random
 import re
-from typing import Dict, Any, List, Optional
-from anthropic import AsyncAnthropic
+import string
+import time
+from itertools import zip_longest
+from typing import Dict, Any, AsyncIterator, Iterator, List, Optional, Tuple
+
+import httpx
+from anthropic import APIConnectionError, APIStatusError, AsyncAnthropic
 
 from ..core.config import get_settings
 from ..core.logging import get_logger
 from ..processing.content_cleaner import ContentCleaner
+from ..processing.llm_cache import LLMCache
+from ..processing.rate_limiter import AsyncTokenBucket
 
 logger = get_logger(__name__)
 
+# Version of the summary prompts and response format; bump it whenever either changes so
+# summaries cached under the old format are not served again
+SUMMARY_FORMAT_VERSION = 2
+
+# Section headers the prompts ask for, in response order
+_SUMMARY_HEADER = "SUMMARY:"
+_KEY_INSIGHTS_HEADER = "KEY INSIGHTS:"
+_QUESTIONS_HEADER = "QUESTIONS FOR EXPERTS:"
+_TAGS_HEADER = "TAGS:"
+
+# Response parsing patterns (fallback for loosely formatted responses), compiled once at import
+_SUMMARY_RE = re.compile(
+    r'(?:SUMMARY|Summary)\s*[:.\-]\s*(.*?)(?=(?:KEY INSIGHTS|QUESTIONS(?: FOR EXPERTS)?|Tags?|$))',
+    re.DOTALL | re.IGNORECASE
+)
+_KEY_INSIGHTS_RE = re.compile(
+    r'KEY INSIGHTS\s*[:.\-]\s*(.*?)(?=QUESTIONS(?: FOR EXPERTS)?\s*[:.\-]|TAGS?\s*[:.\-]|\Z)',
+    re.DOTALL | re.IGNORECASE
+)
+_QUESTIONS_RE = re.compile(
+    r'(?:QUESTIONS(?: FOR EXPERTS)?|Questions(?: for Experts)?)\s*[:.\-]\s*(.*?)(?=(?:Tags?|$))',
+    re.DOTALL | re.IGNORECASE
+)
+_TAGS_RE = re.compile(r'(?:TAGS|Tags)\s*[:.\-]\s*(.*)$', re.DOTALL | re.IGNORECASE)
+_MD_HEADER_RE = re.compile(r'(?m)^\s*#+\s*')
+_BULLET_RE = re.compile(r'^\s*[-•*]?\s*(\d+\.|\(\d+\))?\s*')
+_NUMBERED_RE = re.compile(r'^\d+\.')
+_NUMBER_PREFIX_RE = re.compile(r'^\d+\.\s*')
+_TAG_TOKEN_RE = re.compile(r'#?[A-Za-z0-9][A-Za-z0-9_\-]+')
+
+# Rough characters-per-token ratio for English prose, used to turn token budgets into character limits
+_CHARS_PER_TOKEN = 4
+
+# HTTP statuses worth retrying (the ones the Anthropic SDK's own retries cover)
+_RETRYABLE_STATUS_CODES = frozenset({408, 409, 429})
+
+# Plain-string tag tokenizing: '#' and ',' act as separators like whitespace
+_TAG_SEPARATORS = str.maketrans("#,", "  ")
+_TAG_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+
+
+def _strip_bullet(line: str) -> str:
+    """
+    Remove a leading bullet and/or list number, as _BULLET_RE.sub('', line) does.
+
+    Plain string methods handle the usual '* ', '- ' and '1. ' prefixes; the regex
+    is only used for '(1)' style numbers and non-ASCII digits.
+    """
+    text = line.lstrip()
+    if text[:1] in ('-', '•', '*'):
+        text = text[1:].lstrip()
+
+    if text[:1] == '(':
+        return _BULLET_RE.sub('', line)
+    if text[:1].isdecimal():
+        rest = text.lstrip('0123456789')
+        if rest[:1] == '.':
+            return rest[1:].lstrip()
+        if rest[:1].isdecimal():
+            # Non-ASCII digits
+            return _BULLET_RE.sub('', line)
+    return text
+
 
 class AISummarizer:
     """
@@ -27,11 +98,55 @@ class AISummarizer:
 
     def __init__(self):
         self.settings = get_settings()
-        self.client = AsyncAnthropic(api_key=self.settings.claude_api_key)
+        # Explicit pool sized to the request concurrency; HTTP/2 multiplexes requests over one connection
+        concurrency = self.settings.ai_concurrency
+        # SDK retries would bypass the rate limiters and multiply with create_message's own
+        # retry loop, so that loop is the only retry policy
+        self.client = AsyncAnthropic(
+            api_key=self.settings.claude_api_key,
+            max_retries=0,
+            http_client=httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=concurrency * 2, max_keepalive_connections=concurrency),
+                timeout=httpx.Timeout(600.0, connect=5.0),
+            ),
+        )
         self.content_cleaner = ContentCleaner()
 
+        # Token buckets and in-flight bound shared by every Claude request made through create_message()
+        self.rate_limiter = AsyncTokenBucket(max_rate=self.settings.ai_rpm, time_period=60)
+        self.token_limiter = (AsyncTokenBucket(max_rate=self.settings.ai_tpm, time_period=60)
+                              if self.settings.ai_tpm > 0 else None)
+        self.concurrency_limiter = asyncio.Semaphore(self.settings.ai_concurrency)
+        self.max_request_attempts = 5
+
+        # Responses to identical summarization prompts are reused instead of re-requested
+        self.response_cache = LLMCache(self.settings.cache_dir / "llm_responses")
+
         # Chunk size for large content (characters)
         self.chunk_size = 10000
+        # Chunks end at a paragraph or sentence break in the last 20% of the chunk size and
+        # start with the previous chunk's last sentence (found within this many characters)
+        self.chunk_overlap = 200
+
+        # Character limit for the content embedded in a summary prompt
+        self.max_input_chars = self.settings.ai_max_input_tokens * _CHARS_PER_TOKEN
+
+        # Cleaned content below these signal levels is not sent to Claude
+        self.min_info_chars = 400
+        self.min_unique_word_ratio = 0.25
+        # Word-repetition check only for short texts; long ones naturally repeat words more
+        self.unique_word_ratio_max_words = 500
+
+        # Partial summaries this small are stitched together locally instead of merged by Claude
+        self.local_merge_max_partials = 3
+        self.local_merge_max_chars = 4000
+        # Stitched summaries keep what the final prompts ask for: up to 6 bullets and 3 key insights
+        self.stitched_max_bullets = 6
+        self.stitched_max_insights = 3
+
+        # Seconds between status checks while a message batch is processing
+        self.batch_poll_interval = 30.0
 
         # Priority tags for better summarization
         self.priority_tags = [
@@ -40,6 +155,167 @@ class AISummarizer:
             "gaming", "china", "geopolitics", "technology", "programming"
         ]
 
+        # Forms of the priority tags used by every prompt and response, built once
+        self._priority_tags_text = ", ".join(self.priority_tags)
+        self._priority_tag_set = frozenset(tag.lower() for tag in self.priority_tags)
+
+    async def aclose(self):
+        """Close the Claude client and its HTTP connections."""
+        await self.client.close()
+
+    async def create_message(self, **kwargs):
+        """
+        Send a Claude messages request through the rate and concurrency limiters.
+
+        With settings.ai_tpm set, each request also waits until the token budget is
+        out of debt and is then charged its actual input + output tokens. Requests
+        rejected with HTTP 429, 5xx or a connection error are retried after the
+        server's retry-after delay, or with exponential backoff and jitter; the
+        concurrency slot is released while backing off, and each retry goes through
+        the limiters again.
+
+        Args:
+            **kwargs: Arguments for client.messages.create
+
+        Returns:
+            Claude API response
+        """
+        for attempt in range(1, self.max_request_attempts + 1):
+            if self.token_limiter is not None:
+                await self.token_limiter.acquire()
+
+            async with self.rate_limiter, self.concurrency_limiter:
+                try:
+                    response = await self.client.messages.create(**kwargs)
+                except (APIStatusError, APIConnectionError) as e:
+                    if attempt == self.max_request_attempts or not self._is_retryable(e):
+                        raise
+                    delay = self._retry_delay(e, attempt)
+                else:
+                    self._charge_usage(response.usage)
+                    return response
+
+            await asyncio.sleep(delay)
+
+    async def stream_message(self, **kwargs) -> AsyncIterator[str]:
+        """
+        Stream a Claude messages request's text through the same limiters as create_message().
+
+        Failed requests are retried like in create_message(), but only before the
+        first text delta, so nothing already yielded is repeated.
+
+        Args:
+            **kwargs: Arguments for client.messages.stream
+
+        Yields:
+            Response text deltas as they arrive
+        """
+        yielded = False
+        for attempt in range(1, self.max_request_attempts + 1):
+            if self.token_limiter is not None:
+                await self.token_limiter.acquire()
+
+            async with self.rate_limiter, self.concurrency_limiter:
+                try:
+                    async with self.client.messages.stream(**kwargs) as stream:
+                        async for text in stream.text_stream:
+                            yielded = True
+                            yield text
+                        message = await stream.get_final_message()
+                except (APIStatusError, APIConnectionError) as e:
+                    if yielded or attempt == self.max_request_attempts or not self._is_retryable(e):
+                        raise
+                    delay = self._retry_delay(e, attempt)
+                else:
+                    self._charge_usage(message.usage)
+                    return
+
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """Whether a failed Claude request is worth retrying: connection errors, 408/409/429 and 5xx."""
+        if isinstance(error, APIConnectionError):
+            return True
+        return error.status_code in _RETRYABLE_STATUS_CODES or error.status_code >= 500
+
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        """Seconds to back off after a failed request: the server's retry-after, else exponential with jitter."""
+        delay = self._retry_after_seconds(error)
+        if delay is None:
+            delay = random.uniform(0, min(30.0, 2.0 ** (attempt - 1)))
+        logger.warning(f"Claude API request failed ({error}), retrying in {delay:.1f}s "
+                       f"(attempt {attempt}/{self.max_request_attempts})")
+        return delay
+
+    def _charge_usage(self, usage):
+        """Charge a finished request's actual tokens to the token budget, if one is set."""
+        if self.token_limiter is not None:
+            # acquire() took one token; charge the rest of the actual usage
+            self.token_limiter.consume(usage.input_tokens + usage.output_tokens - 1)
+
+    @staticmethod
+    def _retry_after_seconds(error: Exception) -> Optional[float]:
+        """Delay requested by the server's retry-after header, if any."""
+        try:
+            return max(0.0, float(error.response.headers["retry-after"]))
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return None
+
+    async def _call_claude(self, prompt: str, max_tokens: int) -> str:
+        """
+        Get Claude's response text for a single-message prompt, served from the response cache when possible.
+
+        Args:
+            prompt: User message content
+            max_tokens: Response token limit
+
+        Returns:
+            Response text
+        """
+        cache_key = LLMCache.make_key(model=self.settings.claude_model, prompt=prompt, max_tokens=max_tokens)
+        cached = await self.response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        response = await self.create_message(
+            model=self.settings.claude_model,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}]
+        )
+
+        text = response.content[0].text
+        await self.response_cache.set(cache_key, text)
+        return text
+
+    async def _stream_claude(self, prompt: str, max_tokens: int) -> AsyncIterator[str]:
+        """
+        Stream Claude's response text for a single-message prompt; a cached response is yielded whole.
+
+        Args:
+            prompt: User message content
+            max_tokens: Response token limit
+
+        Yields:
+            Response text deltas
+        """
+        cache_key = LLMCache.make_key(model=self.settings.claude_model, prompt=prompt, max_tokens=max_tokens)
+        cached = await self.response_cache.get(cache_key)
+        if cached is not None:
+            yield cached
+            return
+
+        parts: List[str] = []
+        async for text in self.stream_message(
+            model=self.settings.claude_model,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}]
+        ):
+            parts.append(text)
+            yield text
+
+        await self.response_cache.set(cache_key, "".join(parts))
+
     async def test_api(self) -> bool:
         """
         Test Claude API connection.
@@ -48,7 +324,7 @@ class AISummarizer:
             bool: True if API is working, False otherwise
         """
         try:
-            response = await self.client.messages.create(
+            response = await self.create_message(
                 model=self.settings.claude_model,
                 max_tokens=50,
                 messages=[{"role": "user", "content": "Hello, please respond with 'API test successful'"}]
@@ -66,12 +342,15 @@ class AISummarizer:
             logger.error(f"Claude API test failed: {e}")
             return False
 
-    async def summarize_content(self, content_item: Dict[str, Any]) -> Dict[str, Any]:
+    async def summarize_content(self, content_item: Dict[str, Any],
+                                cleaned_content: Optional[str] = None) -> Dict[str, Any]:
         """
         Summarize a content item using Claude API.
 
         Args:
             content_item: Dictionary with content information
+            cleaned_content: The item's content already run through clean_for_ai_processing
+                (cleaned here when not given)
 
         Returns:
             Dictionary with summary, insights, questions, and tags
@@ -82,32 +361,28 @@ class AISummarizer:
             return self._create_empty_summary(content_item)
 
         # Clean content for AI processing
-        cleaned_content = self.content_cleaner.clean_for_ai_processing(content)
+        if cleaned_content is None:
+            cleaned_content = self.content_cleaner.clean_for_ai_processing(content)
+        if self._is_low_signal(cleaned_content):
+            return self._create_empty_summary(content_item, reason="low_signal")
 
         # Determine content type for appropriate prompt
-        source_type = content_item.get("source_type", "newsletter")
-        is_podcast = "podcast" in source_type.lower() or "podcast" in content_item.get("source", "").lower()
+        is_podcast = self._is_podcast(content_item)
 
         try:
-            # Break content into chunks if needed
-            chunks = self._chunk_content(cleaned_content)
+            # Only content over the chunk size is split; short content goes through as is
+            chunk_count = self._chunk_count(cleaned_content)
 
-            if len(chunks) == 1:
+            if chunk_count == 1:
                 # Single chunk processing
-                summary_data = await self._summarize_single_chunk(chunks[0], content_item, is_podcast)
+                summary_data = await self._summarize_single_chunk(cleaned_content, content_item, is_podcast)
             else:
                 # Multi-chunk processing
+                chunks = list(self._chunk_content(cleaned_content))
                 summary_data = await self._summarize_multiple_chunks(chunks, content_item, is_podcast)
 
             # Add metadata
-            summary_data.update({
-                "title": content_item.get("title", "Unknown"),
-                "source": content_item.get("source", "Unknown"),
-                "date": content_item.get("date", ""),
-                "source_type": source_type,
-                "content_length": len(content),
-                "chunks_processed": len(chunks)
-            })
+            self._add_summary_metadata(summary_data, content_item, chunk_count)
 
             logger.info(f"Successfully summarized {content_item.get('source', 'unknown')}")
             return summary_data
@@ -116,74 +391,398 @@ class AISummarizer:
             logger.error(f"Error summarizing content from {content_item.get('source', 'unknown')}: {e}")
             return self._create_error_summary(content_item, str(e))
 
-    def _chunk_content(self, content: str) -> List[str]:
-        """Break content into manageable chunks."""
-        if len(content) <= self.chunk_size:
-            return [content]
+    async def summarize_batch(self, content_items: List[Dict[str, Any]],
+                              cleaned_contents: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Summarize many content items through the Message Batches API.
+
+        Batched requests cost half as much but finish asynchronously, so this suits
+        bulk runs. Inputs below settings.ai_batch_min_items, or a failing batch API,
+        fall back to concurrent summarize_content() calls.
+
+        Args:
+            content_items: List of content item dictionaries
+            cleaned_contents: Each item's content already run through clean_for_ai_processing,
+                in the same order (cleaned here when not given)
+
+        Returns:
+            List of summary dictionaries, in the same order as content_items
+        """
+        if cleaned_contents is None:
+            cleaned_contents = [None] * len(content_items)
+
+        if len(content_items) >= self.settings.ai_batch_min_items:
+            try:
+                return await self._summarize_via_batches(content_items, cleaned_contents)
+            except Exception as e:
+                logger.warning(f"Message batch summarization failed, summarizing items individually: {e}")
+
+        return list(await asyncio.gather(*(
+            self.summarize_content(item, cleaned) for item, cleaned in zip(content_items, cleaned_contents)
+        )))
+
+    async def _summarize_via_batches(self, content_items: List[Dict[str, Any]],
+                                     cleaned_contents: List[Optional[str]]) -> List[Dict[str, Any]]:
+        """Summarize items with one message batch, plus a second one merging multi-chunk items."""
+        summaries: List[Optional[Dict[str, Any]]] = [None] * len(content_items)
+
+        # Cleaning and prompt building for the whole batch is CPU work; one worker-thread
+        # hop keeps it off the event loop
+        plans, requests = await asyncio.to_thread(self._plan_batch_requests, content_items,
+                                                  cleaned_contents, summaries)
+
+        responses = await self._run_message_batch(requests) if requests else {}
+
+        # Multi-chunk items merge their partial summaries in a second batch
+        merge_requests = []
+        merge_partials: Dict[int, List[str]] = {}
+        for index, (chunk_count, is_podcast) in plans.items():
+            if chunk_count == 1:
+                continue
+            partials = [responses.get(f"item-{index}-chunk-{n}") for n in range(1, chunk_count + 1)]
+            if all(partial is not None for partial in partials):
+                stitched = self._stitch_partial_summaries(partials)
+                if stitched is not None:
+                    summaries[index] = self._add_summary_metadata(stitched, content_items[index], chunk_count)
+                    continue
+                combined_text = "\n\n---CHUNK BREAK---\n\n".join(partials)
+                merge_prompt = self._build_merge_prompt(combined_text, content_items[index], is_podcast)
+                merge_requests.append(self._batch_request(f"item-{index}", merge_prompt, self.settings.max_tokens))
+                merge_partials[index] = partials
+
+        if merge_requests:
+            try:
+                responses.update(await self._run_message_batch(merge_requests))
+            except Exception as e:
+                # The first round is paid for; only the merges are redone, as direct requests
+                logger.warning(f"Merge message batch failed, merging {len(merge_requests)} items directly: {e}")
+                await self._merge_directly(merge_partials, content_items, plans, summaries)
+
+        for index, (chunk_count, _) in plans.items():
+            if summaries[index] is not None:
+                continue  # Stitched locally above
+            item = content_items[index]
+            response_text = responses.get(f"item-{index}")
+            if response_text is None:
+                summaries[index] = self._create_error_summary(item, "Message batch request did not succeed")
+            else:
+                summaries[index] = self._add_summary_metadata(self._parse_claude_response(response_text),
+                                                              item, chunk_count)
+
+        logger.info(f"Summarized {len(content_items)} items via message batches")
+        return summaries
+
+    async def _merge_directly(self, merge_partials: Dict[int, List[str]], content_items: List[Dict[str, Any]],
+                              plans: Dict[int, Tuple[int, bool]],
+                              summaries: List[Optional[Dict[str, Any]]]) -> None:
+        """Merge first-round partial summaries with direct requests, filling summaries in place."""
+        async def merge(index: int, partials: List[str]) -> None:
+            item = content_items[index]
+            chunk_count, is_podcast = plans[index]
+            try:
+                merged = await self._merge_partial_summaries(partials, item, is_podcast)
+                summaries[index] = self._add_summary_metadata(merged, item, chunk_count)
+            except Exception as e:
+                logger.error(f"Error merging partial summaries for {item.get('source', 'unknown')}: {e}")
+                summaries[index] = self._create_error_summary(item, str(e))
+
+        await asyncio.gather(*(merge(index, partials) for index, partials in merge_partials.items()))
+
+    def _plan_batch_requests(self, content_items: List[Dict[str, Any]],
+                             cleaned_contents: List[Optional[str]],
+                             summaries: List[Optional[Dict[str, Any]]]
+                             ) -> Tuple[Dict[int, Tuple[int, bool]], List[Dict[str, Any]]]:
+        """
+        Build the first-round batch requests (blocking; run via asyncio.to_thread).
+
+        Items without content get their empty summary in summaries directly. Items whose
+        cleaned_contents entry is None are cleaned here.
+
+        Returns:
+            (plans, requests): plans maps item index -> (chunk count, is_podcast)
+        """
+        plans: Dict[int, Tuple[int, bool]] = {}
+        requests: List[Dict[str, Any]] = []
+
+        for index, (item, cleaned_content) in enumerate(zip(content_items, cleaned_contents)):
+            content = item.get("content", "")
+            if not content:
+                summaries[index] = self._create_empty_summary(item)
+                continue
+
+            is_podcast = self._is_podcast(item)
+            if cleaned_content is None:
+                cleaned_content = self.content_cleaner.clean_for_ai_processing(content)
+            if self._is_low_signal(cleaned_content):
+                summaries[index] = self._create_empty_summary(item, reason="low_signal")
+                continue
+            chunk_count = self._chunk_count(cleaned_content)
+            plans[index] = (chunk_count, is_podcast)
+
+            # Chunks are sliced as prompts are built, so they are not held while the batch runs
+            if chunk_count == 1:
+                prompt = self._build_prompt(cleaned_content, item, is_podcast, is_final=True)
+                requests.append(self._batch_request(f"item-{index}", prompt, self.settings.max_tokens))
+            else:
+                for chunk_number, chunk in enumerate(self._chunk_content(cleaned_content), start=1):
+                    prompt = self._build_prompt(chunk, item, is_podcast, is_final=False,
+                                                chunk_info=(chunk_number, chunk_count))
+                    requests.append(self._batch_request(f"item-{index}-chunk-{chunk_number}", prompt, 1500))
+
+        return plans, requests
+
+
+    def _batch_request(self, custom_id: str, prompt: str, max_tokens: int) -> Dict[str, Any]:
+        """Build one Message Batches API request entry."""
+        return {
+            "custom_id": custom_id,
+            "params": {
+                "model": self.settings.claude_model,
+                "max_tokens": max_tokens,
+                "messages": [{"role": "user", "content": prompt}]
+            }
+        }
+
+    async def _run_message_batch(self, requests: List[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Submit a message batch, wait for it to end, and collect the response texts.
+
+        Args:
+            requests: Batch request entries from _batch_request()
+
+        Returns:
+            Response text by custom_id (requests that did not succeed are left out)
+
+        Raises:
+            TimeoutError: The batch did not end within settings.ai_batch_max_wait (it is cancelled)
+        """
+        batch = await self.client.messages.batches.create(requests=requests)
+        logger.info(f"Submitted message batch {batch.id} with {len(requests)} requests")
+
+        deadline = time.monotonic() + self.settings.ai_batch_max_wait
+        try:
+            while batch.processing_status != "ended":
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"Message batch {batch.id} did not end within "
+                                       f"{self.settings.ai_batch_max_wait}s")
+                await asyncio.sleep(self.batch_poll_interval)
+                batch = await self.client.messages.batches.retrieve(batch.id)
+        except (TimeoutError, asyncio.CancelledError):
+            # Don't leave an abandoned batch running (and billing)
+            await self._cancel_message_batch(batch.id)
+            raise
+
+        responses: Dict[str, str] = {}
+        async for entry in await self.client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                responses[entry.custom_id] = entry.result.message.content[0].text
+            else:
+                logger.warning(f"Message batch request {entry.custom_id} {entry.result.type}")
+
+        return responses
+
+    async def _cancel_message_batch(self, batch_id: str) -> None:
+        """Cancel a message batch, logging rather than raising on failure."""
+        try:
+            await self.client.messages.batches.cancel(batch_id)
+            logger.info(f"Cancelled message batch {batch_id}")
+        except Exception as e:
+            logger.warning(f"Could not cancel message batch {batch_id}: {e}")
+
+    def _is_low_signal(self, cleaned_content: str) -> bool:
+        """
+        Whether cleaned content is too thin to be worth a Claude request.
+
+        Catches teaser stubs ("Subscribe to read more") and short repeated boilerplate:
+        fewer than min_info_chars alphanumeric characters, or a short text whose
+        unique-word ratio is below min_unique_word_ratio.
+        """
+        info_chars = sum(map(str.isalnum, cleaned_content))
+        if info_chars < self.min_info_chars:
+            logger.debug(f"Skipping low-signal content: {info_chars} informative characters")
+            return True
+
+        words = cleaned_content.lower().split()
+        if len(words) <= self.unique_word_ratio_max_words:
+            unique_word_ratio = len(set(words)) / max(1, len(words))
+            if unique_word_ratio < self.min_unique_word_ratio:
+                logger.debug(f"Skipping low-signal content: unique word ratio {unique_word_ratio:.2f}")
+                return True
+
+        return False
+
+    @staticmethod
+    def _is_podcast(content_item: Dict[str, Any]) -> bool:
+        """Whether the item should be summarized with the podcast prompts."""
+        source_type = content_item.get("source_type", "newsletter")
+        return "podcast" in source_type.lower() or "podcast" in content_item.get("source", "").lower()
+
+    @staticmethod
+    def _add_summary_metadata(summary_data: Dict[str, Any], content_item: Dict[str, Any],
+                              chunks_processed: int) -> Dict[str, Any]:
+        """Attach item metadata to parsed summary data (in place) and return it."""
+        summary_data.update({
+            "title": content_item.get("title", "Unknown"),
+            "source": content_item.get("source", "Unknown"),
+            "date": content_item.get("date", ""),
+            "source_type": content_item.get("source_type", "newsletter"),
+            "content_length": len(content_item.get("content", "")),
+            "chunks_processed": chunks_processed
+        })
+        return summary_data
+
+    def _chunk_count(self, content: str) -> int:
+        """Number of chunks _chunk_content() yields for this content."""
+        return len(self._chunk_bounds(content))
+
+    def _chunk_content(self, content: str) -> Iterator[str]:
+        """Break content into manageable chunks, slicing each one only when it is consumed."""
+        for start, end in self._chunk_bounds(content):
+            yield content[start:end]
+
+    def _chunk_bounds(self, content: str) -> List[Tuple[int, int]]:
+        """
+        (start, end) offsets of each chunk, at most chunk_size characters long.
+
+        A chunk ends at the last paragraph break, else sentence end, in its final 20%,
+        and only falls back to a hard cut when neither exists there.
+        """
+        bounds: List[Tuple[int, int]] = []
+        start = 0
+        while len(content) - start > self.chunk_size:
+            window_start = start + int(self.chunk_size * 0.8)
+            window_end = start + self.chunk_size
+
+            end = content.rfind("\n\n", window_start, window_end)
+            if end < 0:
+                end = content.rfind(". ", window_start, window_end)
+                end = end + 1 if end >= 0 else window_end
+            bounds.append((start, end))
 
-        chunks = []
-        for i in range(0, len(content), self.chunk_size):
-            chunks.append(content[i:i + self.chunk_size])
+            # Carry the last sentence over for context, when one starts close enough to the cut
+            sentence_at = content.rfind(". ", end - self.chunk_overlap, end)
+            start = sentence_at + 2 if sentence_at >= 0 else end
 
-        return chunks
+        bounds.append((start, len(content)))
+        return bounds
 
     async def _summarize_single_chunk(self, content: str, content_item: Dict[str, Any], is_podcast: bool) -> Dict[str, Any]:
-        """Summarize a single chunk of content."""
+        """Summarize a single chunk of content (streamed, so long responses don't hit the request timeout)."""
         prompt = self._build_prompt(content, content_item, is_podcast, is_final=True)
 
-        response = await self.client.messages.create(
-            model=self.settings.claude_model,
-            max_tokens=self.settings.max_tokens,
-            messages=[{"role": "user", "content": prompt}]
-        )
-
-        full_response = response.content[0].text
-        return self._parse_claude_response(full_response)
+        parts = [text async for text in self._stream_claude(prompt, self.settings.max_tokens)]
+        return self._parse_claude_response("".join(parts))
 
     async def _summarize_multiple_chunks(self, chunks: List[str], content_item: Dict[str, Any], is_podcast: bool) -> Dict[str, Any]:
-        """Summarize multiple chunks and merge the results."""
-        partial_summaries = []
-
-        # Process each chunk
+        """Summarize multiple chunks concurrently and merge the results."""
+        # Identical chunks (repeated boilerplate or segments) are summarized once, using the
+        # prompt of their first occurrence; the dict keeps first-occurrence order
+        prompts: Dict[str, str] = {}
         for idx, chunk in enumerate(chunks, start=1):
-            prompt = self._build_prompt(chunk, content_item, is_podcast, is_final=False, chunk_info=(idx, len(chunks)))
+            if chunk not in prompts:
+                prompts[chunk] = self._build_prompt(chunk, content_item, is_podcast, is_final=False,
+                                                    chunk_info=(idx, len(chunks)))
 
-            response = await self.client.messages.create(
-                model=self.settings.claude_model,
-                max_tokens=1500,  # Smaller for partial summaries
-                messages=[{"role": "user", "content": prompt}]
-            )
-
-            partial_response = response.content[0].text
-            partial_summaries.append(partial_response)
+        # Chunks are independent; create_message bounds concurrency and retries 429s
+        responses = await asyncio.gather(
+            *(self._call_claude(prompt, 1500) for prompt in prompts.values())  # Smaller for partial summaries
+        )
 
-            # Brief pause between API calls
-            await asyncio.sleep(1)
+        # Fan results back out to chunk order, as the merge expects
+        partial_by_chunk = dict(zip(prompts, responses))
+        partial_summaries = [partial_by_chunk[chunk] for chunk in chunks]
 
         # Merge partial summaries
         return await self._merge_partial_summaries(partial_summaries, content_item, is_podcast)
 
     async def _merge_partial_summaries(self, partial_summaries: List[str], content_item: Dict[str, Any], is_podcast: bool) -> Dict[str, Any]:
-        """Merge multiple partial summaries into a final summary."""
+        """
+        Merge multiple partial summaries into a final summary.
+
+        A few short partials are stitched together locally without a merge request.
+        Otherwise more than two partials are first reduced pairwise, one concurrent
+        layer at a time, so no merge prompt carries more than two inputs.
+        """
+        stitched = self._stitch_partial_summaries(partial_summaries)
+        if stitched is not None:
+            return stitched
+
+        while len(partial_summaries) > 2:
+            pairs = [partial_summaries[i:i + 2] for i in range(0, len(partial_summaries) - 1, 2)]
+            merged = await asyncio.gather(*(self._merge_pair(a, b, content_item, is_podcast) for a, b in pairs))
+            # An odd partial out carries over to the next layer unchanged
+            partial_summaries = list(merged) + partial_summaries[len(pairs) * 2:]
+
         combined_text = "\n\n---CHUNK BREAK---\n\n".join(partial_summaries)
 
         merge_prompt = self._build_merge_prompt(combined_text, content_item, is_podcast)
 
-        response = await self.client.messages.create(
-            model=self.settings.claude_model,
-            max_tokens=self.settings.max_tokens,
-            messages=[{"role": "user", "content": merge_prompt}]
-        )
-
-        full_response = response.content[0].text
+        full_response = await self._call_claude(merge_prompt, self.settings.max_tokens)
         return self._parse_claude_response(full_response)
 
+    def _stitch_partial_summaries(self, partial_summaries: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        Combine a few short, well-formed partial summaries without calling Claude.
+
+        Bullets and key insights are taken round-robin across chunks, so every chunk is
+        represented within the caps; questions are concatenated in chunk order (at most 3).
+        Duplicates are dropped and tags go through _process_tags.
+
+        Returns:
+            Parsed-summary dictionary, or None when the partials need a real merge
+        """
+        if (len(partial_summaries) > self.local_merge_max_partials
+                or sum(len(p) for p in partial_summaries) >= self.local_merge_max_chars):
+            return None
+
+        parsed = [self._parse_claude_response(partial) for partial in partial_summaries]
+        if any("error" in p or not p["insights"] for p in parsed):
+            return None
+
+        def unique(texts: List[str]) -> List[str]:
+            # Keyed on case- and whitespace-normalized text; first occurrence wins
+            seen: Dict[str, str] = {}
+            for text in texts:
+                seen.setdefault(" ".join(text.lower().split()), text)
+            return list(seen.values())
+
+        def round_robin(field: str) -> List[str]:
+            # First item of every chunk, then the second of every chunk, ...
+            return [text for group in zip_longest(*(p[field] for p in parsed)) for text in group if text is not None]
+
+        insights = unique(round_robin("insights"))[:self.stitched_max_bullets]
+        strategic_insights = unique(round_robin("strategic_insights"))[:self.stitched_max_insights]
+        questions = unique([question for p in parsed for question in p["questions"]])[:3]
+
+        return {
+            "summary": "\n".join(f"* {insight}" for insight in insights),
+            "questions": questions,
+            "tags": self._process_tags([tag for p in parsed for tag in p["tags"]]),
+            "insights": insights,
+            "strategic_insights": strategic_insights,
+            "raw_response": "\n\n---CHUNK BREAK---\n\n".join(partial_summaries)
+        }
+
+    async def _merge_pair(self, first: str, second: str, content_item: Dict[str, Any], is_podcast: bool) -> str:
+        """Merge two partial summaries into an intermediate one (capped like chunk summaries)."""
+        combined_text = f"{first}\n\n---CHUNK BREAK---\n\n{second}"
+        merge_prompt = self._build_merge_prompt(combined_text, content_item, is_podcast)
+        return await self._call_claude(merge_prompt, 1500)
+
+    def _truncate_content(self, content: str) -> str:
+        """Cut content to the prompt's input budget, at a word boundary near the limit when there is one."""
+        if len(content) <= self.max_input_chars:
+            return content
+
+        cut = content.rfind(" ", int(self.max_input_chars * 0.9), self.max_input_chars)
+        return content[:cut if cut >= 0 else self.max_input_chars]
+
     def _build_prompt(self, content: str, content_item: Dict[str, Any], is_podcast: bool,
                       is_final: bool = True, chunk_info: Optional[tuple] = None) -> str:
         """Build appropriate prompt based on content type and processing stage."""
         source = content_item.get("source", "Unknown")
         title = content_item.get("title", "Unknown")
-        priority_tags_formatted = ", ".join(self.priority_tags)
+        priority_tags_formatted = self._priority_tags_text
 
         if is_podcast:
             if is_final:
@@ -230,12 +829,17 @@ class AISummarizer:
        - Focus on actionable intelligence valuable for informed decision-making
        - Extract meaningful data points and significant revelations across any domain
 
-    2. Then include "QUESTIONS FOR EXPERTS:" followed by 2-3 numbered questions (use simple 1. 2. 3. format)
+    2. Then include "KEY INSIGHTS:" followed by 2-3 numbered insights worth remembering long-term (use simple 1. 2. 3. format)
+       - Each insight must be a specific, self-contained fact with numbers, organizations, or concrete details
+       - Prefer strategic revelations, unexpected findings, and data points useful for future decisions
+       - Avoid topic descriptions such as "Discussion focused on..." or "Coverage of..."
+
+    3. Then include "QUESTIONS FOR EXPERTS:" followed by 2-3 numbered questions (use simple 1. 2. 3. format)
        - Probe deeper implications of specific findings
        - Frame for domain experts who could validate or challenge the insights
        - Focus on implications valuable for researchers, analysts, or practitioners in the relevant field
 
-    3. End with "TAGS:" followed by 3-5 relevant tags
+    4. End with "TAGS:" followed by 3-5 relevant tags
        - Priority categories: {priority_tags}
        - Include specific technologies, organizations, research areas, or key concepts mentioned
 
@@ -243,7 +847,7 @@ class AISummarizer:
 
     Here's the content to analyze:
 
-    {content[:15000]}
+    {self._truncate_content(content)}
     """
 
     def _build_podcast_prompt(self, content: str, source: str, title: str, priority_tags: str) -> str:
@@ -277,12 +881,17 @@ class AISummarizer:
        - Focus on information valuable for informed decision-making across any domain
        - Extract actual facts and claims, not discussion topics
 
-    2. Then include "QUESTIONS FOR EXPERTS:" followed by 2-3 numbered questions (use simple 1. 2. 3. format)
+    2. Then include "KEY INSIGHTS:" followed by 2-3 numbered insights worth remembering long-term (use simple 1. 2. 3. format)
+       - Each insight must be a specific, self-contained fact with numbers, organizations, or concrete details
+       - Prefer strategic revelations, unexpected findings, and data points useful for future decisions
+       - Avoid topic descriptions such as "Discussion focused on..." or "Coverage of..."
+
+    3. Then include "QUESTIONS FOR EXPERTS:" followed by 2-3 numbered questions (use simple 1. 2. 3. format)
        - Probe deeper into implications of specific claims or predictions
        - Frame for domain experts who could validate or challenge the insights
        - Focus on research depth, methodological questions, or practical implications
 
-    3. End with "TAGS:" followed by 3-5 relevant tags
+    4. End with "TAGS:" followed by 3-5 relevant tags
        - Priority categories: {priority_tags}
        - Include specific technologies, organizations, research areas, or key concepts mentioned
 
@@ -290,7 +899,7 @@ class AISummarizer:
 
     Here's the content to analyze:
 
-    {content[:15000]}
+    {self._truncate_content(content)}
     """
 
     def _build_merge_prompt(self, combined_text: str, content_item: Dict[str, Any], is_podcast: bool) -> str:
@@ -298,7 +907,7 @@ class AISummarizer:
         source = content_item.get("source", "Unknown")
         title = content_item.get("title", "Unknown")
         content_type = "podcast episode" if is_podcast else "article"
-        priority_tags_formatted = ", ".join(self.priority_tags)
+        priority_tags_formatted = self._priority_tags_text
 
         return f"""
     You are an expert analyst synthesizing strategic insights from multiple content chunks across all domains.
@@ -320,11 +929,16 @@ class AISummarizer:
        - Each bullet should provide substantial informational value
        - Connect developments to broader implications within the relevant domain
 
-    2. Then include "QUESTIONS FOR EXPERTS:" followed by 2-3 numbered questions (use simple 1. 2. 3. format)
+    2. Then include "KEY INSIGHTS:" followed by 2-3 numbered insights worth remembering long-term (use simple 1. 2. 3. format)
+       - Each insight must be a specific, self-contained fact with numbers, organizations, or concrete details
+       - Prefer strategic revelations, unexpected findings, and data points useful for future decisions
+       - Avoid topic descriptions such as "Discussion focused on..." or "Coverage of..."
+
+    3. Then include "QUESTIONS FOR EXPERTS:" followed by 2-3 numbered questions (use simple 1. 2. 3. format)
        - Combine and refine questions into the most substantive inquiries
        - Focus on implications valuable to domain experts and researchers
 
-    3. End with "TAGS:" followed by 3-5 relevant tags
+    4. End with "TAGS:" followed by 3-5 relevant tags
        - Synthesize tags representing overall themes
        - Priority categories: {priority_tags_formatted}
 
@@ -352,8 +966,10 @@ class AISummarizer:
     1. Begin with "SUMMARY:" followed by 2-4 bullet points (use asterisks * for bullets)
        - Focus on specific findings with numbers, percentages, or concrete details
        - Include organization names and significant implications where present
-    2. Then include "QUESTIONS FOR EXPERTS:" followed by 1-2 numbered questions (use simple 1. 2. format)
-    3. End with "TAGS:" followed by 2-3 relevant tags.
+    2. Then include "KEY INSIGHTS:" followed by 1-2 numbered insights worth remembering long-term (use simple 1. 2. format)
+       - Each insight must be a specific, self-contained fact with numbers, organizations, or concrete details
+    3. Then include "QUESTIONS FOR EXPERTS:" followed by 1-2 numbered questions (use simple 1. 2. format)
+    4. End with "TAGS:" followed by 2-3 relevant tags.
 
     For tags, consider these priority categories: {priority_tags}
 
@@ -379,8 +995,10 @@ class AISummarizer:
     1. Begin with "SUMMARY:" followed by 2-4 bullet points (use asterisks * for bullets)
        - Each bullet should contain specific claims, facts, or quantified insights
        - Include exact numbers, percentages, and concrete details where mentioned
-    2. Then include "QUESTIONS FOR EXPERTS:" followed by 1-2 numbered questions (use simple 1. 2. format)
-    3. End with "TAGS:" followed by 2-3 relevant tags.
+    2. Then include "KEY INSIGHTS:" followed by 1-2 numbered insights worth remembering long-term (use simple 1. 2. format)
+       - Each insight must be a specific, self-contained fact with numbers, organizations, or concrete details
+    3. Then include "QUESTIONS FOR EXPERTS:" followed by 1-2 numbered questions (use simple 1. 2. format)
+    4. End with "TAGS:" followed by 2-3 relevant tags.
 
     For tags, consider these priority categories: {priority_tags}
 
@@ -393,7 +1011,7 @@ class AISummarizer:
 
     def _parse_claude_response(self, response_text: str) -> Dict[str, Any]:
         """
-        Parse Claude's response and extract summary, questions, and tags.
+        Parse Claude's response and extract summary, key insights, questions, and tags.
 
         Args:
             response_text: Raw response from Claude
@@ -402,47 +1020,61 @@ class AISummarizer:
             Dictionary with parsed components
         """
         try:
-            # Extract sections (case-insensitive)
-            summary_match = re.search(
-                r'(?:SUMMARY|Summary)\s*[:.\-]\s*(.*?)(?=(?:QUESTIONS(?: FOR EXPERTS)?|Tags?|$))',
-                response_text, re.DOTALL | re.IGNORECASE
-            )
-            questions_match = re.search(
-                r'(?:QUESTIONS(?: FOR EXPERTS)?|Questions(?: for Experts)?)\s*[:.\-]\s*(.*?)(?=(?:Tags?|$))',
-                response_text, re.DOTALL | re.IGNORECASE
-            )
-            tags_match = re.search(
-                r'(?:TAGS|Tags)\s*[:.\-]\s*(.*)$',
-                response_text, re.DOTALL | re.IGNORECASE
-            )
-
-            summary = (summary_match.group(1).strip() if summary_match else "No summary available.")
+            # Well-formed responses are sliced with plain substring searches; anything
+            # else falls back to the tolerant (case-insensitive) regexes
+            sections = self._split_sections(response_text)
+            if sections is None:
+                sections = tuple(
+                    match.group(1) if match else None
+                    for match in (_SUMMARY_RE.search(response_text), _KEY_INSIGHTS_RE.search(response_text),
+                                  _QUESTIONS_RE.search(response_text), _TAGS_RE.search(response_text))
+                )
+            summary_text, key_insights_text, questions_text, tags_text = sections
+
+            summary = (summary_text.strip() if summary_text is not None else "No summary available.")
             # Normalize markdown noise
-            summary = re.sub(r'(?m)^\s*#+\s*', '', summary).strip()
+            summary = _MD_HEADER_RE.sub('', summary).strip()
+
+            # Bullet and numbered summary lines are the item's insights
+            insights: List[str] = []
+            for line in summary.splitlines():
+                line = line.strip()
+                if (line.startswith(('*', '-', '•')) or _NUMBERED_RE.match(line)) and len(line) > 3:
+                    insights.append(_strip_bullet(line).strip())
 
             # Questions: split by line, strip numbering/bullets
             questions: List[str] = []
-            if questions_match:
-                for line in questions_match.group(1).splitlines():
+            if questions_text:
+                for line in questions_text.splitlines():
                     line = line.strip()
                     if not line:
                         continue
-                    q = re.sub(r'^\s*[-•*]?\s*(\d+\.|\(\d+\))?\s*', '', line).strip()
+                    q = _strip_bullet(line).strip()
                     if q:
                         questions.append(q)
 
+            # Key insights: numbered items, with wrapped lines joined onto their item
+            insight_parts: List[List[str]] = []
+            if key_insights_text:
+                for line in key_insights_text.splitlines():
+                    line = line.strip()
+                    if _NUMBERED_RE.match(line):
+                        insight_parts.append([_NUMBER_PREFIX_RE.sub('', line)])
+                    elif line and insight_parts:
+                        insight_parts[-1].append(line)
+            strategic_insights = [" ".join(parts) for parts in insight_parts]
+
             # Tags: accept '#tag' or words separated by commas/spaces
             tags: List[str] = []
-            if tags_match:
-                raw = re.sub(r'(?m)^\s*#+\s*', '', tags_match.group(1)).strip()
-                pieces = re.findall(r'#?[A-Za-z0-9][A-Za-z0-9_\-]+', raw)
-                tags = self._process_tags([p.lstrip('#') for p in pieces])
+            if tags_text:
+                tags = self._process_tags(self._tokenize_tags(tags_text))
 
             return {
                 "summary": summary,
                 "questions": questions,
                 "tags": tags,
-                "insights": self._extract_insights_from_summary(summary),
+                "insights": insights,
+                "strategic_insights": strategic_insights,
                 "raw_response": response_text
             }
 
@@ -457,30 +1089,68 @@ class AISummarizer:
                 "error": str(e)
             }
 
+    @staticmethod
+    def _split_sections(response_text: str) -> Optional[Tuple[str, Optional[str], str, str]]:
+        """
+        Slice a response that uses the exact prompt headers, in order, into its sections.
+
+        Args:
+            response_text: Raw response from Claude
+
+        Returns:
+            (summary, key_insights, questions, tags) texts, with key_insights None when that
+            section is absent; None if a required header is missing or out of order
+        """
+        summary_at = response_text.find(_SUMMARY_HEADER)
+        if summary_at < 0:
+            return None
+        summary_end = summary_at + len(_SUMMARY_HEADER)
+
+        questions_at = response_text.find(_QUESTIONS_HEADER, summary_end)
+        if questions_at < 0:
+            return None
+        questions_end = questions_at + len(_QUESTIONS_HEADER)
+
+        tags_at = response_text.find(_TAGS_HEADER, questions_end)
+        if tags_at < 0:
+            return None
+
+        key_insights = None
+        summary_stop = questions_at
+        key_insights_at = response_text.find(_KEY_INSIGHTS_HEADER, summary_end, questions_at)
+        if key_insights_at >= 0:
+            key_insights = response_text[key_insights_at + len(_KEY_INSIGHTS_HEADER):questions_at]
+            summary_stop = key_insights_at
+
+        return (response_text[summary_end:summary_stop], key_insights,
+                response_text[questions_end:tags_at], response_text[tags_at + len(_TAGS_HEADER):])
+
+    @staticmethod
+    def _tokenize_tags(tags_text: str) -> List[str]:
+        """Split the TAGS section into tag words: '#tag' or words separated by commas/spaces."""
+        tokens = tags_text.translate(_TAG_SEPARATORS).split()
+
+        # Typical output only uses tag characters, so a split gives the same tokens as the regex
+        if _TAG_CHARS.issuperset("".join(tokens)):
+            stripped = (token.lstrip("_-") for token in tokens)
+            return [token for token in stripped if len(token) > 1]
+
+        raw = _MD_HEADER_RE.sub('', tags_text).strip()
+        return [piece.lstrip('#') for piece in _TAG_TOKEN_RE.findall(raw)]
+
     def _process_tags(self, tags_list: List[str]) -> List[str]:
         """Process tags to improve quality and remove redundancy."""
-        tags_list = [t.lower() for t in tags_list if len(t) > 1]
         # De-dup while preserving order
-        seen = set()
-        unique = [t for t in tags_list if not (t in seen or seen.add(t))]
+        unique = dict.fromkeys(t.lower() for t in tags_list if len(t) > 1)
         # Prefer priority tags
-        priorities = {t.lower() for t in self.priority_tags}
+        priorities = self._priority_tag_set
         final = [t for t in unique if t in priorities]
         # Fill up to 3–5 tags
-        other = [t for t in unique if t not in priorities]
-        while len(final) < 3 and other:
-            final.append(other.pop(0))
+        if len(final) < 3:
+            other = [t for t in unique if t not in priorities]
+            final.extend(other[:3 - len(final)])
         return final[:5]
 
-    def _extract_insights_from_summary(self, summary_text: str) -> List[str]:
-        """Extract individual insights from the summary text."""
-        insights: List[str] = []
-        for line in summary_text.splitlines():
-            line = line.strip()
-            if (line.startswith(('*', '-', '•')) or re.match(r'^\d+\.', line)) and len(line) > 3:
-                insights.append(re.sub(r'^\s*[-•*]?\s*(\d+\.|\(\d+\))?\s*', '', line).strip())
-        return insights
-
     async def extract_insights(self, summary_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Extract structured insights from summary data for database storage.
@@ -502,9 +1172,15 @@ class AISummarizer:
             })
         return insights_out
 
-    def _create_empty_summary(self, content_item: Dict[str, Any]) -> Dict[str, Any]:
-        """Create an empty summary structure for content with no text."""
-        return {
+    def _create_empty_summary(self, content_item: Dict[str, Any], reason: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Create an empty summary structure for content with no text.
+
+        Args:
+            content_item: Content item the summary is for
+            reason: Why the content was not summarized, e.g. "low_signal" for boilerplate
+        """
+        summary = {
             "title": content_item.get("title", "Unknown"),
             "source": content_item.get("source", "Unknown"),
             "date": content_item.get("date", ""),
@@ -517,6 +1193,10 @@ class AISummarizer:
             "chunks_processed": 0,
             "error": "No content provided"
         }
+        if reason is not None:
+            summary["reason"] = reason
+            summary["error"] = "Content too thin to summarize"
+        return summary
 
     def _create_error_summary(self, content_item: Dict[str, Any], error_message: str) -> Dict[str, Any]:
         """Create an error summary structure when processing fails."""
@@ -4,8 +4,76 @@ Content cleaning utilities for Research Automation
 Handles text preprocessing and cleaning operations
 """
 
+import functools
 import re
-from typing import Optional  # Fixed: removed invalid 'str' import
+from html.entities import html5 as _HTML5_ENTITIES
+from typing import List, Optional  # Fixed: removed invalid 'str' import
+
+
+# Patterns for cleaning, compiled once per process and shared by every ContentCleaner
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+_LINE_BREAKS_RE = re.compile(r'\n\s*\n\s*\n+')
+_SIGNATURE_TAIL_RE = re.compile(r'(?i)(unsubscribe|manage preferences|email preferences).*$', re.DOTALL)
+_SIGNATURE_PATTERNS = tuple(
+    re.compile(pattern, re.MULTILINE | re.DOTALL) for pattern in (
+        r'(?i)--+\s*$.*',  # -- signature delimiter
+        r'(?i)sent from my \w+.*$',  # "Sent from my iPhone/Android"
+        r'(?i)this email was sent.*$',  # Email service notifications
+        r'(?i)you received this.*$',  # Subscription notifications
+    )
+)
+# Lowercase substrings every signature/footer pattern needs; without one, that pass is skipped
+_SIGNATURE_MARKERS = (
+    'unsubscribe', 'manage preferences', 'email preferences',
+    '--', 'sent from my', 'this email was sent', 'you received this',
+)
+
+# HTML entities mapping
+_HTML_ENTITIES = {
+    '&nbsp;': ' ',
+    '&amp;': '&',
+    '&lt;': '<',
+    '&gt;': '>',
+    '&quot;': '"',
+    '&apos;': "'",
+    '&#39;': "'",
+    '&mdash;': '—',
+    '&ndash;': '–',
+    '&hellip;': '...',
+    '&rsquo;': "'",
+    '&lsquo;': "'",
+    '&rdquo;': '"',
+    '&ldquo;': '"',
+}
+# Named entities from the table, numeric ones (e.g., &#8217;) and any other exactly named
+# HTML5 entity (e.g., &bull;), decoded in a single pass
+_HTML_ENTITY_RE = re.compile(
+    '|'.join(map(re.escape, _HTML_ENTITIES)) + r'|&#(\d+);|&[A-Za-z][A-Za-z0-9]{1,31};'
+)
+
+# HTML structure -> text formatting for extract_plain_text, applied in order
+_PLAIN_TEXT_SUBS = tuple(
+    (re.compile(pattern, re.IGNORECASE), replacement) for pattern, replacement in (
+        (r'<br\s*/?>', '\n'),
+        (r'</p>', '\n\n'),
+        (r'</?div[^>]*>', '\n'),
+        (r'</?h[1-6][^>]*>', '\n'),
+        (r'<li[^>]*>', '\n• '),
+        (r'</li>', ''),
+        (r'</?ul[^>]*>', '\n'),
+        (r'</?ol[^>]*>', '\n'),
+    )
+)
+
+# Patterns for clean_for_ai_processing. URLs go first (their placeholder gives adjacent
+# text a word boundary); email addresses and phone numbers are then masked in one scan
+_URL_RE = re.compile(r'https?://\S+')
+_CONTACT_RE = re.compile(
+    r'(\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b)'
+    r'|(\b\d{3}[-.]?\d{3}[-.]?\d{4}\b)'
+)
+_REPEATED_PUNCTUATION_RE = re.compile(r'\.{3,}|!{2,}|\?{2,}')
 
 
 class ContentCleaner:
@@ -16,29 +84,11 @@ class ContentCleaner:
     """
 
     def __init__(self):
-        # Patterns for cleaning
-        self.html_tag_pattern = re.compile(r'<[^>]+>')
-        self.excessive_whitespace_pattern = re.compile(r'\s+')
-        self.email_signature_pattern = re.compile(r'(?i)(unsubscribe|manage preferences|email preferences).*$',
-                                                  re.DOTALL)
-
-        # HTML entities mapping
-        self.html_entities = {
-            '&nbsp;': ' ',
-            '&amp;': '&',
-            '&lt;': '<',
-            '&gt;': '>',
-            '&quot;': '"',
-            '&apos;': "'",
-            '&#39;': "'",
-            '&mdash;': '—',
-            '&ndash;': '–',
-            '&hellip;': '...',
-            '&rsquo;': "'",
-            '&lsquo;': "'",
-            '&rdquo;': '"',
-            '&ldquo;': '"',
-        }
+        # Short strings (titles, labels, footer lines) repeat across a batch, so entity decoding
+        # and whitespace normalization results are memoized for them; long bodies are not cached
+        self.memoize_max_length = 512
+        self._decode_short = functools.lru_cache(maxsize=4096)(self._decode_entities_uncached)
+        self._normalize_short = functools.lru_cache(maxsize=4096)(self._normalize_whitespace_uncached)
 
     def clean_email_content(self, content: str) -> str:
         """
@@ -53,14 +103,19 @@ class ContentCleaner:
         if not content:
             return ""
 
+        # Stages whose patterns cannot match are skipped; a substring probe is far
+        # cheaper than a regex pass, and plain-text bodies often need neither
         # Remove HTML tags first
-        content = self.remove_html_tags(content)
+        if '<' in content:
+            content = self.remove_html_tags(content)
 
         # Replace HTML entities
         content = self.decode_html_entities(content)
 
         # Remove email signatures and footers
-        content = self.remove_email_signatures(content)
+        lowered = content.lower()
+        if any(marker in lowered for marker in _SIGNATURE_MARKERS):
+            content = self.remove_email_signatures(content)
 
         # Normalize whitespace
         content = self.normalize_whitespace(content)
@@ -72,72 +127,85 @@ class ContentCleaner:
 
     def remove_html_tags(self, content: str) -> str:
         """Remove HTML tags from content."""
-        return self.html_tag_pattern.sub(' ', content)
+        return _HTML_TAG_RE.sub(' ', content)
 
     def decode_html_entities(self, content: str) -> str:
         """Decode HTML entities to their text equivalents."""
-        for entity, replacement in self.html_entities.items():
-            content = content.replace(entity, replacement)
-
-        # Handle numeric HTML entities (e.g., &#8217;)
-        content = re.sub(r'&#(\d+);', lambda m: chr(int(m.group(1))) if int(m.group(1)) < 1114112 else m.group(0),
-                         content)
-
-        return content
+        if '&' not in content:
+            return content
+        if len(content) < self.memoize_max_length:
+            return self._decode_short(content)
+        return self._decode_entities_uncached(content)
+
+    def _decode_entities_uncached(self, content: str) -> str:
+        return _HTML_ENTITY_RE.sub(self._decode_entity, content)
+
+    def _decode_entity(self, match: re.Match) -> str:
+        """Replacement for one html_entity_pattern match."""
+        number = match.group(1)
+        if number is None:
+            entity = match.group(0)
+            # The table's plain-ASCII forms win over the HTML5 ones (e.g., &rsquo; -> ').
+            # Other names must match exactly; html.unescape would prefix-match legacy
+            # entities (&ampersand; -> &ersand;), so unknown names stay as they are
+            replacement = _HTML_ENTITIES.get(entity)
+            if replacement is None:
+                replacement = _HTML5_ENTITIES.get(entity[1:], entity)
+            return replacement
+        return chr(int(number)) if int(number) < 1114112 else match.group(0)
 
     def remove_email_signatures(self, content: str) -> str:
         """Remove common email signatures and unsubscribe footers."""
         # Remove unsubscribe and preference management sections
-        content = self.email_signature_pattern.sub('', content)
+        content = _SIGNATURE_TAIL_RE.sub('', content)
 
         # Remove common signature patterns
-        signature_patterns = [
-            r'(?i)--+\s*$.*',  # -- signature delimiter
-            r'(?i)sent from my \w+.*$',  # "Sent from my iPhone/Android"
-            r'(?i)this email was sent.*$',  # Email service notifications
-            r'(?i)you received this.*$',  # Subscription notifications
-        ]
-
-        for pattern in signature_patterns:
-            content = re.sub(pattern, '', content, flags=re.MULTILINE | re.DOTALL)
+        for pattern in _SIGNATURE_PATTERNS:
+            content = pattern.sub('', content)
 
         return content
 
     def normalize_whitespace(self, content: str) -> str:
         """Normalize whitespace by collapsing multiple spaces, tabs, etc."""
-        return self.excessive_whitespace_pattern.sub(' ', content)
+        if len(content) < self.memoize_max_length:
+            return self._normalize_short(content)
+        return self._normalize_whitespace_uncached(content)
+
+    def _normalize_whitespace_uncached(self, content: str) -> str:
+        return _WHITESPACE_RE.sub(' ', content)
 
     def clean_line_breaks(self, content: str) -> str:
         """Clean up excessive line breaks while preserving paragraph structure."""
         # Replace multiple consecutive line breaks with double line breaks
-        content = re.sub(r'\n\s*\n\s*\n+', '\n\n', content)
+        content = _LINE_BREAKS_RE.sub('\n\n', content)
 
         # Remove line breaks that split sentences inappropriately
         # But preserve intentional paragraph breaks
-        lines = content.split('\n')
-        cleaned_lines = []
+        # Each output line is kept as a list of the input lines merged into it and joined
+        # once at the end (repeated string concatenation is quadratic on long emails)
+        output_lines: List[List[str]] = []
 
-        for i, line in enumerate(lines):
+        for line in content.split('\n'):
             line = line.strip()
             if not line:
-                # Empty line - preserve as paragraph break if not duplicate
-                if cleaned_lines and cleaned_lines[-1] != '':
-                    cleaned_lines.append('')
+                # Empty line - preserve as paragraph break (an empty list) if not duplicate
+                if output_lines and output_lines[-1]:
+                    output_lines.append([])
                 continue
 
             # If the previous line ended with sentence-ending punctuation,
             # or this line starts with a capital letter after whitespace,
             # treat as a new paragraph
-            if (cleaned_lines and
-                    not cleaned_lines[-1].endswith(('.', '!', '?', ':', ';')) and
-                    not line[0].isupper() and
-                    cleaned_lines[-1] != ''):
+            previous = output_lines[-1] if output_lines else None
+            if (previous and
+                    not previous[-1].endswith(('.', '!', '?', ':', ';')) and
+                    not line[0].isupper()):
                 # Likely a line break in the middle of a sentence
-                cleaned_lines[-1] = cleaned_lines[-1] + ' ' + line
+                previous.append(line)
             else:
-                cleaned_lines.append(line)
+                output_lines.append([line])
 
-        return '\n'.join(cleaned_lines)
+        return '\n'.join(' '.join(fragments) for fragments in output_lines)
 
     def extract_plain_text(self, html_content: str) -> str:
         """
@@ -152,22 +220,11 @@ class ContentCleaner:
         if not html_content:
             return ""
 
-        # Replace certain HTML tags with appropriate text formatting
-        # Fixed: Changed to proper dict with colon syntax
-        replacements = {
-            r'<br\s*/?>': '\n',
-            r'</p>': '\n\n',
-            r'</?div[^>]*>': '\n',
-            r'</?h[1-6][^>]*>': '\n',
-            r'<li[^>]*>': '\n• ',
-            r'</li>': '',
-            r'</?ul[^>]*>': '\n',
-            r'</?ol[^>]*>': '\n',
-        }
-
+        # Replace certain HTML tags with appropriate text formatting (nothing to do without a tag)
         content = html_content
-        for pattern, replacement in replacements.items():
-            content = re.sub(pattern, replacement, content, flags=re.IGNORECASE)
+        if '<' in content:
+            for pattern, replacement in _PLAIN_TEXT_SUBS:
+                content = pattern.sub(replacement, content)
 
         # Remove remaining HTML tags
         content = self.remove_html_tags(content)
@@ -200,21 +257,17 @@ class ContentCleaner:
         # Try to truncate at sentence boundary
         truncated = content[:max_length]
 
-        # Find the last sentence boundary
-        sentence_endings = ['.', '!', '?']
-        last_sentence_end = -1
+        # Find the last sentence boundary; only the final 20% is searched, since
+        # an earlier boundary would not be used anyway
+        sentence_window_start = int(max_length * 0.8) + 1
+        last_sentence_end = max(truncated.rfind(ending, sentence_window_start) for ending in '.!?')
 
-        for ending in sentence_endings:
-            pos = truncated.rfind(ending)
-            if pos > last_sentence_end:
-                last_sentence_end = pos
-
-        if last_sentence_end > max_length * 0.8:  # Only truncate at sentence if we keep at least 80%
+        if last_sentence_end >= 0:  # Only truncate at sentence if we keep at least 80%
             return truncated[:last_sentence_end + 1] + "..."
         else:
             # Fallback to word boundary
-            last_space = truncated.rfind(' ')
-            if last_space > max_length * 0.9:
+            last_space = truncated.rfind(' ', int(max_length * 0.9) + 1)
+            if last_space >= 0:
                 return truncated[:last_space] + "..."
             else:
                 return truncated + "..."
@@ -232,37 +285,17 @@ class ContentCleaner:
         # Start with basic cleaning
         content = self.clean_email_content(content)
 
-        # Remove URLs from the text (keep them for link extraction, but remove from AI input)
-        # This prevents the AI from trying to summarize URLs themselves
-        content = re.sub(r'https?://\S+', '[LINK]', content)
-
-        # Remove email addresses
-        content = re.sub(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '[EMAIL]', content)
-
-        # Remove phone numbers
-        content = re.sub(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', '[PHONE]', content)
-
-        # Clean up excessive punctuation
-        content = re.sub(r'[.]{3,}', '...', content)
-        content = re.sub(r'[!]{2,}', '!', content)
-        content = re.sub(r'[?]{2,}', '?', content)
+        # Remove URLs (keep them for link extraction, but remove from AI input; this prevents
+        # the AI from trying to summarize URLs themselves), email addresses and phone numbers
+        content = _URL_RE.sub('[LINK]', content)
+        content = _CONTACT_RE.sub(lambda m: '[EMAIL]' if m.lastindex == 1 else '[PHONE]', content)
 
-        # Remove excessive capitalization (but preserve acronyms)
-        words = content.split()
-        cleaned_words = []
+        # Clean up excessive punctuation ("....." -> "...", "!!" -> "!", "??" -> "?")
+        content = _REPEATED_PUNCTUATION_RE.sub(
+            lambda m: '...' if m.group(0)[0] == '.' else m.group(0)[0], content
+        )
 
-        for word in words:
-            # If word is all caps and longer than 3 characters, and not an acronym
-            if (len(word) > 3 and word.isupper() and
-                    not re.match(r'^[A-Z]{2,4}$', word) and  # Likely acronym
-                    not word.replace('.', '').isupper()):  # Has punctuation
-                cleaned_words.append(word.capitalize())
-            else:
-                cleaned_words.append(word)
-
-        content = ' '.join(cleaned_words)
-
-        # Final whitespace normalization
-        content = self.normalize_whitespace(content)
+        # Final whitespace normalization (all runs, line breaks included, become single spaces)
+        content = ' '.join(content.split())
 
         return content.strip()
\ No newline at end of file
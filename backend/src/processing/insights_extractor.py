@@ -6,6 +6,7 @@ Extracts strategic insights from summaries using AI, not just bullet points
 Replaces the basic bullet-point copying from V1 with strategic fact extraction
 """
 
+import asyncio
 import re
 import datetime
 from typing import List, Dict, Any, Optional
@@ -13,6 +14,42 @@ from ..core.logging import ProcessingLogger
 
 logger = ProcessingLogger("insights", "extraction")
 
+# Start of a numbered insight line ("1. ..."), for splitting a response into insights
+_NUMBERED_ITEM_RE = re.compile(r'(?m)^[^\S\n]*\d+\.')
+# "=== Summary N ===" header of one summary's section in a batched response
+_SUMMARY_SECTION_RE = re.compile(r'(?m)^[^\S\n]*=== Summary (\d+) ===[^\S\n]*$')
+# Topic descriptions rather than findings
+_GENERIC_INSIGHT_RE = re.compile(
+    r'discussion focused on|analysis of|coverage of|exploration of|conversation covered|hosts discussed',
+    re.IGNORECASE
+)
+
+# What to extract (and avoid), shared by the single and batched extraction prompts
+_INSIGHT_GUIDANCE = """WHAT MAKES A MEMORABLE INSIGHT:
+✅ Specific findings with numbers, percentages, or quantified results
+✅ Strategic revelations about organizations, policies, or systems
+✅ Unexpected or counterintuitive discoveries  
+✅ Data points useful for future decision-making in the relevant domain
+✅ Trends or patterns with broad implications
+
+EXAMPLES OF MEMORABLE INSIGHTS:
+✅ "Figure generated $1B+ trading volume but platform appears to be shrinking"
+✅ "NAD+ levels decline 50% by age 50, with supplementation showing 20-30% cellular energy improvement"
+✅ "Suburban voter turnout increased 23% in midterms, driven by college-educated demographics"
+✅ "Meta's AI training costs reached $15B annually, requiring 40% of total R&D budget"
+✅ "Metformin reduces age-related muscle loss by 25% over 18 months at 1000mg twice daily"
+✅ "Carbon capture technology reached $180/ton efficiency, making renewable transition 15% more cost-effective"
+
+AVOID GENERIC DESCRIPTIONS:
+❌ "Discussion focused on cryptocurrency developments"
+❌ "Research covered aging and longevity topics" 
+❌ "Analysis of political trends and voter behavior"
+❌ "Coverage of AI technology announcements"
+❌ "Overview of climate policy developments"
+
+CRITICAL: Extract SPECIFIC FACTS and SUBSTANTIAL FINDINGS, not topic descriptions.
+"""
+
 
 class EnhancedInsightsExtractor:
     """Extract strategic insights from summaries, not just bullet points."""
@@ -34,12 +71,22 @@ class EnhancedInsightsExtractor:
             logger.warning(f"No summary text found for {source}: {title}")
             return []
 
+        if self._is_placeholder_summary(summary_data):
+            logger.info(f"Skipping insights for {source}: {title} ({summary_data.get('reason') or 'not summarized'})")
+            return []
+
+        # Insights requested in the summary prompt itself save a second Claude call per item
+        strategic_insights = self._filter_strategic_insights(summary_data.get('strategic_insights') or [])
+        if strategic_insights:
+            logger.info(f"Using {len(strategic_insights)} strategic insights from the summary of {source}")
+            return strategic_insights
+
         extraction_prompt = self._build_strategic_extraction_prompt(
             summary_text, source, title
         )
 
         try:
-            response = await self.ai_summarizer.client.messages.create(
+            response = await self.ai_summarizer.create_message(
                 model=self.ai_summarizer.settings.claude_model,
                 max_tokens=600,  # Focused on key facts
                 messages=[{"role": "user", "content": extraction_prompt}]
@@ -56,37 +103,125 @@ class EnhancedInsightsExtractor:
             logger.warning(f"AI insights extraction failed for {source}, using fallback: {e}")
             return self._fallback_insights_extraction(summary_text)
 
-    def _build_strategic_extraction_prompt(self, summary_text: str, source: str, title: str) -> str:
-        """Build prompt to extract strategic insights, not bullet points."""
+    async def extract_strategic_insights_batch(self, summaries: List[Dict[str, Any]]) -> List[List[str]]:
+        """
+        Extract strategic insights from several summaries, sharing Claude calls.
+
+        Summaries that already carry insights need no call; the rest are sent
+        ai_insights_batch_size at a time in one numbered prompt per group.
+
+        Returns:
+            One list of insights per summary, in input order
+        """
+        results: List[List[str]] = [[] for _ in summaries]
+        pending = []
+
+        for index, summary_data in enumerate(summaries):
+            if not summary_data.get('summary'):
+                logger.warning(f"No summary text found for {summary_data.get('source', 'Unknown')}: "
+                               f"{summary_data.get('title', 'Unknown')}")
+                continue
+
+            if self._is_placeholder_summary(summary_data):
+                continue
+
+            strategic_insights = self._filter_strategic_insights(summary_data.get('strategic_insights') or [])
+            if strategic_insights:
+                results[index] = strategic_insights
+            else:
+                pending.append(index)
+
+        batch_size = max(1, self.ai_summarizer.settings.ai_insights_batch_size)
+        groups = [pending[start:start + batch_size] for start in range(0, len(pending), batch_size)]
+        group_results = await asyncio.gather(
+            *(self._extract_group_insights([summaries[index] for index in group]) for group in groups)
+        )
+        for group, group_insights in zip(groups, group_results):
+            for index, strategic_insights in zip(group, group_insights):
+                results[index] = strategic_insights
+
+        return results
+
+    @staticmethod
+    def _is_placeholder_summary(summary_data: Dict[str, Any]) -> bool:
+        """Whether the summary text is a stand-in (low-signal, empty or failed content), not a real summary."""
+        return summary_data.get('reason') == 'low_signal' or bool(summary_data.get('error'))
+
+    async def _extract_group_insights(self, group: List[Dict[str, Any]]) -> List[List[str]]:
+        """Extract insights for a group of summaries with one Claude call."""
+        if len(group) == 1:
+            return [await self.extract_strategic_insights(group[0])]
+
+        try:
+            response = await self.ai_summarizer.create_message(
+                model=self.ai_summarizer.settings.claude_model,
+                max_tokens=600 * len(group),  # Same budget per summary as a single extraction
+                messages=[{"role": "user", "content": self._build_batch_extraction_prompt(group)}]
+            )
+            sections = self._split_batch_response(response.content[0].text)
+        except Exception as e:
+            logger.warning(f"Batched AI insights extraction failed for {len(group)} summaries, using fallback: {e}")
+            sections = {}
+
+        group_insights = []
+        for number, summary_data in enumerate(group, start=1):
+            if number in sections:
+                strategic_insights = self._parse_strategic_insights(sections[number])
+            else:
+                # Missing from the response (or the call failed): fall back for this summary only
+                strategic_insights = self._fallback_insights_extraction(summary_data['summary'])
+            group_insights.append(strategic_insights)
+
+        logger.info(f"Extracted {sum(map(len, group_insights))} strategic insights from {len(group)} summaries")
+        return group_insights
+
+    def _build_batch_extraction_prompt(self, group: List[Dict[str, Any]]) -> str:
+        """Build one prompt asking for strategic insights from each of several summaries."""
+        sections = "\n\n".join(
+            f"Summary {number}: {summary_data.get('source', 'Unknown')}: \"{summary_data.get('title', 'Unknown')}\"\n"
+            f"{summary_data['summary']}"
+            for number, summary_data in enumerate(group, start=1)
+        )
+
         return f"""
 You are an expert at identifying memorable insights and key facts across all domains.
 
-From this analysis of {source}: "{title}", extract 2-3 specific insights that are worth remembering long-term.
+From each of these {len(group)} analyses, extract 2-3 specific insights that are worth remembering long-term.
+Extract insights from each summary separately.
 
-WHAT MAKES A MEMORABLE INSIGHT:
-✅ Specific findings with numbers, percentages, or quantified results
-✅ Strategic revelations about organizations, policies, or systems
-✅ Unexpected or counterintuitive discoveries  
-✅ Data points useful for future decision-making in the relevant domain
-✅ Trends or patterns with broad implications
+{_INSIGHT_GUIDANCE}
+Format your response with one section per summary, in order:
 
-EXAMPLES OF MEMORABLE INSIGHTS:
-✅ "Figure generated $1B+ trading volume but platform appears to be shrinking"
-✅ "NAD+ levels decline 50% by age 50, with supplementation showing 20-30% cellular energy improvement"
-✅ "Suburban voter turnout increased 23% in midterms, driven by college-educated demographics"
-✅ "Meta's AI training costs reached $15B annually, requiring 40% of total R&D budget"
-✅ "Metformin reduces age-related muscle loss by 25% over 18 months at 1000mg twice daily"
-✅ "Carbon capture technology reached $180/ton efficiency, making renewable transition 15% more cost-effective"
+=== Summary 1 ===
+INSIGHTS:
+1. [Specific strategic insight with numbers/organizations/concrete details]
+2. [Another memorable fact or strategic revelation]
+3. [Third strategic insight if applicable]
 
-AVOID GENERIC DESCRIPTIONS:
-❌ "Discussion focused on cryptocurrency developments"
-❌ "Research covered aging and longevity topics" 
-❌ "Analysis of political trends and voter behavior"
-❌ "Coverage of AI technology announcements"
-❌ "Overview of climate policy developments"
+=== Summary 2 ===
+INSIGHTS:
+1. ...
 
-CRITICAL: Extract SPECIFIC FACTS and SUBSTANTIAL FINDINGS, not topic descriptions.
+Here are the summaries to extract insights from:
+
+{sections}
+"""
+
+    @staticmethod
+    def _split_batch_response(response_text: str) -> Dict[int, str]:
+        """Split a batched response into each summary's section text, keyed by summary number."""
+        parts = _SUMMARY_SECTION_RE.split(response_text)
+        # parts = [preamble, number, section, number, section, ...]
+        return {int(number): section for number, section in zip(parts[1::2], parts[2::2])}
 
+    def _build_strategic_extraction_prompt(self, summary_text: str, source: str, title: str) -> str:
+        """Build prompt to extract strategic insights, not bullet points."""
+        return f"""
+You are an expert at identifying memorable insights and key facts across all domains.
+
+From this analysis of {source}: "{title}", extract 2-3 specific insights that are worth remembering long-term.
+
+{_INSIGHT_GUIDANCE}
 Format your response as:
 
 INSIGHTS:
@@ -103,39 +238,24 @@ Here's the summary to extract insights from:
         """Parse insights response into clean strategic facts."""
         insights = []
 
-        # Extract insights from numbered list
-        lines = insights_text.split('\n')
-        current_insight = ""
-
-        for line in lines:
-            line = line.strip()
-            if re.match(r'^\d+\.', line):  # Numbered insight
-                if current_insight and len(current_insight.strip()) > 20:
-                    insights.append(current_insight.strip())
-                current_insight = re.sub(r'^\d+\.\s*', '', line)
-            elif line and current_insight and not line.startswith('INSIGHTS:'):
-                current_insight += " " + line
-
-        # Add final insight
-        if current_insight and len(current_insight.strip()) > 20:
-            insights.append(current_insight.strip())
-
-        # Filter out generic insights
-        strategic_insights = []
-        generic_phrases = [
-            "discussion focused on", "analysis of", "coverage of",
-            "exploration of", "conversation covered", "hosts discussed"
-        ]
-
-        for insight in insights:
-            is_strategic = True
-            for phrase in generic_phrases:
-                if phrase.lower() in insight.lower():
-                    is_strategic = False
-                    break
-
-            if is_strategic and len(insight) > 30:  # Must be substantial
-                strategic_insights.append(insight)
+        # Extract insights from numbered list: each split piece is one item, whose
+        # continuation lines are joined onto its first line (text before "1." is dropped)
+        for item in _NUMBERED_ITEM_RE.split(insights_text)[1:]:
+            lines = [line.strip() for line in item.split('\n')]
+            if not lines[0]:
+                continue  # An empty numbered line takes no continuation lines
+            insight = " ".join([lines[0]] + [line for line in lines[1:]
+                                              if line and not line.startswith('INSIGHTS:')])
+            if len(insight) > 20:
+                insights.append(insight)
+
+        return self._filter_strategic_insights(insights)
+
+    def _filter_strategic_insights(self, insights: List[str]) -> List[str]:
+        """Drop generic or insubstantial insights, keeping at most 3."""
+        # Filter out generic insights; must be substantial
+        strategic_insights = [insight for insight in insights
+                              if len(insight) > 30 and not _GENERIC_INSIGHT_RE.search(insight)]
 
         return strategic_insights[:3]  # Max 3 insights
 
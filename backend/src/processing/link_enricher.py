@@ -8,8 +8,9 @@ and implements caching to minimize API usage while improving link quality.
 """
 
 import asyncio
-import json
+import sqlite3
 import time
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 from urllib.parse import urlparse
@@ -17,9 +18,11 @@ import datetime
 import re
 
 import httpx
+import orjson
 
 from ..core.config import get_settings
 from ..core.logging import get_logger
+from .rate_limiter import AsyncTokenBucket
 
 logger = get_logger(__name__)
 
@@ -38,40 +41,159 @@ class LinkEnricher:
 
         Args:
             api_key (str, optional): API key for LinkPreviewAPI. If None, will get from settings.
-            cache_path (Path, optional): Path to store the cache. If None, uses default path.
+            cache_path (Path, optional): Path of the legacy JSON cache. The cache itself is an
+                SQLite database next to it with a .db suffix; an existing JSON cache is imported once.
         """
         self.settings = get_settings()
 
         # Get API key from settings if not provided
         self.api_key = api_key or self.settings.linkpreview_api_key
 
-        # Setup cache
-        self.cache_path = cache_path or (self.settings.cache_dir / "link_cache.json")
-        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-        self.cache = self._load_cache()
+        # Setup cache: one row per URL, so lookups and inserts don't touch the rest of the cache.
+        # The database is opened on first use (see _cache_db) and closed by aclose()
+        self._legacy_cache_path = cache_path or (self.settings.cache_dir / "link_cache.json")
+        self.cache_path = self._legacy_cache_path.with_suffix(".db")
+        self._cache_conn: Optional[sqlite3.Connection] = None
+        # Fresh results are buffered and written in one go, off the event loop, after each batch
+        self._pending_cache_rows: List[Dict[str, Any]] = []
+        # Recently used entries, so links seen again in this process skip the database
+        self.max_memory_entries = 2048
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+        # Shared HTTP client (set by ProcessingEngine for the duration of a run)
+        self.http_client: Optional[httpx.AsyncClient] = None
+        # Client of our own for use outside a run, created on first need and kept until aclose()
+        self._own_client: Optional[httpx.AsyncClient] = None
 
         # Track API usage to stay within limits
         self.hour_requests = 0
         self.last_request_hour = datetime.datetime.now().hour
         self.rate_limit_per_hour = 60  # Free tier limit
 
-    def _load_cache(self) -> Dict[str, Any]:
-        """Load the link preview cache from disk."""
+        # Link prioritization patterns, compiled once (domain lists match as substrings of the netloc)
+        self.admin_path_pattern = re.compile(
+            r'/(unsubscribe|login|signup|account|profile|subscribe|email-preferences)($|/)'
+        )
+        self.image_path_pattern = re.compile(r'\.(gif|jpe?g|png|svg)($|\?)')
+        self.content_path_pattern = re.compile(r'/(article|post|blog|news|story|report|research)/')
+        self.newsletter_infra_pattern = self._domain_pattern('passport.online', 'mailchimp.com', 'list-manage.com')
+        self.high_priority_domain_pattern = self._domain_pattern('arxiv.org', 'github.com', '.gov', '.edu')
+        self.medium_priority_domain_pattern = self._domain_pattern(
+            'wsj.com', 'nytimes.com', 'bloomberg.com', 'reuters.com'
+        )
+
+        # Cache misses are fetched concurrently, a few at a time and at a gentle request rate
+        self.max_concurrent_requests = 5
+        self.request_limiter = AsyncTokenBucket(max_rate=self.max_concurrent_requests, time_period=1.0)
+
+    @staticmethod
+    def _domain_pattern(*fragments: str) -> re.Pattern:
+        """Pattern matching a domain that contains any of the fragments."""
+        return re.compile('|'.join(map(re.escape, fragments)))
+
+    @property
+    def _cache_db(self) -> sqlite3.Connection:
+        """The link preview cache database, opened on first use and kept until aclose()."""
+        if self._cache_conn is None:
+            self._cache_conn = self._open_cache(self._legacy_cache_path)
+        return self._cache_conn
+
+    def _open_cache(self, legacy_cache_path: Path) -> sqlite3.Connection:
+        """Open (creating if needed) the link preview cache database, importing a legacy JSON cache."""
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Batch writes run in a worker thread (see _flush_cache)
+        conn = sqlite3.connect(self.cache_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS link_cache (
+                url TEXT PRIMARY KEY,
+                title TEXT,
+                description TEXT,
+                image TEXT,
+                date_fetched TEXT NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_link_cache_date ON link_cache (date_fetched)")
+        conn.commit()
+
+        if legacy_cache_path.suffix == ".json" and legacy_cache_path.exists():
+            self._import_legacy_cache(conn, legacy_cache_path)
+
+        return conn
+
+    @staticmethod
+    def _import_legacy_cache(conn: sqlite3.Connection, legacy_cache_path: Path):
+        """Move entries from the old JSON cache file into the database, then set the file aside."""
         try:
-            if self.cache_path.exists():
-                with open(self.cache_path, 'r') as f:
-                    return json.load(f)
-            return {}
+            legacy_cache = orjson.loads(legacy_cache_path.read_bytes())
+
+            rows = []
+            for url, cached_data in legacy_cache.items():
+                try:
+                    # Only well-formed dates are kept; they compare correctly as ISO strings
+                    date_fetched = datetime.datetime.fromisoformat(cached_data['date_fetched']).isoformat()
+                except (KeyError, TypeError, ValueError):
+                    continue
+                rows.append((url, cached_data.get('title', ''), cached_data.get('description', ''),
+                             cached_data.get('image', ''), date_fetched))
+
+            with conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO link_cache (url, title, description, image, date_fetched) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows
+                )
+            legacy_cache_path.rename(legacy_cache_path.with_suffix(".json.migrated"))
+            logger.info(f"Imported {len(rows)} link cache entries from {legacy_cache_path}")
         except Exception as e:
-            logger.warning(f"Error loading link cache: {e}")
-            return {}
+            logger.warning(f"Error importing legacy link cache: {e}")
+
+    def _get_cached(self, url: str, fetched_after: str) -> Optional[Dict[str, Any]]:
+        """
+        Cached preview data for a URL, or None.
 
-    def _save_cache(self):
-        """Save the link preview cache to disk."""
+        Args:
+            url: Link URL
+            fetched_after: ISO timestamp; older entries count as missing (compared as strings)
+        """
+        entry = self._memory.get(url)
+        if entry is not None and entry['date_fetched'] > fetched_after:
+            self._memory.move_to_end(url)
+            return entry
+
+        row = self._cache_db.execute(
+            "SELECT title, description, image, date_fetched FROM link_cache WHERE url = ? AND date_fetched > ?",
+            (url, fetched_after)
+        ).fetchone()
+        if row is None:
+            return None
+        entry = dict(row)
+        self._remember(url, entry)
+        return entry
+
+    def _remember(self, url: str, entry: Dict[str, Any]):
+        """Insert or refresh an in-memory entry, evicting the least recently used"""
+        self._memory[url] = entry
+        self._memory.move_to_end(url)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _cache_result(self, url: str, cached_data: Dict[str, Any]):
+        """Queue preview data for a URL; written by _flush_cache()."""
+        self._remember(url, cached_data)
+        self._pending_cache_rows.append({"url": url, **cached_data})
+
+    def _flush_cache(self):
+        """Write queued preview data in one transaction (blocking; run via asyncio.to_thread)."""
+        rows, self._pending_cache_rows = self._pending_cache_rows, []
         try:
-            with open(self.cache_path, 'w') as f:
-                json.dump(self.cache, f, indent=2)
-        except Exception as e:
+            with self._cache_db:
+                self._cache_db.executemany(
+                    "INSERT OR REPLACE INTO link_cache (url, title, description, image, date_fetched) "
+                    "VALUES (:url, :title, :description, :image, :date_fetched)",
+                    rows
+                )
+        except sqlite3.Error as e:
             logger.error(f"Error saving link cache: {e}")
 
     def prioritize_links(self, links: List[Dict[str, Any]], source_type: str = "newsletter") -> List[Dict[str, Any]]:
@@ -96,28 +218,23 @@ class LinkEnricher:
             path = parsed.path.lower()
 
             # Skip obvious admin/utility links
-            if re.search(r'/(unsubscribe|login|signup|account|profile|subscribe|email-preferences)($|/)', path):
+            if self.admin_path_pattern.search(path):
                 continue
 
             # Skip tracking and image links
-            if re.search(r'\.(gif|jpe?g|png|svg)($|\?)', path) or '/track/' in path or '/pixel/' in path:
+            if self.image_path_pattern.search(path) or '/track/' in path or '/pixel/' in path:
                 continue
 
             # Skip common newsletter infrastructure
-            if any(d in domain for d in ['passport.online', 'mailchimp.com', 'list-manage.com']):
+            if self.newsletter_infra_pattern.search(domain):
                 continue
 
             # High priority: Likely substantive content
-            if (re.search(r'/(article|post|blog|news|story|report|research)/', path) or
-                    'arxiv.org' in domain or
-                    'github.com' in domain or
-                    '.gov' in domain or
-                    '.edu' in domain):
+            if self.content_path_pattern.search(path) or self.high_priority_domain_pattern.search(domain):
                 high_priority.append(link)
 
             # Medium priority: Might be substantive
-            elif (len(path.split('/')) >= 3 or
-                  any(d in domain for d in ['wsj.com', 'nytimes.com', 'bloomberg.com', 'reuters.com'])):
+            elif path.count('/') >= 2 or self.medium_priority_domain_pattern.search(domain):
                 medium_priority.append(link)
 
             # Low priority: Everything else that wasn't filtered
@@ -154,68 +271,73 @@ class LinkEnricher:
             return links
 
         enriched_links = []
-        api_calls = 0
+        to_fetch: List[int] = []  # Positions in enriched_links that need an API call
+        api_budget = self.rate_limit_per_hour - self.hour_requests
+
+        # Cache entries stay valid for less than 30 days
+        fresh_after = (datetime.datetime.now() - datetime.timedelta(days=30)).isoformat()
 
         # Process prioritized links up to max_links limit
         for link in links[:max_links]:
             url = link['url']
             cache_key = url
 
-            # Check if we already have this URL in cache
-            if cache_key in self.cache:
-                cached_data = self.cache[cache_key]
-
-                # Check if cache entry is still valid (less than 30 days old)
-                try:
-                    cache_date = datetime.datetime.fromisoformat(cached_data.get('date_fetched', '2000-01-01'))
-                    cache_age = (datetime.datetime.now() - cache_date).days
-
-                    if cache_age < 30:
-                        # Update link with cached data
-                        if 'title' in cached_data and cached_data['title']:
-                            link['title'] = cached_data['title']
-                        if 'description' in cached_data:
-                            link['description'] = cached_data['description']
-                        enriched_links.append(link)
-                        continue
-                except ValueError:
-                    # Invalid date format in cache, proceed with API call
-                    pass
+            # Check if we already have a valid entry for this URL in cache
+            cached_data = self._get_cached(cache_key, fresh_after)
+            if cached_data is not None:
+                # Update link with cached data
+                if cached_data['title']:
+                    link['title'] = cached_data['title']
+                link['description'] = cached_data['description']
+                enriched_links.append(link)
+                continue
 
             # Skip API call if we're near limit
-            if self.hour_requests + api_calls >= self.rate_limit_per_hour:
+            if len(to_fetch) >= api_budget:
                 enriched_links.append(link)
                 continue
 
-            # Call API for this link
-            try:
-                logger.debug(f"Enriching link: {url}")
-                enriched_link = await self._enrich_single_link(link)
-                enriched_links.append(enriched_link)
-                api_calls += 1
-
-                # Brief pause to be nice to the API
-                await asyncio.sleep(1)
+            to_fetch.append(len(enriched_links))
+            enriched_links.append(link)
 
-            except Exception as e:
-                logger.warning(f"Error enriching link {url}: {e}")
-                enriched_links.append(link)  # Keep original link
+        # Call the API for the cache misses concurrently, over one HTTP client
+        if to_fetch:
+            semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+            client = self._get_client()
+            results = await asyncio.gather(
+                *(self._enrich_with_limits(client, semaphore, enriched_links[i]) for i in to_fetch)
+            )
+            for i, enriched_link in zip(to_fetch, results):
+                enriched_links[i] = enriched_link
+        api_calls = len(to_fetch)
 
         # Update API usage counter
         self.hour_requests += api_calls
 
         # Save updated cache
         if api_calls > 0:
-            self._save_cache()
+            await asyncio.to_thread(self._flush_cache)
             logger.info(f"Enriched {api_calls} links, {self.hour_requests} API calls used this hour")
 
         return enriched_links
 
-    async def _enrich_single_link(self, link: Dict[str, Any]) -> Dict[str, Any]:
+    async def _enrich_with_limits(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore,
+                                  link: Dict[str, Any]) -> Dict[str, Any]:
+        """Enrich one link within the concurrency and request-rate limits, keeping the original on errors."""
+        async with semaphore, self.request_limiter:
+            try:
+                logger.debug(f"Enriching link: {link['url']}")
+                return await self._enrich_single_link(client, link)
+            except Exception as e:
+                logger.warning(f"Error enriching link {link['url']}: {e}")
+                return link  # Keep original link
+
+    async def _enrich_single_link(self, client: httpx.AsyncClient, link: Dict[str, Any]) -> Dict[str, Any]:
         """
         Enrich a single link with metadata from LinkPreviewAPI.
 
         Args:
+            client: HTTP client to query the API with
             link: Link dictionary with 'url' and 'title' keys
 
         Returns:
@@ -223,53 +345,86 @@ class LinkEnricher:
         """
         url = link['url']
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    "https://api.linkpreview.net",
-                    params={
-                        "key": self.api_key,
-                        "q": url
-                    },
-                    timeout=10.0
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
+        try:
+            response = await self._api_get(client, url, timeout=10.0)
 
-                    # Update link with API data
-                    enhanced_link = link.copy()
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
 
-                    if 'title' in data and data['title'] and len(data['title'].strip()) > 0:
-                        enhanced_link['title'] = data['title'].strip()
+                # Update link with API data
+                enhanced_link = link.copy()
 
-                    if 'description' in data and data['description']:
-                        enhanced_link['description'] = data['description'].strip()
+                if 'title' in data and data['title'] and len(data['title'].strip()) > 0:
+                    enhanced_link['title'] = data['title'].strip()
 
-                    if 'image' in data and data['image']:
-                        enhanced_link['image_url'] = data['image']
+                if 'description' in data and data['description']:
+                    enhanced_link['description'] = data['description'].strip()
 
-                    # Cache the result
-                    self.cache[url] = {
-                        'title': data.get('title', '').strip(),
-                        'description': data.get('description', '').strip(),
-                        'image': data.get('image', ''),
-                        'date_fetched': datetime.datetime.now().isoformat()
-                    }
+                if 'image' in data and data['image']:
+                    enhanced_link['image_url'] = data['image']
 
-                    return enhanced_link
+                # Cache the result
+                self._cache_result(url, {
+                    'title': data.get('title', '').strip(),
+                    'description': data.get('description', '').strip(),
+                    'image': data.get('image', ''),
+                    'date_fetched': datetime.datetime.now().isoformat()
+                })
 
-                else:
-                    logger.warning(f"LinkPreview API error for {url}: {response.status_code}")
-                    return link
+                return enhanced_link
 
-            except httpx.TimeoutException:
-                logger.warning(f"LinkPreview API timeout for {url}")
-                return link
-            except Exception as e:
-                logger.warning(f"LinkPreview API error for {url}: {e}")
+            else:
+                logger.warning(f"LinkPreview API error for {url}: {response.status_code}")
                 return link
 
+        except httpx.TimeoutException:
+            logger.warning(f"LinkPreview API timeout for {url}")
+            return link
+        except Exception as e:
+            logger.warning(f"LinkPreview API error for {url}: {e}")
+            return link
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """The shared HTTP client if one is attached, otherwise this enricher's own long-lived client"""
+        if self.http_client is not None:
+            return self.http_client
+
+        if self._own_client is None or self._own_client.is_closed:
+            # One host, so a small keep-alive pool (multiplexed over HTTP/2) serves every request
+            self._own_client = httpx.AsyncClient(
+                http2=True,
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=self.max_concurrent_requests, keepalive_expiry=300.0)
+            )
+        return self._own_client
+
+    async def aclose(self):
+        """
+        Close this enricher's own HTTP client, if it created one, and the cache database.
+
+        The shared client is not touched. The database is reopened if the enricher is used again.
+        """
+        if self._own_client is not None:
+            await self._own_client.aclose()
+            self._own_client = None
+        if self._cache_conn is not None:
+            self._cache_conn.close()
+            self._cache_conn = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def _api_get(self, client: httpx.AsyncClient, url: str, timeout: float) -> httpx.Response:
+        """Query LinkPreviewAPI for a URL's preview."""
+        params = {
+            "key": self.api_key,
+            "q": url
+        }
+        return await client.get("https://api.linkpreview.net", params=params, timeout=timeout)
+
     async def test_api(self) -> bool:
         """
         Test the LinkPreview API connection.
@@ -283,22 +438,14 @@ class LinkEnricher:
         test_url = "https://example.com"
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    "https://api.linkpreview.net",
-                    params={
-                        "key": self.api_key,
-                        "q": test_url
-                    },
-                    timeout=5.0
-                )
+            response = await self._api_get(self._get_client(), test_url, timeout=5.0)
 
-                if response.status_code == 200:
-                    logger.info("LinkPreview API test successful")
-                    return True
-                else:
-                    logger.error(f"LinkPreview API test failed: {response.status_code}")
-                    return False
+            if response.status_code == 200:
+                logger.info("LinkPreview API test successful")
+                return True
+            else:
+                logger.error(f"LinkPreview API test failed: {response.status_code}")
+                return False
 
         except Exception as e:
             logger.error(f"LinkPreview API test failed: {e}")
@@ -311,27 +458,25 @@ class LinkEnricher:
         Returns:
             Dictionary with cache statistics
         """
-        cache_size = len(self.cache)
-
-        # Calculate cache age distribution
+        # Bucket boundaries as ISO timestamps: age in whole days <= 1, <= 7, <= 30
         now = datetime.datetime.now()
-        age_distribution = {"recent": 0, "week": 0, "month": 0, "old": 0}
+        recent, week, month = ((now - datetime.timedelta(days=days + 1)).isoformat() for days in (1, 7, 30))
 
-        for cached_item in self.cache.values():
-            try:
-                cache_date = datetime.datetime.fromisoformat(cached_item.get('date_fetched', '2000-01-01'))
-                age_days = (now - cache_date).days
-
-                if age_days <= 1:
-                    age_distribution["recent"] += 1
-                elif age_days <= 7:
-                    age_distribution["week"] += 1
-                elif age_days <= 30:
-                    age_distribution["month"] += 1
-                else:
-                    age_distribution["old"] += 1
-            except ValueError:
-                age_distribution["old"] += 1
+        age_distribution = {"recent": 0, "week": 0, "month": 0, "old": 0}
+        rows = self._cache_db.execute("""
+            SELECT CASE
+                       WHEN date_fetched > ? THEN 'recent'
+                       WHEN date_fetched > ? THEN 'week'
+                       WHEN date_fetched > ? THEN 'month'
+                       ELSE 'old'
+                   END AS age,
+                   COUNT(*)
+            FROM link_cache
+            GROUP BY age
+        """, (recent, week, month))
+        for age, count in rows:
+            age_distribution[age] = count
+        cache_size = sum(age_distribution.values())
 
         return {
             "total_entries": cache_size,
@@ -348,27 +493,15 @@ class LinkEnricher:
         Args:
             max_age_days: Maximum age in days for cache entries
         """
-        now = datetime.datetime.now()
-        initial_count = len(self.cache)
-
-        keys_to_remove = []
-        for key, cached_item in self.cache.items():
-            try:
-                cache_date = datetime.datetime.fromisoformat(cached_item.get('date_fetched', '2000-01-01'))
-                age_days = (now - cache_date).days
-
-                if age_days > max_age_days:
-                    keys_to_remove.append(key)
-            except ValueError:
-                # Invalid date format, remove entry
-                keys_to_remove.append(key)
-
-        for key in keys_to_remove:
-            del self.cache[key]
-
-        removed_count = len(keys_to_remove)
+        # Entries whose age in whole days exceeds max_age_days
+        cutoff = (datetime.datetime.now() - datetime.timedelta(days=max_age_days + 1)).isoformat()
+        with self._cache_db:
+            cursor = self._cache_db.execute("DELETE FROM link_cache WHERE date_fetched <= ?", (cutoff,))
+        for url in [url for url, entry in self._memory.items() if entry['date_fetched'] <= cutoff]:
+            del self._memory[url]
+
+        removed_count = cursor.rowcount
         if removed_count > 0:
-            self._save_cache()
             logger.info(f"Removed {removed_count} old cache entries (older than {max_age_days} days)")
 
         return removed_count
\ No newline at end of file
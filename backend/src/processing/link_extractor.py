@@ -9,7 +9,39 @@ tracking URLs.
 """
 
 import re
-from urllib.parse import urlparse, parse_qs, unquote, urlunparse
+from urllib.parse import urlparse, unquote, urlunparse
+
+# URLs with http/https, starting after whitespace, the start of the content or "("
+_URL_RE = re.compile(r'(?:(?<=\s)|(?<=^)|(?<=\())((https?://[^\s\)\]\}>"\']+))')
+# Content cleanup: everything from "unsubscribe" on (email footers), and runs of whitespace
+_UNSUBSCRIBE_RE = re.compile('unsubscribe', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+# The encoded HTML entities decoded in the content, replaced in a single scan
+_HTML_ENTITIES = {'&amp;': '&', '&lt;': '<', '&gt;': '>', '&quot;': '"', '&apos;': "'"}
+_HTML_ENTITY_RE = re.compile('|'.join(map(re.escape, _HTML_ENTITIES)))
+
+# Path/query terms of email management links (unsubscribe, preference centres)
+_EMAIL_MANAGEMENT_TERMS = ('unsubscribe', 'opt-out', 'opt_out', 'preference')
+
+# Link text of markdown links ([Title](url)) and HTML anchors (<a href="url">Title</a>)
+_MARKDOWN_LINK_RE = re.compile(r'\[([^\]]{0,200})\]\s*\((https?://[^\s\)\]\}>"\']+)\)')
+_HTML_LINK_RE = re.compile(r'<a[^>]*href\s*=\s*["\'](https?://[^"\']+)["\'][^>]*>(.*?)</a>')
+
+# Title extraction from the context around a link; the quote and colon patterns
+# match the end of the text just before the URL
+_HTML_TAG_RE = re.compile(r'<[^>]*>')
+_QUOTED_TITLE_RE = re.compile(r'["\'](.*?)["\']\s*(?::|link|at|->|→|:|,)?\s*\Z')
+_COLON_TITLE_RE = re.compile(r'([^.!?:]{5,150}):\s*\Z')
+_READ_MORE_RE = re.compile(
+    r'(Read more|Read the article|Read the full article|Read full article|Click here|More info|Learn more|Continue reading)(?:[^.]|$)',
+    re.IGNORECASE
+)
+_HEADER_RE = re.compile(r'(?:^|\n)#+\s+(.*?)(?:\n|$)')
+
+# Title extraction from the URL path
+_FILE_EXTENSION_RE = re.compile(r'\.\w{2,4}$')
+_DATE_SEGMENT_RE = re.compile(r'^(\d{4}|\d{2})/\d{1,2}/\d{1,2}$')
+_NUMERIC_SEGMENT_RE = re.compile(r'^\d+$')
 
 
 class LinkExtractor:
@@ -44,6 +76,13 @@ class LinkExtractor:
             '_hsenc=', '_hsmi=', 'cmpid=', 'cid=', 'sid=', 'mc_cid='
         ]
 
+        # Compiled once: the ad domains and skip patterns as one alternation each (a single scan
+        # instead of a loop of substring checks)
+        self._ad_domain_pattern = re.compile('|'.join(map(re.escape, self.ad_domains)))
+        self._skip_pattern = re.compile('|'.join(f'(?:{pattern})' for pattern in self.skip_patterns))
+        # Query parameters ("name=value") starting with any of these are tracking parameters
+        self._tracking_param_prefixes = tuple(self.tracking_params)
+
     def extract_links(self, content):
         """
         Extract valid URLs from the content while filtering out likely ad links.
@@ -59,31 +98,40 @@ class LinkExtractor:
 
         # Find all URLs in the content with context
         # This regex looks for URLs with http/https
-        url_matches = re.finditer(
-            r'(?:(?<=\s)|(?<=^)|(?<=\())((https?://[^\s\)\]\}>"\']+))',
-            content
-        )
+        url_matches = _URL_RE.finditer(content)
+
+        # Titles given by markdown/HTML link text, found in one pass over the content
+        linked_titles = self._extract_linked_titles(content)
 
         # Store extracted links with surrounding context
         extracted_links = []
+        seen_urls = set()
         for match in url_matches:
             full_url = match.group(1)
 
-            # Clean the URL of tracking parameters
-            clean_url = self._clean_url_tracking_params(full_url)
+            # Clean the URL of tracking parameters (parsed once; the parts are reused below)
+            clean_url, parsed = self._clean_parsed_tracking_params(full_url, urlparse(full_url))
 
             # Skip common ad domains and tracking links
-            if self._should_skip_url(clean_url):
+            if self._should_skip_parsed(clean_url, parsed):
                 continue
 
+            # Skip duplicates, keeping the first occurrence
+            normalized_url = self._normalize_parsed(parsed)
+            if normalized_url in seen_urls:
+                continue
+            seen_urls.add(normalized_url)
+
             # Try to find the link text/title
             # Look for text near the URL that might be a title
             start_pos = max(0, match.start() - 200)  # Increased context window
             end_pos = min(len(content), match.end() + 50)
             context = content[start_pos:end_pos]
 
-            # Extract title - look for text inside quotes, brackets, or just before the URL
-            title = self._extract_title_from_context(context, full_url)
+            # Extract title - use the link text, else look for text inside quotes or just before the URL
+            title = linked_titles.get(full_url)
+            if title is None:
+                title = self._extract_title_from_context(context, full_url, match.start(1) - start_pos)
 
             # Check if we have a reasonable title
             if title and len(title) > 3 and len(title) < 200:
@@ -93,138 +141,141 @@ class LinkExtractor:
                 })
             else:
                 # Try to get title from URL itself if we couldn't find a good context title
-                url_title = self._extract_title_from_url(clean_url)
+                url_title = self._extract_title_from_parsed(parsed)
                 extracted_links.append({
                     "url": clean_url,
                     "title": url_title
                 })
 
-        # Remove duplicates while preserving order
-        unique_links = []
-        seen_urls = set()
-        for link in extracted_links:
-            normalized_url = self._normalize_url(link["url"])
-            if normalized_url not in seen_urls:
-                unique_links.append(link)
-                seen_urls.add(normalized_url)
-
-        return unique_links
+        return extracted_links
 
     def _clean_content(self, content):
         """Clean the content to improve link extraction"""
-        # Remove common email signatures and footers
-        content = re.sub(r'(?i)unsubscribe.*?$', '', content, flags=re.DOTALL)
+        # Remove common email signatures and footers: everything from the first "unsubscribe"
+        # on, except a final newline. Found in the lowercased text; if lowercasing changed its
+        # length, the index doesn't carry over, so search the original case-insensitively.
+        lowered = content.lower()
+        footer_start = lowered.find('unsubscribe')
+        if footer_start != -1 and len(lowered) != len(content):
+            match = _UNSUBSCRIBE_RE.search(content)
+            footer_start = match.start() if match else -1
+        if footer_start != -1:
+            content = content[:footer_start] + ('\n' if content.endswith('\n') else '')
         # Remove excess whitespace
-        content = re.sub(r'\s+', ' ', content)
+        content = _WHITESPACE_RE.sub(' ', content)
         # Replace encoded HTML entities
-        content = content.replace('&amp;', '&')
-        content = content.replace('&lt;', '<')
-        content = content.replace('&gt;', '>')
-        content = content.replace('&quot;', '"')
-        content = content.replace('&apos;', "'")
+        if '&' in content:
+            content = _HTML_ENTITY_RE.sub(lambda match: _HTML_ENTITIES[match.group()], content)
         return content
 
     def _clean_url_tracking_params(self, url):
         """Clean URL by removing tracking parameters"""
         try:
-            # Parse the URL
-            parsed = urlparse(url)
-            query_params = parse_qs(parsed.query)
-
-            # Filter out tracking parameters
-            filtered_params = {}
-            for param, value in query_params.items():
-                if not any(param.startswith(tp) for tp in self.tracking_params):
-                    filtered_params[param] = value
-
-            # Rebuild the query string
-            from urllib.parse import urlencode
-            query_string = urlencode(filtered_params, doseq=True)
-
-            # Rebuild the URL
-            cleaned_url = urlunparse((
-                parsed.scheme,
-                parsed.netloc,
-                parsed.path,
-                parsed.params,
-                query_string,
-                parsed.fragment
-            ))
-
-            return cleaned_url
+            return self._clean_parsed_tracking_params(url, urlparse(url))[0]
         except:
             # If anything goes wrong, return the original URL
             return url
 
+    def _clean_parsed_tracking_params(self, url, parsed):
+        """Remove tracking parameters from a parsed URL, returning the cleaned URL and its parts"""
+        # Filter out tracking parameters; most URLs have none and are returned as they are
+        query_string = self._strip_tracking_params(parsed.query)
+        if query_string == parsed.query:
+            return url, parsed
+
+        # Rebuild the URL
+        parsed = parsed._replace(query=query_string)
+        return urlunparse(parsed), parsed
+
+    def _strip_tracking_params(self, query):
+        """Drop tracking parameters from a query string, leaving the others exactly as they are"""
+        params = query.split('&')
+        kept = [param for param in params if not param.startswith(self._tracking_param_prefixes)]
+        return query if len(kept) == len(params) else '&'.join(kept)
+
     def _should_skip_url(self, url):
         """Check if a URL should be skipped (ads, tracking links, etc.)"""
-        parsed_url = urlparse(url)
+        return self._should_skip_parsed(url, urlparse(url))
+
+    def _should_skip_parsed(self, url, parsed_url):
+        """Check if a URL should be skipped, given the URL and its parsed parts"""
+        # Skip URLs that are too short (likely redirects)
+        if len(url) < 20 and '/r/' in url:
+            return True
+
+        # Skip very long URLs (likely with lots of tracking)
+        if len(url) > 500:
+            return True
+
         domain = parsed_url.netloc.lower()
         path = parsed_url.path.lower()
         query = parsed_url.query.lower()
 
         # Check for ad domains
-        if any(ad_domain in domain for ad_domain in self.ad_domains):
+        if self._ad_domain_pattern.search(domain):
             return True
 
         # Check for tracking/ad paths
-        if any(re.search(pattern, path + "?" + query) for pattern in self.skip_patterns):
-            return True
-
-        # Skip URLs that are too short (likely redirects)
-        if len(url) < 20 and '/r/' in url:
+        if self._skip_pattern.search(path + "?" + query):
             return True
 
         # Skip URLs that seem like email management
-        if any(term in (path + query).lower() for term in ['unsubscribe', 'opt-out', 'opt_out', 'preference']):
-            return True
-
-        # Skip very long URLs (likely with lots of tracking)
-        if len(url) > 500:
+        path_and_query = path + query
+        if any(term in path_and_query for term in _EMAIL_MANAGEMENT_TERMS):
             return True
 
         return False
 
-    def _extract_title_from_context(self, context, url):
-        """Extract a likely title for the link from surrounding context"""
-        # Try to find title in different formats:
+    def _extract_linked_titles(self, content):
+        """
+        Map URLs to the text of the markdown links and HTML anchors pointing at them.
+
+        Markdown link text wins over anchor text, and the first link to a URL over later ones.
+        """
+        linked_titles = {}
+
+        # 1. Markdown-style links: [Title](url)
+        for match in _MARKDOWN_LINK_RE.finditer(content):
+            linked_titles.setdefault(match.group(2), match.group(1).strip())
+
+        # 2. HTML-style links: <a href="url">Title</a>
+        for match in _HTML_LINK_RE.finditer(content):
+            linked_titles.setdefault(match.group(1), _HTML_TAG_RE.sub('', match.group(2)).strip())
+
+        return linked_titles
 
-        # 1. Look for markdown-style links: [Title](url)
-        bracket_match = re.search(r'\[(.*?)\]\s*\(' + re.escape(url) + r'\)', context)
-        if bracket_match:
-            return bracket_match.group(1).strip()
+    def _extract_title_from_context(self, context, url, url_pos):
+        """
+        Extract a likely title for the link from surrounding context.
 
-        # 2. Look for HTML-style links: <a href="url">Title</a>
-        html_match = re.search(r'<a[^>]*href\s*=\s*["\']' + re.escape(url) + r'["\'][^>]*>(.*?)</a>', context)
-        if html_match:
-            return re.sub(r'<[^>]*>', '', html_match.group(1)).strip()
+        Link text (markdown/HTML links) is looked up by the caller; url_pos is where the URL starts in context.
+        """
+        # Try to find title in different formats:
+        before_url = context[:url_pos]
 
         # 3. Look for text in quotes near the URL
-        quote_match = re.search(r'["\'](.*?)["\']\s*(?::|link|at|->|→|:|,)?\s*' + re.escape(url), context)
+        quote_match = _QUOTED_TITLE_RE.search(before_url)
         if quote_match:
             return quote_match.group(1).strip()
 
         # 4. Look for read more/click here patterns
-        read_more_match = re.search(
-            r'(Read more|Read the article|Read the full article|Read full article|Click here|More info|Learn more|Continue reading)(?:[^.]|$)',
-            context,
-            re.IGNORECASE
-        )
+        read_more_match = _READ_MORE_RE.search(context)
         if read_more_match:
             # Look for a title before this phrase
             before_read_more = context[:read_more_match.start()]
-            # Take the last sentence or phrase that's not too long
-            sentences = re.split(r'[.!?]', before_read_more)
-            if sentences and len(sentences[-1].strip()) > 10:
-                return sentences[-1].strip()
+            # Take the last sentence or phrase (the text after the last sentence end) that's not too long
+            sentence_end = max(before_read_more.rfind('.'), before_read_more.rfind('!'), before_read_more.rfind('?'))
+            last_sentence = before_read_more[sentence_end + 1:].strip()
+            if len(last_sentence) > 10:
+                return last_sentence
 
         # 5. Look for text ending with a colon before the URL
-        colon_match = re.search(r'([^.!?:]{5,150}):\s*' + re.escape(url), context)
+        colon_match = _COLON_TITLE_RE.search(before_url)
         if colon_match:
             return colon_match.group(1).strip()
 
         # 6. Look for nearby headers or emphasized text
-        header_match = re.search(r'(?:^|\n)#+\s+(.*?)(?:\n|$)', context)
+        header_match = _HEADER_RE.search(context)
         if header_match:
             return header_match.group(1).strip()
 
@@ -240,7 +291,10 @@ class LinkExtractor:
 
     def _extract_title_from_url(self, url):
         """Extract a title from the URL itself when context doesn't provide one"""
-        parsed = urlparse(url)
+        return self._extract_title_from_parsed(urlparse(url))
+
+    def _extract_title_from_parsed(self, parsed):
+        """Extract a title from a parsed URL's domain and path"""
         domain = parsed.netloc
         path = parsed.path
 
@@ -257,7 +311,7 @@ class LinkExtractor:
         path = unquote(path)
 
         # Remove file extensions and trailing slashes
-        path = re.sub(r'\.\w{2,4}$', '', path)  # Remove file extensions
+        path = _FILE_EXTENSION_RE.sub('', path)  # Remove file extensions
         path = path.rstrip('/')
 
         # Split path into segments
@@ -266,11 +320,11 @@ class LinkExtractor:
         # Use the last segment that's not a date or ID
         for segment in reversed(segments):
             # Skip likely date patterns
-            if re.match(r'^(\d{4}|\d{2})/\d{1,2}/\d{1,2}$', segment):
+            if _DATE_SEGMENT_RE.match(segment):
                 continue
 
             # Skip segments that are just numbers
-            if re.match(r'^\d+$', segment):
+            if _NUMERIC_SEGMENT_RE.match(segment):
                 continue
 
             # Replace dashes and underscores with spaces
@@ -289,40 +343,40 @@ class LinkExtractor:
     def _normalize_url(self, url):
         """Normalize URL for deduplication"""
         try:
-            parsed = urlparse(url)
+            return self._normalize_parsed(urlparse(url))
+        except:
+            # If anything goes wrong, return the original URL
+            return url
 
-            # Lowercase the domain
-            domain = parsed.netloc.lower()
+    def _normalize_parsed(self, parsed):
+        """Normalize a parsed URL for deduplication"""
+        # Lowercase the domain
+        domain = parsed.netloc.lower()
 
-            # Remove 'www.' if present
-            if domain.startswith('www.'):
-                domain = domain[4:]
+        # Remove 'www.' if present
+        if domain.startswith('www.'):
+            domain = domain[4:]
 
-            # Keep the path but remove trailing slash
-            path = parsed.path.rstrip('/')
+        # Keep the path but remove trailing slash
+        path = parsed.path.rstrip('/')
 
-            # Remove tracking parameters
-            query = parsed.query
-            for param in self.tracking_params:
-                query = re.sub(f'{param}[^&]*&?', '', query)
+        # Remove tracking parameters
+        query = self._strip_tracking_params(parsed.query)
 
-            # Remove any trailing ampersands
-            query = query.rstrip('&')
+        # Remove any trailing ampersands
+        query = query.rstrip('&')
 
-            # Remove fragment (anchor)
-            fragment = ''
+        # Remove fragment (anchor)
+        fragment = ''
 
-            # Rebuild the URL
-            normalized = urlunparse((
-                parsed.scheme,
-                domain,
-                path,
-                parsed.params,
-                query,
-                fragment
-            ))
+        # Rebuild the URL
+        normalized = urlunparse((
+            parsed.scheme,
+            domain,
+            path,
+            parsed.params,
+            query,
+            fragment
+        ))
 
-            return normalized
-        except:
-            # If anything goes wrong, return the original URL
-            return url
\ No newline at end of file
+        return normalized
\ No newline at end of file
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+LLM response cache for Research Automation
+Serves repeated deterministic Claude requests without a network round trip
+"""
+
+import asyncio
+import hashlib
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+import orjson
+
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class LLMCache:
+    """
+    Cache of Claude response texts keyed by a hash of the request.
+
+    Entries are kept in an LRU-bounded in-memory map and as one JSON file per
+    entry under cache_dir, so they survive restarts. Files are replaced atomically,
+    so a crash never leaves a torn entry. Expired entries are misses and are
+    deleted when read; writes also sweep out all expired and unreadable entries,
+    at most once per sweep interval.
+    """
+
+    def __init__(self, cache_dir: Path, ttl_seconds: float = 86400, max_memory_entries: int = 1024,
+                 sweep_interval_seconds: float = 3600):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the on-disk entries
+            ttl_seconds: How long an entry stays valid
+            max_memory_entries: Number of entries kept in memory
+            sweep_interval_seconds: Minimum time between sweeps of expired entries
+        """
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.max_memory_entries = max_memory_entries
+        self.sweep_interval_seconds = sweep_interval_seconds
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._next_sweep = 0.0  # The first write sweeps what earlier runs left behind
+
+    @staticmethod
+    def make_key(**request: Any) -> str:
+        """Stable SHA-256 key for the request parameters (model, prompt, max_tokens, ...)"""
+        return hashlib.sha256(orjson.dumps(request, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached response text, or None on a miss"""
+        entry = self._memory.get(key)
+        if entry is None:
+            entry = await asyncio.to_thread(self._read_entry, key)
+            if entry is None:
+                return None
+
+        expires_at, text = entry
+        if expires_at <= time.time():
+            self._memory.pop(key, None)
+            await asyncio.to_thread(self._delete_entry, key)
+            return None
+
+        self._remember(key, entry)
+        return text
+
+    async def set(self, key: str, text: str):
+        """Store a response text"""
+        entry = (time.time() + self.ttl_seconds, text)
+        self._remember(key, entry)
+        try:
+            await asyncio.to_thread(self._write_entry, key, entry)
+        except Exception as e:
+            logger.warning(f"Could not persist LLM cache entry: {e}")
+
+        if time.time() >= self._next_sweep:
+            await self.purge_expired()
+
+    async def purge_expired(self) -> int:
+        """
+        Delete expired entries from memory and disk.
+
+        Returns:
+            Number of on-disk entries removed
+        """
+        now = time.time()
+        self._next_sweep = now + self.sweep_interval_seconds
+
+        for key in [key for key, (expires_at, _) in self._memory.items() if expires_at <= now]:
+            del self._memory[key]
+
+        removed = await asyncio.to_thread(self._sweep_entries, now)
+        if removed:
+            logger.info(f"Removed {removed} expired LLM cache entries")
+        return removed
+
+    def _remember(self, key: str, entry: Tuple[float, str]):
+        """Insert or refresh an in-memory entry, evicting the least recently used"""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _read_entry(self, key: str) -> Optional[Tuple[float, str]]:
+        """Load an on-disk entry (blocking; run via asyncio.to_thread)"""
+        try:
+            data = orjson.loads(self._entry_path(key).read_bytes())
+            return data["expires_at"], data["text"]
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable LLM cache entry {key}: {e}")
+            return None
+
+    def _delete_entry(self, key: str):
+        """Remove an on-disk entry (blocking; run via asyncio.to_thread)"""
+        try:
+            self._entry_path(key).unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug(f"Could not delete LLM cache entry {key}: {e}")
+
+    def _sweep_entries(self, now: float) -> int:
+        """
+        Remove on-disk entries that expired by now, and unreadable ones (blocking; run via asyncio.to_thread).
+
+        Files written within the last ttl_seconds cannot have expired, so only older
+        ones are parsed. Temp files left by an interrupted write are removed as well.
+        """
+        removed = 0
+        written_before = now - self.ttl_seconds
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                if path.stat().st_mtime > written_before:
+                    continue
+                expired = orjson.loads(path.read_bytes())["expires_at"] <= now
+            except FileNotFoundError:
+                continue
+            except Exception:
+                expired = True  # Unreadable entries would never be served; drop them too
+            if expired:
+                self._delete_entry(path.stem)
+                removed += 1
+
+        for path in self.cache_dir.glob("*.tmp"):
+            try:
+                if path.stat().st_mtime <= now - self.sweep_interval_seconds:
+                    path.unlink()
+            except OSError:
+                continue
+        return removed
+
+    def _write_entry(self, key: str, entry: Tuple[float, str]):
+        """Persist an entry atomically via a temp file (blocking; run via asyncio.to_thread)"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        expires_at, text = entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=f"{key}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(orjson.dumps({"expires_at": expires_at, "text": text}))
+            os.replace(tmp_path, self._entry_path(key))
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Rate limiting utilities for Research Automation
+Token-bucket limiter for outbound API requests
+"""
+
+import asyncio
+import time
+
+
+class AsyncTokenBucket:
+    """
+    Async token-bucket rate limiter.
+
+    Allows bursts of up to max_rate requests, refilled continuously at
+    max_rate tokens per time_period seconds. Use as `async with limiter:`.
+
+    For limits whose cost is only known afterwards (e.g. tokens per minute),
+    acquire() first and charge the remainder with consume(); the bucket may
+    go into debt, which later acquire() calls wait out.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60.0):
+        """
+        Initialize the limiter.
+
+        Args:
+            max_rate: Number of requests allowed per time period (also the burst size)
+            time_period: Length of the period in seconds
+        """
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._tokens = float(max_rate)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        """Add the tokens accrued since the last refill."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(self.max_rate, self._tokens + elapsed * self.max_rate / self.time_period)
+
+    async def acquire(self):
+        """Wait until a token is available and consume it."""
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                # Sleep just long enough for the next token to accrue
+                await asyncio.sleep((1 - self._tokens) * self.time_period / self.max_rate)
+
+    def consume(self, amount: float):
+        """Charge tokens that were used without waiting (may leave the bucket in debt)."""
+        self._refill()
+        self._tokens -= amount
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
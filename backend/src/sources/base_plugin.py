@@ -6,6 +6,9 @@ Defines the contract that all source plugins must implement
 
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional
+
+import httpx
+
 from ..core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -31,6 +34,9 @@ class BaseSourcePlugin(ABC):
         self.config = config
         self.logger = get_logger(f"{__name__}.{self.__class__.__name__}")
 
+        # Shared HTTP client (set by SourceManager when the engine provides one)
+        self.http_client: Optional[httpx.AsyncClient] = None
+
     @abstractmethod
     async def fetch_content(self) -> List[Dict[str, Any]]:
         """
@@ -40,23 +40,25 @@ class EmailSourcePlugin(BaseSourcePlugin):
         try:
             # Map plugin config to EmailClient settings
             if hasattr(self.email_client, 'settings'):
-                settings = self.email_client.settings
-
-                # Update settings from config
+                # Settings are frozen (and shared) - give this client its own copy
+                updates = {}
                 if 'server' in self.config:
-                    settings.email_server = self.config['server']
+                    updates['email_server'] = self.config['server']
                 if 'username' in self.config:
-                    settings.email_username = self.config['username']
+                    updates['email_username'] = self.config['username']
                 if 'password' in self.config:
-                    settings.email_password = self.config['password']
+                    updates['email_password'] = self.config['password']
                 if 'folder' in self.config:
-                    settings.email_folder = self.config['folder']
+                    updates['email_folder'] = self.config['folder']
                 if 'smtp_server' in self.config:
-                    settings.smtp_server = self.config['smtp_server']
+                    updates['smtp_server'] = self.config['smtp_server']
                 if 'smtp_port' in self.config:
-                    settings.smtp_port = self.config['smtp_port']
+                    updates['smtp_port'] = self.config['smtp_port']
                 if 'notification_email' in self.config:
-                    settings.notification_email = self.config['notification_email']
+                    updates['notification_email'] = self.config['notification_email']
+
+                if updates:
+                    self.email_client.settings = self.email_client.settings.model_copy(update=updates)
 
             self.logger.debug(f"Applied email configuration for {self.source_id}")
 
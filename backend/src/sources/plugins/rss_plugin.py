@@ -83,6 +83,7 @@ class RSSSourcePlugin(BaseSourcePlugin):
             self.logger.info(f"Fetching RSS content from {self.source_id}")
 
             # Use existing RSSClient functionality
+            self.rss_client.http_client = self.http_client
             rss_items = await self.rss_client.fetch_new_episodes()
 
             # Ensure each item has proper source metadata
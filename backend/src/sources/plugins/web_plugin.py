@@ -6,7 +6,8 @@ Implements web scraping functionality using BeautifulSoup and httpx
 
 import asyncio
 import datetime
-from typing import Dict, Any, List, Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Any, List, Optional
 from urllib.parse import urljoin, urlparse
 import httpx
 from bs4 import BeautifulSoup, Tag
@@ -40,7 +41,7 @@ class WebSourcePlugin(BaseSourcePlugin):
         super().__init__(source_id, config)
         self.content_cleaner = ContentCleaner()
 
-        # HTTP client configuration
+        # Per-request HTTP options, so they also apply on the engine's shared client
         self.client_config = {
             'timeout': httpx.Timeout(30.0),
             'headers': {
@@ -53,6 +54,15 @@ class WebSourcePlugin(BaseSourcePlugin):
         # Rate limiting
         self.rate_limit_delay = config.get('rate_limit_delay', 2.0)
 
+    @asynccontextmanager
+    async def _http_session(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the shared HTTP client if one is attached, otherwise a client for this fetch"""
+        if self.http_client is not None:
+            yield self.http_client
+        else:
+            async with httpx.AsyncClient() as client:
+                yield client
+
     async def fetch_content(self) -> List[Dict[str, Any]]:
         """
         Fetch web content based on configuration.
@@ -87,7 +97,7 @@ class WebSourcePlugin(BaseSourcePlugin):
         """
         articles = []
 
-        async with httpx.AsyncClient(**self.client_config) as client:
+        async with self._http_session() as client:
             # Fetch the article list page
             list_page_url = self.config.get('list_page', self.config.get('base_url'))
 
@@ -96,7 +106,7 @@ class WebSourcePlugin(BaseSourcePlugin):
                                         self.source_id, 'web')
 
             self.logger.debug(f"Fetching article list from {list_page_url}")
-            response = await client.get(list_page_url)
+            response = await client.get(list_page_url, **self.client_config)
             response.raise_for_status()
 
             # Parse the list page
@@ -149,7 +159,7 @@ class WebSourcePlugin(BaseSourcePlugin):
             raise SourcePluginError("No URLs specified for direct content fetching",
                                     self.source_id, 'web')
 
-        async with httpx.AsyncClient(**self.client_config) as client:
+        async with self._http_session() as client:
             for i, url in enumerate(urls):
                 try:
                     # Rate limiting
@@ -180,7 +190,7 @@ class WebSourcePlugin(BaseSourcePlugin):
         try:
             self.logger.debug(f"Fetching article: {url}")
 
-            response = await client.get(url)
+            response = await client.get(url, **self.client_config)
             response.raise_for_status()
 
             # Parse article content
@@ -391,8 +401,8 @@ class WebSourcePlugin(BaseSourcePlugin):
                     'details': {'source_id': self.source_id}
                 }
 
-            async with httpx.AsyncClient(**self.client_config) as client:
-                response = await client.get(test_url)
+            async with self._http_session() as client:
+                response = await client.get(test_url, **self.client_config)
                 response.raise_for_status()
 
                 # Basic content validation
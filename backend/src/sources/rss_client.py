@@ -8,6 +8,7 @@ Adapted from existing code with async support
 
 import asyncio
 import datetime
+import functools
 import time
 from typing import List, Dict, Any, Optional
 import feedparser
@@ -31,6 +32,9 @@ class RSSClient:
         self.settings = get_settings()
         self.content_cleaner = ContentCleaner()
 
+        # Shared HTTP client (set by ProcessingEngine for the duration of a run)
+        self.http_client: Optional[httpx.AsyncClient] = None
+
         # Default feed configurations
         self.default_feeds = {
             "0x_research": {
@@ -152,9 +156,21 @@ class RSSClient:
             Parsed feed data or None if failed
         """
         try:
-            # Use asyncio to run feedparser in thread pool since it's blocking
+            # Download over the shared pooled client when available; feedparser
+            # is blocking either way, so parsing runs in the thread pool
+            parse = functools.partial(feedparser.parse, rss_url)
+            if self.http_client is not None:
+                response = await self.http_client.get(rss_url, follow_redirects=True)
+                response.raise_for_status()
+                # The headers keep the charset, and content-location the base URL that
+                # relative episode/enclosure links resolve against
+                parse = functools.partial(
+                    feedparser.parse, response.content,
+                    response_headers={**response.headers, "content-location": str(response.url)}
+                )
+
             loop = asyncio.get_event_loop()
-            feed_data = await loop.run_in_executor(None, feedparser.parse, rss_url)
+            feed_data = await loop.run_in_executor(None, parse)
 
             if feed_data.bozo:
                 logger.warning(f"RSS feed parse warning for {rss_url}: {feed_data.bozo_exception}")
@@ -281,13 +297,16 @@ class RSSClient:
                 if ('transcript' in href or 'transcript' in link_type):
                     logger.debug(f"Attempting to fetch transcript from: {link['href']}")
 
-                    async with httpx.AsyncClient() as client:
-                        response = await client.get(link['href'], timeout=10.0)
-                        response.raise_for_status()
+                    if self.http_client is not None:
+                        response = await self.http_client.get(link['href'], timeout=10.0)
+                    else:
+                        async with httpx.AsyncClient() as client:
+                            response = await client.get(link['href'], timeout=10.0)
+                    response.raise_for_status()
 
-                        transcript_content = response.text
-                        logger.info(f"Successfully fetched transcript ({len(transcript_content)} chars)")
-                        return transcript_content
+                    transcript_content = response.text
+                    logger.info(f"Successfully fetched transcript ({len(transcript_content)} chars)")
+                    return transcript_content
 
             return None
 
@@ -7,7 +7,11 @@ Manages different content sources in a plugin-style architecture
 import json
 import os
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Type
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Type
+
+import httpx
+
 from ..core.logging import get_logger
 from ..core.config import get_settings
 from .base_plugin import BaseSourcePlugin, SourcePluginError
@@ -15,6 +19,24 @@ from .base_plugin import BaseSourcePlugin, SourcePluginError
 logger = get_logger(__name__)
 
 
+def _frozen(value: Any) -> Any:
+    """Read-only copy of a config value: dicts become MappingProxyType and lists tuples, recursively"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _frozen(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_frozen(item) for item in value)
+    return value
+
+
+def _thawed(value: Any) -> Any:
+    """Plain, mutable copy of a _frozen() config value"""
+    if isinstance(value, Mapping):
+        return {key: _thawed(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thawed(item) for item in value]
+    return value
+
+
 class SourceManager:
     """
     Manages different content sources using a plugin architecture.
@@ -29,6 +51,13 @@ class SourceManager:
         self.registered_plugins: Dict[str, Type[BaseSourcePlugin]] = {}
         self.configured_sources: Dict[str, Dict[str, Any]] = {}
 
+        # configured_sources_view cache and the settings its ${VAR} references were resolved against
+        self._sources_view: Optional[Mapping[str, Mapping[str, Any]]] = None
+        self._sources_view_settings = None
+
+        # Shared HTTP client handed to plugins (set by ProcessingEngine for the duration of a run)
+        self.http_client: Optional[httpx.AsyncClient] = None
+
         # Initialize
         self._load_default_plugins()
         self._load_source_configurations()
@@ -93,6 +122,7 @@ class SourceManager:
             self._create_default_source_config()
 
         self._migrate_rss_meta_source()
+        self._invalidate_configured_sources()
 
     def _create_default_source_config(self):
         """
@@ -140,6 +170,9 @@ class SourceManager:
             with open(sources_config_path, 'w') as f:
                 json.dump(self.configured_sources, f, indent=2)
 
+            # Every mutation of configured_sources ends up here
+            self._invalidate_configured_sources()
+
             logger.info(f"Saved {len(self.configured_sources)} source configurations to {sources_config_path}")
 
         except Exception as e:
@@ -237,16 +270,35 @@ class SourceManager:
         return list(self.registered_plugins.keys())
 
     def get_configured_sources(self) -> Dict[str, Dict[str, Any]]:
-        """Get all configured sources with resolved environment variables"""
-        resolved_sources = {}
+        """Get all configured sources with resolved environment variables (a copy the caller may modify)"""
+        return _thawed(self.configured_sources_view)
 
-        for source_id, source_config in self.configured_sources.items():
-            resolved_config = source_config.copy()
-            # Resolve environment variables in the config
-            resolved_config['config'] = self._resolve_config_variables(source_config['config'])
-            resolved_sources[source_id] = resolved_config
+    @property
+    def configured_sources_view(self) -> Mapping[str, Mapping[str, Any]]:
+        """
+        Read-only view of configured sources with resolved environment variables.
+
+        Cached until the source configuration is saved or reloaded, or the settings
+        are reloaded (which changes what ${VAR} references resolve to).
+        """
+        settings = get_settings()
+        if self._sources_view is None or settings is not self._sources_view_settings:
+            resolved_sources = {}
+
+            for source_id, source_config in self.configured_sources.items():
+                resolved_config = source_config.copy()
+                # Resolve environment variables in the config
+                resolved_config['config'] = self._resolve_config_variables(source_config['config'], settings)
+                resolved_sources[source_id] = resolved_config
+
+            self._sources_view = _frozen(resolved_sources)
+            self._sources_view_settings = settings
+
+        return self._sources_view
 
-        return resolved_sources
+    def _invalidate_configured_sources(self):
+        """Drop the cached configured_sources_view so it is rebuilt on next access"""
+        self._sources_view = None
 
     def add_source(self, source_id: str, source_type: str, config: Dict[str, Any],
                    name: str = None, enabled: bool = True) -> bool:
@@ -355,6 +407,7 @@ class SourceManager:
 
         plugin_class = self.registered_plugins[source_type]
         plugin = plugin_class(source_id, source_config['config'])
+        plugin.http_client = self.http_client
 
         return await plugin.fetch_content()
 
@@ -414,12 +467,13 @@ class SourceManager:
             'plugin_available': source_config['type'] in self.registered_plugins
         }
 
-    def _resolve_config_variables(self, config: Dict[str, Any]) -> Dict[str, Any]:
+    def _resolve_config_variables(self, config: Dict[str, Any], settings) -> Dict[str, Any]:
         """
         Resolve environment variable references in configuration.
 
         Args:
             config: Configuration dict that may contain ${VAR_NAME} references
+            settings: Settings to look the variables up in before the environment
 
         Returns:
             Configuration with variables resolved
@@ -431,12 +485,12 @@ class SourceManager:
                 # Extract variable name
                 var_name = value[2:-1]
                 # Get from environment or settings
-                resolved_value = getattr(self.settings, var_name.lower(), None)
+                resolved_value = getattr(settings, var_name.lower(), None)
                 if resolved_value is None:
                     resolved_value = os.getenv(var_name, value)  # Keep original if not found
                 resolved_config[key] = resolved_value
             elif isinstance(value, dict):
-                resolved_config[key] = self._resolve_config_variables(value)
+                resolved_config[key] = self._resolve_config_variables(value, settings)
             else:
                 resolved_config[key] = value
 
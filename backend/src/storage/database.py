@@ -19,6 +19,12 @@ from ..core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Maximum number of cached AI summaries; least recently used entries are evicted beyond this
+SUMMARY_CACHE_MAX_ENTRIES = 10000
+
+# Column order of link rows passed to store_links_rows / store_batch
+LINK_COLUMNS = ("url", "title", "description", "image_url", "source", "date", "tags", "enriched")
+
 
 class DatabaseManager:
     """
@@ -47,6 +53,9 @@ class DatabaseManager:
                 # Enable foreign keys
                 await db.execute("PRAGMA foreign_keys = ON")
 
+                # WAL is persistent and lets batched writes commit with a single sync
+                await db.execute("PRAGMA journal_mode = WAL")
+
                 # Create all tables
                 await self._create_tables(db)
 
@@ -344,6 +353,57 @@ class DatabaseManager:
                          )
                          ''')
 
+        # Summary cache table - AI summaries keyed by content hash
+        await db.execute('''
+                         CREATE TABLE IF NOT EXISTS summary_cache
+                         (
+                             content_hash
+                             TEXT
+                             PRIMARY
+                             KEY,
+                             summary
+                             TEXT
+                             NOT
+                             NULL,
+                             created_at
+                             TEXT
+                             DEFAULT
+                             CURRENT_TIMESTAMP
+                         )
+                         ''')
+
+        # Processing logs table - persisted processing log entries
+        await db.execute('''
+                         CREATE TABLE IF NOT EXISTS processing_logs
+                         (
+                             id
+                             INTEGER
+                             PRIMARY
+                             KEY
+                             AUTOINCREMENT,
+                             timestamp
+                             TEXT
+                             NOT
+                             NULL,
+                             level
+                             TEXT
+                             NOT
+                             NULL,
+                             message
+                             TEXT
+                             NOT
+                             NULL,
+                             context
+                             TEXT
+                             DEFAULT
+                             '{}',
+                             created_at
+                             TEXT
+                             DEFAULT
+                             CURRENT_TIMESTAMP
+                         )
+                         ''')
+
     async def _create_indexes(self, db: aiosqlite.Connection):
         """Create database indexes for better performance."""
         indexes = [
@@ -359,6 +419,7 @@ class DatabaseManager:
             "CREATE INDEX IF NOT EXISTS idx_links_date ON links (date)",
             "CREATE INDEX IF NOT EXISTS idx_tags_name ON tags (name)",
             "CREATE INDEX IF NOT EXISTS idx_processing_runs_date ON processing_runs (start_time)",
+            "CREATE INDEX IF NOT EXISTS idx_processing_logs_timestamp ON processing_logs (timestamp)",
         ]
 
         for index_sql in indexes:
@@ -393,39 +454,9 @@ class DatabaseManager:
         Returns:
             List of summary IDs
         """
-        summary_ids = []
-
         try:
             async with aiosqlite.connect(self.db_path) as db:
-                for summary in summaries:
-                    # Insert summary
-                    cursor = await db.execute('''
-                                              INSERT INTO summaries
-                                              (title, source, source_type, date, summary, content_length,
-                                               chunks_processed)
-                                              VALUES (?, ?, ?, ?, ?, ?, ?)
-                                              ''', (
-                                                  summary.get("title", ""),
-                                                  summary.get("source", ""),
-                                                  summary.get("source_type", "newsletter"),
-                                                  summary.get("date", ""),
-                                                  summary.get("summary", ""),
-                                                  summary.get("content_length", 0),
-                                                  summary.get("chunks_processed", 1)
-                                              ))
-
-                    summary_id = cursor.lastrowid
-                    summary_ids.append(summary_id)
-
-                    # Store associated questions
-                    await self._store_questions_for_summary(db, summary_id, summary)
-
-                    # Store associated insights
-                    await self._store_insights_for_summary(db, summary_id, summary)
-
-                    # Update tag usage
-                    await self._update_tag_usage(db, summary.get("tags", []))
-
+                summary_ids = await self._insert_summaries(db, summaries)
                 await db.commit()
 
             logger.info(f"Stored {len(summaries)} summaries in database")
@@ -435,38 +466,113 @@ class DatabaseManager:
             logger.error(f"Error storing summaries: {e}")
             raise
 
-    async def _store_questions_for_summary(self, db: aiosqlite.Connection, summary_id: int, summary: Dict[str, Any]):
-        """Store questions associated with a summary."""
-        questions = summary.get("questions", [])
+    async def store_batch(self, summaries: List[Dict[str, Any]], insights: List[Dict[str, Any]],
+                          link_rows: List[tuple]) -> Dict[str, Any]:
+        """
+        Store summaries, insights and links in a single transaction.
 
-        for question in questions:
-            await db.execute('''
-                             INSERT INTO questions (summary_id, source, question, topic, date)
-                             VALUES (?, ?, ?, ?, ?)
-                             ''', (
-                                 summary_id,
-                                 summary.get("source", ""),
-                                 question,
-                                 ", ".join(summary.get("tags", [])[:3]),
-                                 summary.get("date", "")
-                             ))
-
-    async def _store_insights_for_summary(self, db: aiosqlite.Connection, summary_id: int, summary: Dict[str, Any]):
-        """Store insights associated with a summary."""
-        insights = summary.get("insights", [])
-
-        for insight in insights:
-            await db.execute('''
-                             INSERT INTO insights (summary_id, source, topic, insight, tags, date)
-                             VALUES (?, ?, ?, ?, ?, ?)
-                             ''', (
-                                 summary_id,
+        Args:
+            summaries: List of summary dictionaries
+            insights: List of standalone insight dictionaries
+            link_rows: List of link rows in LINK_COLUMNS order
+
+        Returns:
+            Dictionary with stored summary IDs and insight/link counts
+        """
+        try:
+            async with aiosqlite.connect(self.db_path) as db:
+                # One commit for the whole batch; WAL makes it a single sync
+                await db.execute("PRAGMA synchronous = NORMAL")
+
+                summary_ids = await self._insert_summaries(db, summaries)
+                insights_stored = await self._insert_insights(db, insights)
+                links_stored = await self._insert_link_rows(db, link_rows)
+
+                await db.commit()
+
+            logger.info(f"Stored {len(summary_ids)} summaries, {insights_stored} insights "
+                        f"and {links_stored} new links in database")
+            return {
+                "summary_ids": summary_ids,
+                "insights_stored": insights_stored,
+                "links_stored": links_stored
+            }
+
+        except Exception as e:
+            logger.error(f"Error storing batch: {e}")
+            raise
+
+    async def _insert_summaries(self, db: aiosqlite.Connection, summaries: List[Dict[str, Any]]) -> List[int]:
+        """Insert summaries with their questions, insights and tag usage (caller commits)."""
+        if not summaries:
+            return []
+
+        await db.executemany('''
+                             INSERT INTO summaries
+                             (title, source, source_type, date, summary, content_length,
+                              chunks_processed)
+                             VALUES (?, ?, ?, ?, ?, ?, ?)
+                             ''', [(
+                                 summary.get("title", ""),
                                  summary.get("source", ""),
-                                 ", ".join(summary.get("tags", [])[:3]),
-                                 insight,
-                                 ", ".join(summary.get("tags", [])),
-                                 summary.get("date", "")
-                             ))
+                                 summary.get("source_type", "newsletter"),
+                                 summary.get("date", ""),
+                                 summary.get("summary", ""),
+                                 summary.get("content_length", 0),
+                                 summary.get("chunks_processed", 1)
+                             ) for summary in summaries])
+
+        # The open transaction holds the write lock, so the new rows got consecutive IDs
+        cursor = await db.execute("SELECT last_insert_rowid()")
+        (last_id,) = await cursor.fetchone()
+        summary_ids = list(range(last_id - len(summaries) + 1, last_id + 1))
+
+        question_rows = []
+        insight_rows = []
+        tags = []
+        for summary_id, summary in zip(summary_ids, summaries):
+            question_rows.extend(self._question_rows(summary_id, summary))
+            insight_rows.extend(self._insight_rows(summary_id, summary))
+            tags.extend(summary.get("tags", []))
+
+        # Store associated questions
+        if question_rows:
+            await db.executemany('''
+                                 INSERT INTO questions (summary_id, source, question, topic, date)
+                                 VALUES (?, ?, ?, ?, ?)
+                                 ''', question_rows)
+
+        # Store associated insights
+        if insight_rows:
+            await db.executemany('''
+                                 INSERT INTO insights (summary_id, source, topic, insight, tags, date)
+                                 VALUES (?, ?, ?, ?, ?, ?)
+                                 ''', insight_rows)
+
+        # Update tag usage
+        await self._update_tag_usage(db, tags)
+
+        return summary_ids
+
+    @staticmethod
+    def _question_rows(summary_id: int, summary: Dict[str, Any]) -> List[tuple]:
+        """Build question rows associated with a summary."""
+        source = summary.get("source", "")
+        topic = ", ".join(summary.get("tags", [])[:3])
+        date = summary.get("date", "")
+
+        return [(summary_id, source, question, topic, date) for question in summary.get("questions", [])]
+
+    @staticmethod
+    def _insight_rows(summary_id: int, summary: Dict[str, Any]) -> List[tuple]:
+        """Build insight rows associated with a summary."""
+        source = summary.get("source", "")
+        tags = summary.get("tags", [])
+        topic = ", ".join(tags[:3])
+        tags_text = ", ".join(tags)
+        date = summary.get("date", "")
+
+        return [(summary_id, source, topic, insight, tags_text, date) for insight in summary.get("insights", [])]
 
     async def store_links(self, links: List[Dict[str, Any]]) -> int:
         """
@@ -483,33 +589,32 @@ class DatabaseManager:
 
         try:
             async with aiosqlite.connect(self.db_path) as db:
-                count = 0
+                count = await self._insert_links(db, links)
+                await db.commit()
 
-                for link in links:
-                    # Check if link already exists
-                    cursor = await db.execute("SELECT id FROM links WHERE url = ?", (link.get("url", ""),))
-                    existing = await cursor.fetchone()
+            logger.info(f"Stored {count} new links in database")
+            return count
 
-                    if existing:
-                        continue  # Skip duplicates
+        except Exception as e:
+            logger.error(f"Error storing links: {e}")
+            raise
 
-                    await db.execute('''
-                                     INSERT INTO links
-                                         (url, title, description, image_url, source, date, tags, enriched)
-                                     VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                                     ''', (
-                                         link.get("url", ""),
-                                         link.get("title", ""),
-                                         link.get("description", ""),
-                                         link.get("image_url", ""),
-                                         link.get("source", ""),
-                                         link.get("date", ""),
-                                         ", ".join(link.get("tags", [])),
-                                         bool(link.get("description"))  # Assume enriched if has description
-                                     ))
+    async def store_links_rows(self, rows: List[tuple]) -> int:
+        """
+        Store pre-shaped link rows in database.
 
-                    count += 1
+        Args:
+            rows: List of link rows in LINK_COLUMNS order
 
+        Returns:
+            Number of links stored
+        """
+        if not rows:
+            return 0
+
+        try:
+            async with aiosqlite.connect(self.db_path) as db:
+                count = await self._insert_link_rows(db, rows)
                 await db.commit()
 
             logger.info(f"Stored {count} new links in database")
@@ -519,6 +624,42 @@ class DatabaseManager:
             logger.error(f"Error storing links: {e}")
             raise
 
+    @staticmethod
+    def link_row(link: Dict[str, Any], source: str, date: str) -> tuple:
+        """Shape a link dictionary into a row in LINK_COLUMNS order."""
+        description = link.get("description", "")
+        return (
+            link.get("url", ""),
+            link.get("title", ""),
+            description,
+            link.get("image_url", ""),
+            source,
+            date,
+            ", ".join(link.get("tags", [])),
+            bool(description)  # Assume enriched if has description
+        )
+
+    async def _insert_links(self, db: aiosqlite.Connection, links: List[Dict[str, Any]]) -> int:
+        """Insert links whose URL is not stored yet (caller commits). Returns the number inserted."""
+        return await self._insert_link_rows(db, [
+            self.link_row(link, link.get("source", ""), link.get("date", "")) for link in links
+        ])
+
+    async def _insert_link_rows(self, db: aiosqlite.Connection, rows: List[tuple]) -> int:
+        """Insert link rows whose URL is not stored yet (caller commits). Returns the number inserted."""
+        if not rows:
+            return 0
+
+        # Duplicate URLs (already stored, or earlier in this batch) are skipped by the NOT EXISTS guard
+        cursor = await db.executemany('''
+                                      INSERT INTO links
+                                          (url, title, description, image_url, source, date, tags, enriched)
+                                      SELECT ?, ?, ?, ?, ?, ?, ?, ?
+                                      WHERE NOT EXISTS (SELECT 1 FROM links WHERE url = ?)
+                                      ''', [row + (row[0],) for row in rows])
+
+        return cursor.rowcount
+
     async def store_insights(self, insights: List[Dict[str, Any]]) -> int:
         """
         Store standalone insights in database.
@@ -561,28 +702,17 @@ class DatabaseManager:
 
     async def _update_tag_usage(self, db: aiosqlite.Connection, tags: List[str]):
         """Update tag usage statistics."""
-        for tag in tags:
-            if not tag:
-                continue
-
-            # Check if tag exists
-            cursor = await db.execute("SELECT usage_count FROM tags WHERE name = ?", (tag,))
-            existing = await cursor.fetchone()
-
-            if existing:
-                # Update existing tag
-                await db.execute('''
-                                 UPDATE tags
-                                 SET usage_count = usage_count + 1,
-                                     last_used   = CURRENT_TIMESTAMP
-                                 WHERE name = ?
-                                 ''', (tag,))
-            else:
-                # Insert new tag
-                await db.execute('''
-                                 INSERT INTO tags (name, usage_count, last_used)
-                                 VALUES (?, 1, CURRENT_TIMESTAMP)
-                                 ''', (tag,))
+        tags = [tag for tag in tags if tag]
+        if not tags:
+            return
+
+        # Insert new tags or bump usage of existing ones (tags.name is UNIQUE)
+        await db.executemany('''
+                             INSERT INTO tags (name, usage_count, last_used)
+                             VALUES (?, 1, CURRENT_TIMESTAMP)
+                             ON CONFLICT(name) DO UPDATE SET usage_count = usage_count + 1,
+                                                             last_used   = CURRENT_TIMESTAMP
+                             ''', [(tag,) for tag in tags])
 
     async def get_recent_summaries(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -812,6 +942,12 @@ class DatabaseManager:
                 # Delete old processing runs
                 await db.execute("DELETE FROM processing_runs WHERE start_time < ?", (cutoff_date,))
 
+                # Delete old cached AI summaries
+                await db.execute("DELETE FROM summary_cache WHERE created_at < ?", (cutoff_date,))
+
+                # Delete old processing logs
+                await db.execute("DELETE FROM processing_logs WHERE timestamp < ?", (cutoff_date,))
+
                 # Clean up unused tags
                 await db.execute('''
                                  DELETE
@@ -1127,6 +1263,101 @@ class DatabaseManager:
             logger.error(f"Error searching links: {e}")
             raise
 
+    async def get_cached_summary(self, content_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached AI summary by content hash.
+
+        Args:
+            content_hash: Hash of the summarized content
+
+        Returns:
+            Summary dictionary, or None if not cached
+        """
+        try:
+            async with aiosqlite.connect(self.db_path) as db:
+                cursor = await db.execute("SELECT summary FROM summary_cache WHERE content_hash = ?",
+                                          (content_hash,))
+                row = await cursor.fetchone()
+
+                if row:
+                    # Refresh the entry so eviction by created_at is least-recently-used
+                    await db.execute("UPDATE summary_cache SET created_at = ? WHERE content_hash = ?",
+                                     (datetime.now().isoformat(), content_hash))
+                    await db.commit()
+
+            return json.loads(row[0]) if row else None
+
+        except Exception as e:
+            logger.warning(f"Error reading summary cache: {e}")
+            return None
+
+    async def store_cached_summary(self, content_hash: str, summary: Dict[str, Any]):
+        """
+        Cache an AI summary by content hash.
+
+        Args:
+            content_hash: Hash of the summarized content
+            summary: Summary dictionary to cache
+        """
+        try:
+            async with aiosqlite.connect(self.db_path) as db:
+                await db.execute('''
+                                 INSERT OR REPLACE INTO summary_cache (content_hash, summary, created_at)
+                                 VALUES (?, ?, ?)
+                                 ''', (content_hash, json.dumps(summary), datetime.now().isoformat()))
+
+                # Evict least recently used entries beyond the size limit
+                await db.execute('''
+                                 DELETE
+                                 FROM summary_cache
+                                 WHERE content_hash IN (SELECT content_hash
+                                                        FROM summary_cache
+                                                        ORDER BY created_at DESC
+                                                            LIMIT -1 OFFSET ?)
+                                 ''', (SUMMARY_CACHE_MAX_ENTRIES,))
+                await db.commit()
+
+        except Exception as e:
+            logger.warning(f"Error writing summary cache: {e}")
+
+    async def store_logs_batch(self, entries: List[Dict[str, Any]]) -> int:
+        """
+        Persist a batch of processing log entries in one transaction.
+
+        Args:
+            entries: Log entry dictionaries with timestamp, level, message and extra context
+
+        Returns:
+            Number of entries stored
+        """
+        if not entries:
+            return 0
+
+        rows = []
+        for entry in entries:
+            context = {k: v for k, v in entry.items() if k not in ("timestamp", "level", "message")}
+            timestamp = entry.get("timestamp")
+            rows.append((
+                timestamp.isoformat() if isinstance(timestamp, datetime) else str(timestamp),
+                entry.get("level", "info"),
+                entry.get("message", ""),
+                json.dumps(context, default=str)
+            ))
+
+        try:
+            async with aiosqlite.connect(self.db_path) as db:
+                await db.executemany('''
+                                     INSERT INTO processing_logs (timestamp, level, message, context)
+                                     VALUES (?, ?, ?, ?)
+                                     ''', rows)
+                await db.commit()
+
+            return len(rows)
+
+        except Exception as e:
+            logger.warning(f"Error storing processing logs: {e}")
+            return 0
+
     async def get_summaries_since(self, since_date: datetime) -> List[Dict[str, Any]]:
         """Get summaries created since a specific date."""
         try:
@@ -1246,6 +1477,47 @@ class DatabaseManager:
             logger.error(f"Error getting latest weekly summary: {e}")
             return None
 
+    async def get_weekly_generation_state(self, recent_since: datetime) -> Dict[str, Any]:
+        """
+        Get everything needed to decide on weekly summary generation in one query.
+
+        Args:
+            recent_since: Start of the "recent" window used when no weekly summary exists yet
+
+        Returns:
+            Dictionary with latest_weekly_date (None if there is no weekly summary),
+            non_weekly_summary_count_since (summaries dated after it) and
+            count_last_7d (summaries dated on or after recent_since)
+        """
+        try:
+            query = """
+                    WITH latest AS (SELECT date
+                                    FROM summaries
+                                    WHERE source_type = 'weekly_summary'
+                                    ORDER BY date DESC, created_at DESC
+                                        LIMIT 1)
+                    SELECT (SELECT date FROM latest) AS latest_weekly_date,
+                           (SELECT COUNT(*)
+                            FROM summaries
+                            WHERE source_type != 'weekly_summary'
+                              AND date > (SELECT date FROM latest)) AS non_weekly_summary_count_since,
+                           (SELECT COUNT(*)
+                            FROM summaries
+                            WHERE source_type != 'weekly_summary'
+                              AND date >= ?) AS count_last_7d \
+                    """
+
+            async with aiosqlite.connect(self.db_path) as db:
+                db.row_factory = aiosqlite.Row
+                cursor = await db.execute(query, (recent_since.isoformat(),))
+                row = await cursor.fetchone()
+
+                return dict(row)
+
+        except Exception as e:
+            logger.error(f"Error getting weekly generation state: {e}")
+            raise
+
     async def get_weekly_summaries(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent weekly summaries."""
         try:
@@ -1590,22 +1862,8 @@ class DatabaseManager:
             Success status
         """
         try:
-            query = """
-            INSERT INTO insights (summary_id, source, topic, insight, tags, date, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, datetime('now'))
-            """
-
             async with aiosqlite.connect(self.db_path) as db:
-                for insight in insights:
-                    await db.execute(query, [
-                        insight.get("summary_id"),  # Can be null for legacy insights
-                        insight.get("source", ""),
-                        insight.get("topic", ""),
-                        insight.get("insight", ""),
-                        json.dumps(insight.get("tags", [])),
-                        insight.get("date", "")
-                    ])
-
+                await self._insert_insights(db, insights)
                 await db.commit()
 
             logger.info(f"Stored {len(insights)} insights successfully")
@@ -1613,4 +1871,25 @@ class DatabaseManager:
 
         except Exception as e:
             logger.error(f"Error storing insights: {e}")
-            return False
\ No newline at end of file
+            return False
+
+    async def _insert_insights(self, db: aiosqlite.Connection, insights: List[Dict[str, Any]]) -> int:
+        """Insert standalone insights (caller commits). Returns the number inserted."""
+        if not insights:
+            return 0
+
+        query = """
+        INSERT INTO insights (summary_id, source, topic, insight, tags, date, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, datetime('now'))
+        """
+
+        await db.executemany(query, [(
+            insight.get("summary_id"),  # Can be null for legacy insights
+            insight.get("source", ""),
+            insight.get("topic", ""),
+            insight.get("insight", ""),
+            json.dumps(insight.get("tags", [])),
+            insight.get("date", "")
+        ) for insight in insights])
+
+        return len(insights)
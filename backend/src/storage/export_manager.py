@@ -6,13 +6,16 @@ Handles generating various export formats (Obsidian, JSON, CSV, etc.)
 Enhanced from existing code with multiple export formats and async support
 """
 
-import json
+import asyncio
+import io
 import csv
 import datetime
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 import tempfile
 
+import orjson
+
 from ..core.config import get_settings
 from ..core.logging import get_logger
 
@@ -45,8 +48,8 @@ class ExportManager:
                 logger.warning("No summaries provided for Obsidian export")
                 return None
 
-            # Generate markdown content
-            markdown_content = self._generate_obsidian_content(summaries)
+            # Render markdown off the event loop
+            markdown_content = await asyncio.to_thread(self._generate_obsidian_content, summaries)
 
             # Build output directory with summaries subfolder
             vault_path = self.settings.obsidian_vault_path
@@ -61,9 +64,8 @@ class ExportManager:
             filename = f"Weekly Summary {today}.md"
             file_path = output_dir / filename
 
-            # Write file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+            # Write file off the event loop
+            await asyncio.to_thread(self._write_text, file_path, markdown_content)
 
             logger.info(f"Generated Obsidian summary: {file_path}")
             return file_path
@@ -72,6 +74,27 @@ class ExportManager:
             logger.error(f"Error generating Obsidian summary: {e}")
             return None
 
+    @staticmethod
+    def _write_text(file_path: Path, content: str):
+        """Write text content to a file (blocking; run via asyncio.to_thread)."""
+        # Encode once and hand the whole buffer to the kernel in one write
+        file_path.write_bytes(content.encode('utf-8'))
+
+    @staticmethod
+    def _write_json(file_path: Path, data: Any):
+        """Serialize data as indented UTF-8 JSON and write it (blocking; run via asyncio.to_thread)."""
+        file_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+    @staticmethod
+    def _remove_files(file_paths: List[Path]) -> List[Path]:
+        """Delete existing files (blocking; run via asyncio.to_thread). Returns the files removed."""
+        removed = []
+        for file_path in file_paths:
+            if file_path.exists():
+                file_path.unlink()
+                removed.append(file_path)
+        return removed
+
     def _generate_obsidian_content(self, summaries: List[Dict[str, Any]]) -> str:
         """Generate Obsidian markdown content."""
         from datetime import datetime
@@ -267,9 +290,8 @@ class ExportManager:
             # Ensure directory exists
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Write JSON file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            # Serialize and write JSON file off the event loop
+            await asyncio.to_thread(self._write_json, file_path, export_data)
 
             logger.info(f"Generated JSON export: {file_path}")
             return file_path
@@ -307,23 +329,26 @@ class ExportManager:
                 'tags', 'questions', 'content_length', 'chunks_processed'
             ]
 
-            # Write CSV file
-            with open(file_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=columns)
-                writer.writeheader()
+            # Build CSV content in memory
+            buffer = io.StringIO(newline='')
+            writer = csv.DictWriter(buffer, fieldnames=columns)
+            writer.writeheader()
 
-                for summary in summaries:
-                    row = {}
-                    for col in columns:
-                        value = summary.get(col, '')
+            for summary in summaries:
+                row = {}
+                for col in columns:
+                    value = summary.get(col, '')
 
-                        # Convert lists to strings for CSV
-                        if isinstance(value, list):
-                            value = '; '.join(str(item) for item in value)
+                    # Convert lists to strings for CSV
+                    if isinstance(value, list):
+                        value = '; '.join(str(item) for item in value)
 
-                        row[col] = value
+                    row[col] = value
 
-                    writer.writerow(row)
+                writer.writerow(row)
+
+            # Write CSV file off the event loop
+            await asyncio.to_thread(self._write_text, file_path, buffer.getvalue())
 
             logger.info(f"Generated CSV export: {file_path}")
             return file_path
@@ -360,9 +385,8 @@ class ExportManager:
             # Generate markdown content
             markdown_content = self._generate_links_markdown(links, group_by)
 
-            # Write file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+            # Write file off the event loop
+            await asyncio.to_thread(self._write_text, file_path, markdown_content)
 
             logger.info(f"Generated links export: {file_path}")
             return file_path
@@ -510,9 +534,8 @@ class ExportManager:
             file_path = self.settings.exports_dir / output_filename
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Write file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # Write file off the event loop
+            await asyncio.to_thread(self._write_text, file_path, content)
 
             logger.info(f"Generated custom export: {file_path}")
             return file_path
@@ -524,10 +547,10 @@ class ExportManager:
     async def cleanup_temp_files(self):
         """Clean up temporary files created during export operations."""
         try:
-            for temp_file in self.temp_files:
-                if temp_file.exists():
-                    temp_file.unlink()
-                    logger.debug(f"Cleaned up temp file: {temp_file}")
+            # Remove all tracked files in a single worker-thread hop
+            removed = await asyncio.to_thread(self._remove_files, list(self.temp_files))
+            for temp_file in removed:
+                logger.debug(f"Cleaned up temp file: {temp_file}")
 
             self.temp_files.clear()
             logger.info("Cleaned up all temporary export files")
@@ -582,14 +605,15 @@ class ExportManager:
         results = {}
 
         try:
-            # Obsidian export
-            results["obsidian"] = await self.generate_obsidian_summary(summaries)
-
-            # JSON export
-            results["json"] = await self.generate_json_export(summaries)
-
-            # CSV export
-            results["csv"] = await self.generate_csv_export(summaries)
+            # Each generator handles its own errors (returning None), so they can run side by side
+            async with asyncio.TaskGroup() as tg:
+                obsidian_task = tg.create_task(self.generate_obsidian_summary(summaries))
+                json_task = tg.create_task(self.generate_json_export(summaries))
+                csv_task = tg.create_task(self.generate_csv_export(summaries))
+
+            results["obsidian"] = obsidian_task.result()
+            results["json"] = json_task.result()
+            results["csv"] = csv_task.result()
 
             # Extract links from summaries for links export
             all_links = []
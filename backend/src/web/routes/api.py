@@ -6,7 +6,7 @@ Handles processing, status, and data retrieval endpoints
 
 import asyncio
 import aiosqlite
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 from fastapi import APIRouter, HTTPException, BackgroundTasks, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel
 from pathlib import Path
@@ -102,15 +102,18 @@ async def websocket_processing_updates(websocket: WebSocket):
             websocket_connections.remove(websocket)
 
 
-async def broadcast_to_websockets(message: Dict[str, Any]):
-    """Broadcast message to all connected WebSocket clients"""
+async def broadcast_to_websockets(message: Union[Dict[str, Any], str]):
+    """Broadcast message (a dict, or already serialized JSON text) to all connected WebSocket clients"""
     if not websocket_connections:
         return
 
     disconnected = []
     for websocket in websocket_connections:
         try:
-            await websocket.send_json(message)
+            if isinstance(message, str):
+                await websocket.send_text(message)
+            else:
+                await websocket.send_json(message)
         except Exception as e:
             logger.warning(f"Failed to send WebSocket message: {e}")
             disconnected.append(websocket)
@@ -122,10 +125,7 @@ async def broadcast_to_websockets(message: Dict[str, Any]):
 
 def processing_progress_callback(state):
     """Callback for processing progress updates"""
-    asyncio.create_task(broadcast_to_websockets({
-        "type": "processing_update",
-        "data": state.to_dict()
-    }))
+    asyncio.create_task(broadcast_to_websockets(state.to_json("processing_update").decode()))
 
 
 # Add callback to processing engine
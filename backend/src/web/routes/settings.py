@@ -439,23 +439,8 @@ async def save_settings(update: SettingsUpdate):
 
         # Reload configuration to pick up changes
         try:
-            # Force reload environment variables before loading settings
-            import os
-            from pathlib import Path
-
-            env_path = Path("/app/.env")  # ← Absolute path to root .env
-            if env_path.exists():
-                with open(env_path, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith('#') and '=' in line:
-                            try:
-                                key, value = line.split('=', 1)
-                                os.environ[key.strip()] = value.strip().strip('"\'')
-                            except ValueError:
-                                continue
-
-            config_manager.load_settings()
+            # Re-reads .env and overrides the stale values in os.environ
+            config_manager.reload()
             logger.info("Configuration reloaded successfully with fresh environment variables")
         except Exception as e:
             logger.warning(f"Failed to reload configuration: {e}")
@@ -570,13 +555,13 @@ async def validate_current_settings():
 
         validation_result = {
             "valid": len(missing_requirements) == 0,
-            "api_keys_valid": api_validation,
+            "api_keys_valid": api_validation.to_dict(),
             "missing_requirements": missing_requirements,
             "warnings": []
         }
 
         # Add warnings for optional configurations
-        if not api_validation.get("linkpreview", True):
+        if not api_validation.linkpreview:
             validation_result["warnings"].append(
                 "LinkPreview API key not configured (link enrichment will be disabled)")
 
@@ -90,7 +90,7 @@ async def get_setup_status():
         status = {
             "is_configured": is_configured,
             "missing_requirements": missing_requirements,
-            "api_keys_valid": api_validation,
+            "api_keys_valid": api_validation.to_dict(),
             "configuration": {
                 "email_configured": bool(settings.email_username and settings.email_password),
                 "claude_configured": bool(settings.claude_api_key),
@@ -245,11 +245,10 @@ async def test_linkpreview_api(api_key: str):
                 "error": "API key is required"
             }
 
-        # Create temporary link enricher with the provided key
-        enricher = LinkEnricher(api_key=api_key)
-
-        # Test the API
-        test_result = await enricher.test_api()
+        # Create temporary link enricher with the provided key, closing its HTTP client afterwards
+        async with LinkEnricher(api_key=api_key) as enricher:
+            # Test the API
+            test_result = await enricher.test_api()
 
         return {
             "success": test_result,
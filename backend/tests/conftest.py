@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Shared fixtures for the backend tests
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Tests import the application as the src package
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+@pytest.fixture
+def settings_env(tmp_path, monkeypatch):
+    """
+    Minimal valid settings environment rooted in tmp_path.
+
+    Runs from tmp_path (so no stray .env is picked up) with a fresh ConfigManager,
+    which get_settings() uses until the test ends. Returns the ConfigManager.
+    """
+    config = pytest.importorskip("src.core.config")
+
+    monkeypatch.chdir(tmp_path)
+    for name, value in {
+        "CLAUDE_API_KEY": "sk-ant-test-key-0123456789",
+        "EMAIL_USERNAME": "reader@example.com",
+        "EMAIL_PASSWORD": "app-password",
+        "NOTIFICATION_EMAIL": "reader@example.com",
+        "DATA_DIR": str(tmp_path / "data"),
+        "OBSIDIAN_VAULT_PATH": str(tmp_path / "obsidian"),
+    }.items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.delenv("CONFIG_CACHE", raising=False)
+
+    manager = config.ConfigManager()
+    monkeypatch.setattr(config, "config_manager", manager)
+    return manager
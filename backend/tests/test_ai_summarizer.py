@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests for AISummarizer response parsing
+Section splitting (exact headers and the tolerant fallback) and the parsed summary fields
+"""
+
+import pytest
+
+pytest.importorskip("anthropic")
+pytest.importorskip("structlog")
+pytest.importorskip("pydantic_settings")
+
+from src.processing.ai_summarizer import AISummarizer  # noqa: E402
+
+
+WELL_FORMED_RESPONSE = """SUMMARY:
+## Funding round
+- Acme raised $40M led by Example Ventures
+- Revenue doubled to $12M in 2024
+Growth came mostly from enterprise customers.
+
+KEY INSIGHTS:
+1. Enterprise contracts now make up 70% of revenue,
+   up from 40% a year earlier
+2. The round values Acme at $400M
+
+QUESTIONS FOR EXPERTS:
+1. Can the enterprise growth rate hold?
+- What does the valuation imply for competitors?
+
+TAGS: #startups, AI, venture, Finance
+"""
+
+
+@pytest.fixture
+def summarizer(settings_env):
+    return AISummarizer()
+
+
+def test_split_sections_slices_the_prompt_headers():
+    summary, key_insights, questions, tags = AISummarizer._split_sections(WELL_FORMED_RESPONSE)
+
+    assert summary.strip().startswith("## Funding round")
+    assert key_insights.strip().startswith("1. Enterprise contracts")
+    assert questions.strip().startswith("1. Can the enterprise")
+    assert tags.strip() == "#startups, AI, venture, Finance"
+
+
+def test_split_sections_without_key_insights():
+    sections = AISummarizer._split_sections("SUMMARY: text\nQUESTIONS FOR EXPERTS: why?\nTAGS: ai")
+
+    assert sections == (" text\n", None, " why?\n", " ai")
+
+
+@pytest.mark.parametrize("response_text", [
+    "SUMMARY: text\nTAGS: ai",  # No questions header
+    "TAGS: ai\nQUESTIONS FOR EXPERTS: why?\nSUMMARY: text",  # Headers out of order
+    "Summary: text\nQuestions for experts: why?\nTags: ai",  # Not the exact headers
+])
+def test_split_sections_rejects_other_layouts(response_text):
+    assert AISummarizer._split_sections(response_text) is None
+
+
+def test_parse_well_formed_response(summarizer):
+    parsed = summarizer._parse_claude_response(WELL_FORMED_RESPONSE)
+
+    assert parsed["summary"].startswith("Funding round\n- Acme raised")
+    assert parsed["insights"] == [
+        "Acme raised $40M led by Example Ventures",
+        "Revenue doubled to $12M in 2024",
+    ]
+    assert parsed["strategic_insights"] == [
+        "Enterprise contracts now make up 70% of revenue, up from 40% a year earlier",
+        "The round values Acme at $400M",
+    ]
+    assert parsed["questions"] == [
+        "Can the enterprise growth rate hold?",
+        "What does the valuation imply for competitors?",
+    ]
+    # Priority tags first, then others up to three
+    assert parsed["tags"] == ["ai", "finance", "startups"]
+    assert "error" not in parsed
+
+
+def test_parse_loosely_formatted_response(summarizer):
+    parsed = summarizer._parse_claude_response(
+        "Summary: Markets rallied.\n\nQuestions for Experts:\n1. Will it last?\n\nTags: #markets #finance"
+    )
+
+    assert parsed["summary"] == "Markets rallied."
+    assert parsed["questions"] == ["Will it last?"]
+    assert parsed["tags"] == ["markets", "finance"]
+    assert parsed["strategic_insights"] == []
+
+
+def test_parse_response_without_sections(summarizer):
+    parsed = summarizer._parse_claude_response("I could not summarize this content.")
+
+    assert parsed["summary"] == "No summary available."
+    assert parsed["insights"] == []
+    assert parsed["questions"] == []
+    assert parsed["tags"] == []
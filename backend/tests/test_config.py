@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Tests for ConfigManager
+Settings memoized on the .env file's mtime, .env precedence, and the CONFIG_CACHE settings cache
+"""
+
+import json
+import os
+import stat
+
+import pytest
+
+pytest.importorskip("pydantic_settings")
+pytest.importorskip("dotenv")
+
+from src.core.config import ConfigManager, SETTINGS_CACHE_FILE  # noqa: E402
+
+
+@pytest.fixture
+def env_file(settings_env, tmp_path, monkeypatch):
+    """Write the .env file in tmp_path with a fresh mtime; variables it exports are unset after the test"""
+    for name in ("CLAUDE_MODEL", "MAX_TOKENS"):
+        # Recorded by monkeypatch, so values ConfigManager exports are removed again afterwards
+        monkeypatch.setenv(name, "")
+        monkeypatch.delenv(name)
+
+    path = tmp_path / ".env"
+    writes = 0
+
+    def write(text):
+        nonlocal writes
+        path.write_text(text)
+        # Distinct mtimes even on filesystems with coarse timestamps
+        writes += 1
+        os.utime(path, ns=(writes * 10**9, writes * 10**9))
+        return path
+
+    return write
+
+
+def test_settings_are_memoized_while_env_file_is_unchanged(settings_env, env_file):
+    env_file("CLAUDE_MODEL=model-a\n")
+
+    assert settings_env.settings is settings_env.settings
+    assert settings_env.settings.claude_model == "model-a"
+
+
+def test_env_file_change_rebuilds_settings(settings_env, env_file):
+    env_file("CLAUDE_MODEL=model-a\nMAX_TOKENS=1234\n")
+    first = settings_env.settings
+
+    env_file("CLAUDE_MODEL=model-b\n")
+    second = settings_env.settings
+
+    assert second is not first
+    assert second.claude_model == "model-b"
+    # Dropped from the file, so the default applies again
+    assert second.max_tokens == 2000
+
+
+def test_environment_wins_over_env_file_unless_reloaded(settings_env, env_file, monkeypatch):
+    monkeypatch.setenv("CLAUDE_MODEL", "from-environment")
+    env_file("CLAUDE_MODEL=from-file\n")
+
+    assert settings_env.settings.claude_model == "from-environment"
+    assert settings_env.reload().claude_model == "from-file"
+
+
+def test_config_cache_is_written_owner_only(settings_env, env_file, tmp_path, monkeypatch):
+    monkeypatch.setenv("CONFIG_CACHE", "1")
+    env_file("CLAUDE_MODEL=model-a\n")
+    cache_path = tmp_path / SETTINGS_CACHE_FILE
+    cache_path.write_text("{}")
+    cache_path.chmod(0o644)
+
+    settings_env.load_settings()
+
+    assert stat.S_IMODE(cache_path.stat().st_mode) == 0o600
+    assert json.loads(cache_path.read_text())["settings"]["claude_model"] == "model-a"
+
+
+def test_config_cache_is_used_while_environment_is_unchanged(settings_env, env_file, tmp_path, monkeypatch):
+    monkeypatch.setenv("CONFIG_CACHE", "1")
+    env_file("CLAUDE_MODEL=model-a\n")
+    settings_env.load_settings()
+
+    # Tamper with the cached values: a manager that reads them proves validation was skipped
+    cache_path = tmp_path / SETTINGS_CACHE_FILE
+    cached = json.loads(cache_path.read_text())
+    cached["settings"]["claude_model"] = "from-cache"
+    cache_path.write_text(json.dumps(cached))
+
+    assert ConfigManager().load_settings().claude_model == "from-cache"
+
+
+def test_config_cache_is_ignored_after_environment_changes(settings_env, env_file, tmp_path, monkeypatch):
+    monkeypatch.setenv("CONFIG_CACHE", "1")
+    env_file("CLAUDE_MODEL=model-a\n")
+    settings_env.load_settings()
+
+    cache_path = tmp_path / SETTINGS_CACHE_FILE
+    cached = json.loads(cache_path.read_text())
+    cached["settings"]["claude_model"] = "from-cache"
+    cache_path.write_text(json.dumps(cached))
+
+    monkeypatch.setenv("MAX_TOKENS", "4321")
+    settings = ConfigManager().load_settings()
+
+    assert settings.claude_model == "model-a"
+    assert settings.max_tokens == 4321
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Tests for EnhancedInsightsExtractor
+Placeholder summaries (low-signal, empty or failed content) must not cost a Claude call
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("structlog")
+pytest.importorskip("pydantic_settings")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.processing.insights_extractor import EnhancedInsightsExtractor  # noqa: E402
+
+
+class RecordingSummarizer:
+    """Stands in for AISummarizer, recording create_message calls"""
+
+    def __init__(self):
+        self.settings = SimpleNamespace(claude_model="test-model", ai_insights_batch_size=6)
+        self.calls = []
+
+    async def create_message(self, **kwargs):
+        self.calls.append(kwargs)
+        return SimpleNamespace(content=[SimpleNamespace(text="INSIGHTS:\n1. Revenue grew 40% to $2B in 2024")])
+
+
+def low_signal_summary():
+    """Summary as AISummarizer._create_empty_summary builds it for low-signal content"""
+    return {
+        "title": "Weekly update",
+        "source": "Test Newsletter",
+        "summary": "No content available for summarization.",
+        "insights": [],
+        "reason": "low_signal",
+        "error": "Content too thin to summarize"
+    }
+
+
+def test_low_signal_summary_makes_no_claude_call():
+    summarizer = RecordingSummarizer()
+    extractor = EnhancedInsightsExtractor(summarizer)
+
+    insights = asyncio.run(extractor.extract_strategic_insights(low_signal_summary()))
+
+    assert insights == []
+    assert summarizer.calls == []
+
+
+def test_batch_skips_placeholder_summaries():
+    summarizer = RecordingSummarizer()
+    extractor = EnhancedInsightsExtractor(summarizer)
+    failed_summary = {
+        "title": "Broken item",
+        "source": "Test Feed",
+        "summary": "Summarization failed: timeout",
+        "error": "timeout"
+    }
+
+    results = asyncio.run(extractor.extract_strategic_insights_batch([low_signal_summary(), failed_summary]))
+
+    assert results == [[], []]
+    assert summarizer.calls == []
+
+
+def test_split_batch_response_keys_sections_by_summary_number():
+    response_text = (
+        "Here are the insights.\n"
+        "=== Summary 1 ===\n"
+        "INSIGHTS:\n1. First summary insight\n"
+        "  === Summary 2 ===  \n"
+        "INSIGHTS:\n1. Second summary insight\n"
+    )
+
+    sections = EnhancedInsightsExtractor._split_batch_response(response_text)
+
+    assert sections == {
+        1: "\nINSIGHTS:\n1. First summary insight\n",
+        2: "\nINSIGHTS:\n1. Second summary insight\n",
+    }
+
+
+def test_split_batch_response_ignores_inline_markers():
+    response_text = "INSIGHTS:\n1. See === Summary 2 === for details\n"
+
+    assert EnhancedInsightsExtractor._split_batch_response(response_text) == {}
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tests for the LinkEnricher preview cache
+Legacy JSON cache import into SQLite and the ISO-date cutoffs used for lookups, stats and cleanup
+"""
+
+import asyncio
+import datetime
+import json
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("structlog")
+pytest.importorskip("pydantic_settings")
+
+from src.processing.link_enricher import LinkEnricher  # noqa: E402
+
+
+def days_ago(days: float) -> str:
+    return (datetime.datetime.now() - datetime.timedelta(days=days)).isoformat()
+
+
+def legacy_entry(date_fetched, title="Title"):
+    return {"title": title, "description": "Description", "image": "", "date_fetched": date_fetched}
+
+
+@pytest.fixture
+def make_enricher(settings_env, tmp_path):
+    """Build enrichers on a legacy cache path in tmp_path, optionally seeding the JSON cache first"""
+    legacy_path = tmp_path / "link_cache.json"
+    enrichers = []
+
+    def make(legacy_cache=None):
+        if legacy_cache is not None:
+            legacy_path.write_text(json.dumps(legacy_cache))
+        enricher = LinkEnricher(api_key="test-key", cache_path=legacy_path)
+        enrichers.append(enricher)
+        return enricher
+
+    yield make
+    for enricher in enrichers:
+        asyncio.run(enricher.aclose())
+
+
+def test_legacy_json_cache_is_imported_once(make_enricher, tmp_path):
+    enricher = make_enricher({
+        "https://example.com/a": legacy_entry(days_ago(1), title="A"),
+        "https://example.com/bad-date": legacy_entry("last tuesday"),
+        "https://example.com/no-date": {"title": "No date"},
+    })
+
+    # Entries without a well-formed date are dropped
+    assert enricher.get_cache_stats()["total_entries"] == 1
+    assert enricher._get_cached("https://example.com/a", days_ago(30))["title"] == "A"
+    assert not (tmp_path / "link_cache.json").exists()
+    assert (tmp_path / "link_cache.json.migrated").exists()
+
+    # A later enricher reads the database; there is nothing left to import
+    assert make_enricher().get_cache_stats()["total_entries"] == 1
+
+
+def test_database_is_opened_on_first_use(make_enricher, tmp_path):
+    enricher = make_enricher()
+
+    assert not (tmp_path / "link_cache.db").exists()
+    enricher.get_cache_stats()
+    assert (tmp_path / "link_cache.db").exists()
+
+
+def test_lookup_treats_entries_older_than_the_cutoff_as_missing(make_enricher):
+    enricher = make_enricher({"https://example.com/a": legacy_entry(days_ago(10))})
+
+    assert enricher._get_cached("https://example.com/a", days_ago(30)) is not None
+    assert enricher._get_cached("https://example.com/a", days_ago(5)) is None
+
+
+def test_cache_stats_bucket_entries_by_age(make_enricher):
+    enricher = make_enricher({
+        f"https://example.com/{age}": legacy_entry(days_ago(age)) for age in (0.5, 1.5, 3, 20, 45)
+    })
+
+    # Age in whole days: <= 1 recent, <= 7 week, <= 30 month, older
+    assert enricher.get_cache_stats()["age_distribution"] == {"recent": 2, "week": 1, "month": 1, "old": 1}
+
+
+def test_clear_old_cache_entries_keeps_entries_within_max_age(make_enricher):
+    enricher = make_enricher({
+        "https://example.com/recent": legacy_entry(days_ago(10)),
+        "https://example.com/boundary": legacy_entry(days_ago(60.5)),
+        "https://example.com/old": legacy_entry(days_ago(70)),
+    })
+
+    enricher.clear_old_cache_entries(max_age_days=60)
+
+    assert enricher.get_cache_stats()["total_entries"] == 2
+    assert enricher._get_cached("https://example.com/old", days_ago(365)) is None
+    assert enricher._get_cached("https://example.com/boundary", days_ago(365)) is not None
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Tests for LLMCache
+TTL expiry, LRU eviction, persistence and the sweep of expired/torn entries
+"""
+
+import asyncio
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("structlog")
+pytest.importorskip("pydantic_settings")
+
+from src.processing import llm_cache  # noqa: E402
+from src.processing.llm_cache import LLMCache  # noqa: E402
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Wall clock the cache reads, starting at the real time; advance with clock.now += seconds"""
+    clock = SimpleNamespace(now=time.time())
+    monkeypatch.setattr(llm_cache, "time", SimpleNamespace(time=lambda: clock.now))
+    return clock
+
+
+def test_entries_persist_across_instances(tmp_path, clock):
+    asyncio.run(LLMCache(tmp_path).set("key", "cached response"))
+
+    assert asyncio.run(LLMCache(tmp_path).get("key")) == "cached response"
+
+
+def test_expired_entry_is_a_miss_and_is_deleted(tmp_path, clock):
+    cache = LLMCache(tmp_path, ttl_seconds=60)
+    asyncio.run(cache.set("key", "cached response"))
+
+    clock.now += 61
+
+    assert asyncio.run(cache.get("key")) is None
+    assert not (tmp_path / "key.json").exists()
+
+
+def test_entry_is_served_until_it_expires(tmp_path, clock):
+    cache = LLMCache(tmp_path, ttl_seconds=60)
+    asyncio.run(cache.set("key", "cached response"))
+
+    clock.now += 59
+
+    assert asyncio.run(cache.get("key")) == "cached response"
+
+
+def test_memory_keeps_the_most_recently_used_entries(tmp_path, clock):
+    cache = LLMCache(tmp_path, max_memory_entries=2)
+
+    async def run():
+        await cache.set("a", "A")
+        await cache.set("b", "B")
+        await cache.get("a")  # "b" is now least recently used
+        await cache.set("c", "C")
+
+    asyncio.run(run())
+
+    assert list(cache._memory) == ["a", "c"]
+    # Evicted from memory only; still served from disk
+    assert asyncio.run(cache.get("b")) == "B"
+
+
+def test_purge_removes_expired_and_unreadable_entries(tmp_path, clock):
+    cache = LLMCache(tmp_path, ttl_seconds=60)
+    asyncio.run(cache.set("old", "stale response"))
+    (tmp_path / "torn.json").write_bytes(b'{"expires_at": 12')
+    written = clock.now - 3600
+    for name in ("old.json", "torn.json"):
+        os.utime(tmp_path / name, (written, written))
+
+    clock.now += 3600
+    asyncio.run(cache.set("fresh", "new response"))  # An hour on, this write sweeps again
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["fresh.json"]
+
+
+def test_purge_skips_recently_written_files(tmp_path, clock):
+    cache = LLMCache(tmp_path, ttl_seconds=60)
+    (tmp_path / "torn.json").write_bytes(b'{"expires_at": 12')
+
+    assert asyncio.run(cache.purge_expired()) == 0
+    assert (tmp_path / "torn.json").exists()
+
+
+def test_make_key_ignores_parameter_order():
+    assert (LLMCache.make_key(model="m", prompt="p", max_tokens=10) ==
+            LLMCache.make_key(max_tokens=10, prompt="p", model="m"))
+    assert LLMCache.make_key(model="m", prompt="p") != LLMCache.make_key(model="m", prompt="q")
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for AsyncTokenBucket
+Bursts, refill waits and debt from consume(), on a fake clock
+"""
+
+import asyncio
+
+import pytest
+
+from src.processing import rate_limiter
+from src.processing.rate_limiter import AsyncTokenBucket
+
+
+class FakeClock:
+    """
+    Stands in for time.monotonic and asyncio.sleep; sleeping advances the clock.
+
+    The rates in these tests refill in exact binary fractions, so waits land on whole tokens.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    monkeypatch.setattr(rate_limiter.asyncio, "sleep", clock.sleep)
+    return clock
+
+
+def acquire_times(bucket, count):
+    async def run():
+        for _ in range(count):
+            await bucket.acquire()
+
+    asyncio.run(run())
+
+
+def test_burst_up_to_max_rate_without_waiting(clock):
+    bucket = AsyncTokenBucket(max_rate=4, time_period=1.0)
+
+    acquire_times(bucket, 4)
+
+    assert clock.sleeps == []
+
+
+def test_acquire_waits_for_the_next_token(clock):
+    bucket = AsyncTokenBucket(max_rate=4, time_period=1.0)
+
+    acquire_times(bucket, 5)
+
+    # One token accrues every 0.25s
+    assert clock.sleeps == [pytest.approx(0.25)]
+
+
+def test_refill_is_capped_at_the_burst_size(clock):
+    bucket = AsyncTokenBucket(max_rate=4, time_period=1.0)
+    acquire_times(bucket, 4)
+
+    clock.now += 3600
+    acquire_times(bucket, 5)
+
+    assert clock.sleeps == [pytest.approx(0.25)]
+
+
+def test_consume_puts_the_bucket_into_debt(clock):
+    bucket = AsyncTokenBucket(max_rate=10, time_period=60.0)
+    acquire_times(bucket, 1)
+
+    # 10 - 1 - 19 = -10 tokens; the next acquire needs 11 more, at one per 6s
+    bucket.consume(19)
+    start = clock.now
+    acquire_times(bucket, 1)
+
+    assert clock.now - start == pytest.approx(66.0)
+
+
+def test_async_with_acquires_a_token(clock):
+    bucket = AsyncTokenBucket(max_rate=1, time_period=10.0)
+
+    async def run():
+        async with bucket:
+            pass
+        async with bucket:
+            pass
+
+    asyncio.run(run())
+
+    assert clock.sleeps == [pytest.approx(10.0)]